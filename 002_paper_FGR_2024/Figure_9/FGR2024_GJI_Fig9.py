@@ -14,6 +14,7 @@
 # - Updated: 2025/08/13 - Adjust for GitHub
 # - Updated: 2025/08/18 - Add piercing point sketch
 # - Updated: 2025/08/25 - Add colorwheel for backazimuth colormap
+# - Updated: 2026/10/17 - Cache cropped elevation grid, choose resolution by DPI
 # -----------------------------------------------------------------------------
 # Versions
 # - PyGMT v0.16.0 - v0.18.0 -> https://www.pygmt.org
@@ -28,11 +29,23 @@
 
 import glob
 import os
+import sys
 
 import numpy as np
 import pandas as pd
 import pygmt as gmt
 
+# Use the elevation grid cache of 004_earthquakes_eruptions
+sys.path.append(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        "..",
+        "004_earthquakes_eruptions",
+    )
+)
+from relief_cache import relief_grid
+
 # %%
 # -----------------------------------------------------------------------------
 # Choose
@@ -187,7 +200,13 @@ fig.basemap(region=region_main, projection=proj_main, frame=0)
 
 # -----------------------------------------------------------------------------
 # Elevation
-fig.grdimage(grid="@earth_relief_01m", region=region_main, cmap=cmap_ele)
+# Cropped only once and cached, the coarsest resolution sufficient for the map
+# width and DPI is used, at most 01m, see relief_cache.py
+fig.grdimage(
+    grid=relief_grid(region_main, "01m", width=proj_main, dpi=dpi_png),
+    region=region_main,
+    cmap=cmap_ele,
+)
 
 fig.coast(resolution="f", borders=f"1/1p,{color_borders}")
 
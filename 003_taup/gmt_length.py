@@ -0,0 +1,68 @@
+# #############################################################################
+# This functions
+# - Convert lengths on the page as used by GMT, e.g. 12, "12c", "5i", or
+#   "72p", to centimeters
+# - Get the width of a map from the projection of GMT, e.g. "M12c",
+#   "L10/47/40/55/10c", "E8.33/48.331/160/10c", "P8c+a", or "X16c/2c"
+#   (Cartesian: width first, other projections: width last)
+# - Is used by 003_taup/taup_movie.py, by
+#   004_earthquakes_eruptions/relief_cache.py and waveform_panel.py, and by
+#   005_global_seismicity/meca_cull.py
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import re
+
+
+# Centimeters per unit of lengths on the page
+GMT_UNITS = {"c": 1, "i": 2.54, "p": 2.54 / 72}
+
+
+def gmt_length(length):
+    # Length on the page in centimeters, e.g. from 12, "12c", "5i", or "72p"
+    # Without unit centimeters are used
+    if not isinstance(length, str):
+        return float(length)
+    match = re.fullmatch(r"\s*-?([\d.]+)([cip]?)\s*", length)
+    if match == None:
+        raise ValueError(f"'{length}' is no length on the page, e.g. '12c'")
+    value, unit = match.groups()
+    return float(value) * GMT_UNITS.get(unit, 1)
+
+
+def gmt_width(projection):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - projection: Projection of GMT with the width in upper case, e.g.
+    #   "M12c", "E8.33/48.331/160/10c", "X16c/2c"; or the width itself, e.g.
+    #   12 or "12c"
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - width: Width of the map | centimeters
+    if not isinstance(projection, str):
+        return float(projection)
+    projection = projection.strip()
+    code = re.match(r"[A-Za-z]*", projection).group()
+    if code == "":
+        return gmt_length(projection)
+    if code.islower():
+        raise ValueError(
+            f"Projection '{projection}' uses a scale, only projections with "
+            + "the width (upper case) are supported"
+        )
+    # Remove modifiers, e.g. "+a" of the polar projection
+    params = projection[len(code) :].split("+")[0].split("/")
+    # Cartesian projections: width/height, other projections: .../width
+    width = params[0] if code == "X" else params[-1]
+    return gmt_length(width)
@@ -0,0 +1,81 @@
+# #############################################################################
+# This functions
+# - Convert arrivals of ObsPy and TauP to a columnar table of NumPy arrays
+# - Read travel paths as whole arrays instead of sample by sample
+# - Work with ObsPy arrivals and TauPCachedArrival instances of taup_cache.py
+# - Is related to the function taup_path_curve.py
+# -----------------------------------------------------------------------------
+# Related to
+# - Fröhlich Y., Grund M. & Ritter J. R. R. (2024).
+#   Lateral and vertical variations of seismic anisotropy in the lithosphere-
+#   asthenosphere system underneath Central Europe from long-term splitting
+#   measurements. Geophysical Journal International, 239(1), 112-135.
+#   https://doi.org/10.1093/gji/ggae245.
+# - Fröhlich Y. (2025). Shear wave splitting analysis of long-term data:
+#   Anisotropy studies in the Upper Rhine Graben area, Central Europe.
+#   Dissertation, Karlsruhe Institute of Technology, Geophysical Institute.
+#   https://doi.org/10.5445/IR/1000183786.
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import numpy as np
+
+
+def taup_arrival_table(arrivals, r_earth=6371):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - arrivals: Arrivals with travel paths, e.g. from
+    #   TauPyModel.get_ray_paths or taup_cache.taup_ray_paths
+    # Optional
+    # - r_earth: Earth's radius | km | Default 6371
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - table: Dictionary of NumPy arrays
+    #   One entry per arrival
+    #   - "name": Name of the seismological phase
+    #   - "time": Travel time | seconds
+    #   - "ray_param": Ray parameter | seconds/radians
+    #   - "offset": Start index of the travel path in the sample arrays,
+    #     with one more entry for the end of the last travel path
+    #   One entry per sample of all travel paths, concatenated
+    #   - "dist": Epicentral distance | degrees
+    #   - "depth": Depth | km
+    #   - "radius": Distance to the Earth's center | km
+    # The travel path of arrival i_arr is
+    #   table["dist"][table["offset"][i_arr]:table["offset"][i_arr + 1]]
+
+    paths = [np.asarray(arrival.path) for arrival in arrivals]
+    n_samples = np.array([len(path) for path in paths], dtype=np.int64)
+
+    offset = np.zeros(len(paths) + 1, dtype=np.int64)
+    np.cumsum(n_samples, out=offset[1:])
+
+    if len(paths) > 0:
+        dist = np.rad2deg(np.concatenate([path["dist"] for path in paths]))
+        depth = np.concatenate([path["depth"] for path in paths])
+    else:
+        dist = np.array([], dtype=float)
+        depth = np.array([], dtype=float)
+
+    return {
+        "name": np.array([arrival.name for arrival in arrivals], dtype=str),
+        "time": np.array([arrival.time for arrival in arrivals], dtype=float),
+        "ray_param": np.array(
+            [arrival.ray_param for arrival in arrivals], dtype=float
+        ),
+        "offset": offset,
+        "dist": dist,
+        "depth": depth,
+        "radius": r_earth - depth,
+    }
@@ -0,0 +1,160 @@
+# #############################################################################
+# This functions
+# - Calculate travel paths via ObsPy and TauP for grids of hypocentral depths,
+#   epicentral distances, and lists of seismological phases
+# - Spread the calculations over a process pool with one TauPyModel per worker
+# - Reuse and fill the on-disk cache of taup_cache.py
+# - Outputs a dictionary which can be passed to the function taup_path
+#   via the argument arrivals
+# - Is related to the function taup_path_curve.py
+# -----------------------------------------------------------------------------
+# Related to
+# - Fröhlich Y., Grund M. & Ritter J. R. R. (2024).
+#   Lateral and vertical variations of seismic anisotropy in the lithosphere-
+#   asthenosphere system underneath Central Europe from long-term splitting
+#   measurements. Geophysical Journal International, 239(1), 112-135.
+#   https://doi.org/10.1093/gji/ggae245.
+# - Fröhlich Y. (2025). Shear wave splitting analysis of long-term data:
+#   Anisotropy studies in the Upper Rhine Graben area, Central Europe.
+#   Dissertation, Karlsruhe Institute of Technology, Geophysical Institute.
+#   https://doi.org/10.5445/IR/1000183786.
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from taup_cache import (
+    TAUP_CACHE_SIZE,
+    taup_cache_evict,
+    taup_cache_key,
+    taup_cache_load,
+    taup_cache_save,
+    taup_model,
+    taup_ray_paths,
+)
+
+
+# TauPyModel instance of the current worker process
+_worker_model = None
+
+
+def _worker_init(earth_model):
+    # Load the Earth model only once per worker process
+    global _worker_model
+    _worker_model = taup_model(earth_model)
+
+
+def _worker_ray_paths(source_depth, receiver_dist, phases):
+    return taup_ray_paths(
+        source_depth=source_depth,
+        receiver_dist=receiver_dist,
+        phases=phases,
+        model=_worker_model,
+        cache=False,
+    )
+
+
+def taup_batch(
+    source_depths,
+    receiver_dists,
+    phase_lists,
+    earth_model="iasp91",
+    n_workers=None,
+    cache=True,
+    cache_dir=None,
+    cache_size=TAUP_CACHE_SIZE,
+):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - source_depths: Hypocentral depths | km | list of floats
+    # - receiver_dists: Epicentral distances | degrees | list of floats
+    # - phase_lists: Seismological phases | list of lists of strings
+    #   A single list of strings is used for all combinations
+    # Optional
+    # - earth_model: Earth model | Default "iasp91"
+    # - n_workers: Number of worker processes | Default number of CPUs
+    #   Use 1 to calculate in the current process
+    # - cache: Use the on-disk cache of taup_cache.py | Default True
+    # - cache_dir: Folder of the cache | Default TAUP_CACHE_DIR
+    # - cache_size: Maximum size of the cache | MB | Default TAUP_CACHE_SIZE
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - paths: Dictionary with tuples (source_depth, receiver_dist, phases) as
+    #   keys and lists of TauPCachedArrival instances as values; phases is a
+    #   tuple of strings
+
+    if len(phase_lists) > 0 and isinstance(phase_lists[0], str):
+        phase_lists = [phase_lists]
+
+    combis = [
+        (float(source_depth), float(receiver_dist), tuple(phases))
+        for source_depth, receiver_dist, phases in itertools.product(
+            source_depths, receiver_dists, phase_lists
+        )
+    ]
+    # Remove duplicates but keep the order
+    combis = list(dict.fromkeys(combis))
+
+    # -------------------------------------------------------------------------
+    # Read already calculated travel paths from the cache
+    paths = {}
+    combis_todo = []
+    for combi in combis:
+        arrivals = None
+        if cache == True:
+            key = taup_cache_key(*combi, earth_model=earth_model)
+            arrivals = taup_cache_load(key, cache_dir=cache_dir)
+        if arrivals != None:
+            paths[combi] = arrivals
+        else:
+            combis_todo.append(combi)
+
+    # -------------------------------------------------------------------------
+    # Calculate missing travel paths
+    if n_workers == None:
+        n_workers = os.cpu_count()
+    n_workers = max(1, min(n_workers, len(combis_todo)))
+
+    if len(combis_todo) == 0:
+        arrivals_todo = []
+    elif n_workers == 1:
+        _worker_init(earth_model)
+        arrivals_todo = [_worker_ray_paths(*combi) for combi in combis_todo]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_worker_init,
+            initargs=(earth_model,),
+        ) as executor:
+            arrivals_todo = list(
+                executor.map(
+                    _worker_ray_paths,
+                    *zip(*combis_todo),
+                    chunksize=max(1, len(combis_todo) // (4 * n_workers)),
+                )
+            )
+
+    for combi, arrivals in zip(combis_todo, arrivals_todo):
+        paths[combi] = arrivals
+        if cache == True:
+            key = taup_cache_key(*combi, earth_model=earth_model)
+            taup_cache_save(key, arrivals, cache_dir=cache_dir, max_size=None)
+
+    if cache == True and len(combis_todo) > 0 and cache_size != None:
+        taup_cache_evict(cache_dir=cache_dir, max_size=cache_size)
+
+    # Keep the order of the requested combinations
+    return {combi: paths[combi] for combi in combis}
@@ -0,0 +1,313 @@
+# #############################################################################
+# Benchmark of the TauP plotting pipeline of taup_path_curve.py
+# - Scenarios from the examples of taup_path_curve.py
+#   - travel paths 0-360° for eight phases with travel times
+#   - travel paths zoomed to 100-180° and 660-4000 km
+#   - distance sweep 0-80° for P and PcP with cumulative travel time curve
+# - Stages per scenario
+#   - model: loading the Earth model (TauPyModel)
+#   - ray_paths: calculating the travel paths (get_ray_paths)
+#   - postprocess: converting the arrivals to picklable NumPy arrays
+#   - table: building the columnar table of all travel paths
+#   - plot: plotting via PyGMT, incl. the number of GMT module calls
+# - Reports wall time and peak resident set size (RSS) per stage
+# - Writes a JSON file to compare runs of different commits
+# - Runs offline with the Earth model iasp91 shipped with ObsPy
+# -----------------------------------------------------------------------------
+# Usage
+#   python taup_benchmark.py [--output taup_benchmark.json] [--repeat 3]
+#                            [--no-plot] [--compare old.json]
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Versions
+# - PyGMT v0.16.0 - v0.18.0 -> https://www.pygmt.org
+# - GMT 6.5.0 - 6.6.0 -> https://www.generic-mapping-tools.org
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import argparse
+import datetime
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from taup_arrivals import taup_arrival_table
+from taup_cache import taup_cache_arrivals
+
+
+# %%
+# -----------------------------------------------------------------------------
+# Scenarios
+# -----------------------------------------------------------------------------
+phases_eight = ["S", "ScS", "PKS", "PKKS", "SKS", "SKKS", "SKIKS", "SKJKS"]
+
+scenarios = {
+    "path_0to360deg_eight_phases": {
+        "source_depth": 500,
+        "receiver_dists": [142],
+        "phases": phases_eight,
+        "kwargs": {
+            "fig_path_width": "8c",
+            "font_size": "6.5p",
+            "earth_color": "gray",
+            "max_dist": 360,
+            "time_curve": True,
+        },
+    },
+    "path_100to180deg_zoom": {
+        "source_depth": 500,
+        "receiver_dists": [142],
+        "phases": phases_eight,
+        "kwargs": {
+            "fig_path_width": "8c",
+            "font_size": "6.5p",
+            "earth_color": "gray",
+            "min_dist": 100,
+            "max_dist": 180,
+            "min_depth": 660,
+            "max_depth": 4000,
+        },
+    },
+    "sweep_0to80deg_P_PcP": {
+        "source_depth": 500,
+        "receiver_dists": [0, 20, 40, 60, 80],
+        "phases": ["P", "PcP"],
+        "kwargs": {
+            "fig_path_width": "8c",
+            "font_size": "6.5p",
+            "earth_color": "gray",
+            "thick_line_path": "0.5p",
+            "min_dist": 0,
+            "max_dist": 360,
+            "time_curve": True,
+            "curve_dist_range": [-20, 100],
+            "curve_time_range": [0, 2700],
+            "legend_path": False,
+        },
+    },
+}
+
+
+# %%
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+def rss_peak_mb():
+    # Peak resident set size of this process so far | MB
+    rss_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":  # bytes instead of kilobytes
+        rss_peak = rss_peak / 1024
+    return rss_peak / 1024
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_stage(stages, name, func):
+    # Run func, store wall time and peak RSS in stages, return result of func
+    time_start = time.perf_counter()
+    result = func()
+    stages[name] = {
+        "time_s": time.perf_counter() - time_start,
+        "rss_peak_mb": rss_peak_mb(),
+    }
+    return result
+
+
+def count_gmt_calls():
+    # Count the calls of GMT modules by wrapping Session.call_module
+    from pygmt.clib import Session
+
+    counter = {"n": 0}
+    call_module = Session.call_module
+
+    def call_module_counted(self, *args, **kwargs):
+        counter["n"] += 1
+        return call_module(self, *args, **kwargs)
+
+    Session.call_module = call_module_counted
+
+    def restore():
+        Session.call_module = call_module
+
+    return counter, restore
+
+
+# %%
+# -----------------------------------------------------------------------------
+# Benchmark
+# -----------------------------------------------------------------------------
+def benchmark_scenario(scenario, earth_model="iasp91", plot=True):
+    from obspy.taup import TauPyModel
+
+    stages = {}
+
+    model = run_stage(stages, "model", lambda: TauPyModel(model=earth_model))
+
+    arrivals_dist = run_stage(
+        stages,
+        "ray_paths",
+        lambda: [
+            model.get_ray_paths(
+                source_depth_in_km=scenario["source_depth"],
+                distance_in_degree=receiver_dist,
+                phase_list=scenario["phases"],
+            )
+            for receiver_dist in scenario["receiver_dists"]
+        ],
+    )
+
+    arrivals_dist = run_stage(
+        stages,
+        "postprocess",
+        lambda: [taup_cache_arrivals(arrivals) for arrivals in arrivals_dist],
+    )
+    tables = run_stage(
+        stages,
+        "table",
+        lambda: [taup_arrival_table(arrivals) for arrivals in arrivals_dist],
+    )
+    stages["table"]["n_samples"] = int(sum(table["offset"][-1] for table in tables))
+
+    if plot == True:
+        from taup_path_curve import taup_path
+
+        counter, restore = count_gmt_calls()
+
+        def plot_scenario():
+            fig_path = None
+            fig_curve = None
+            for i_dist, receiver_dist in enumerate(scenario["receiver_dists"]):
+                kwargs = dict(scenario["kwargs"])
+                if i_dist > 0:
+                    kwargs["fig_path_instance"] = fig_path
+                    kwargs["fig_curve_instance"] = fig_curve
+                    kwargs["path_overlay"] = True
+                figs = taup_path(
+                    source_depth=scenario["source_depth"],
+                    receiver_dist=receiver_dist,
+                    phases=scenario["phases"],
+                    earth_model=earth_model,
+                    arrivals=arrivals_dist[i_dist],
+                    fig_show=False,
+                    **kwargs,
+                )
+                if kwargs.get("time_curve") == True:
+                    fig_path, fig_curve = figs
+                else:
+                    fig_path = figs
+
+        try:
+            run_stage(stages, "plot", plot_scenario)
+        finally:
+            restore()
+        stages["plot"]["n_gmt_calls"] = counter["n"]
+
+    return stages
+
+
+def benchmark(earth_model="iasp91", repeat=3, plot=True):
+    import obspy
+
+    results = {
+        "commit": git_commit(),
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "obspy": obspy.__version__,
+        "earth_model": earth_model,
+        "repeat": repeat,
+        "scenarios": {},
+    }
+    if plot == True:
+        import pygmt
+
+        results["pygmt"] = pygmt.__version__
+
+    for name, scenario in scenarios.items():
+        runs = [
+            benchmark_scenario(scenario, earth_model=earth_model, plot=plot)
+            for _ in range(repeat)
+        ]
+        # Use the fastest run per stage, the peak RSS only increases
+        stages = {}
+        for stage in runs[0]:
+            stages[stage] = dict(runs[-1][stage])
+            stages[stage]["time_s"] = min(run[stage]["time_s"] for run in runs)
+        results["scenarios"][name] = stages
+
+        print(name)
+        for stage, values in stages.items():
+            print(
+                f"  {stage:<12} {values['time_s']:8.3f} s"
+                f"  {values['rss_peak_mb']:8.1f} MB peak RSS"
+            )
+
+    return results
+
+
+def compare(results, results_old):
+    # Print the ratio of the wall times to a previous run
+    print(f"Compared to commit {results_old.get('commit')}")
+    for name, stages in results["scenarios"].items():
+        stages_old = results_old["scenarios"].get(name, {})
+        for stage, values in stages.items():
+            if stage not in stages_old:
+                continue
+            time_old = stages_old[stage]["time_s"]
+            if time_old == 0:
+                print(f"  {name} {stage:<12} {'n/a':>6}")
+                continue
+            ratio = values["time_s"] / time_old
+            print(f"  {name} {stage:<12} {ratio:6.2f} x")
+
+
+# %%
+# -----------------------------------------------------------------------------
+# Run
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Benchmark of taup_path")
+    parser.add_argument("--output", default="taup_benchmark.json")
+    parser.add_argument("--earth-model", default="iasp91")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-plot", action="store_true")
+    parser.add_argument("--compare", default=None)
+    args = parser.parse_args()
+
+    results = benchmark(
+        earth_model=args.earth_model,
+        repeat=args.repeat,
+        plot=not args.no_plot,
+    )
+
+    with open(args.output, mode="w") as file_json:
+        json.dump(results, file_json, indent=2)
+    print(args.output)
+
+    if args.compare != None:
+        with open(args.compare) as file_json:
+            compare(results, json.load(file_json))
@@ -0,0 +1,270 @@
+# #############################################################################
+# This functions
+# - Cache travel paths calculated via ObsPy and TauP on disk
+# - Use one file per combination of Earth model, hypocentral depth,
+#   epicentral distance, and (sorted) list of seismological phases
+# - Store compact NumPy arrays per arrival (name, travel time, ray parameter,
+#   travel path)
+# - Limit the size of the cache by removing the least recently used files
+# - Keep one loaded TauPyModel per Earth model in memory
+# - Is related to the function taup_path_curve.py
+# -----------------------------------------------------------------------------
+# Related to
+# - Fröhlich Y., Grund M. & Ritter J. R. R. (2024).
+#   Lateral and vertical variations of seismic anisotropy in the lithosphere-
+#   asthenosphere system underneath Central Europe from long-term splitting
+#   measurements. Geophysical Journal International, 239(1), 112-135.
+#   https://doi.org/10.1093/gji/ggae245.
+# - Fröhlich Y. (2025). Shear wave splitting analysis of long-term data:
+#   Anisotropy studies in the Upper Rhine Graben area, Central Europe.
+#   Dissertation, Karlsruhe Institute of Technology, Geophysical Institute.
+#   https://doi.org/10.5445/IR/1000183786.
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import hashlib
+import os
+
+import numpy as np
+
+
+# Increase if the content of the cache files changes, old files are ignored
+TAUP_CACHE_VERSION = 1
+# Default folder of the cache, can be changed via the environment variable
+TAUP_CACHE_DIR = os.environ.get(
+    "TAUP_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "gmt-pygmt-plotting", "taup"),
+)
+# Default maximum size of the cache | MB
+TAUP_CACHE_SIZE = 500
+
+# Loaded TauPyModel instances with the Earth model as key
+_taup_models = {}
+
+
+class TauPCachedArrival:
+    # Lightweight replacement of obspy.taup.helper_classes.Arrival
+    # - name: Name of the seismological phase
+    # - time: Travel time | seconds
+    # - ray_param: Ray parameter | seconds/radians
+    # - path: Travel path as NumPy structured array with the fields
+    #   "p", "time", "dist" (radians), "depth" (km), "lat", "lon"
+
+    def __init__(self, name, time, ray_param, path):
+        self.name = name
+        self.time = time
+        self.ray_param = ray_param
+        self.path = path
+
+    def __str__(self):
+        # Same format as used by ObsPy
+        return f"{self.name} phase arrival at {self.time:.3f} seconds"
+
+
+def taup_model(earth_model="iasp91"):
+    # Returns the TauPyModel instance of the Earth model
+    # - ObsPy is imported and the Earth model is loaded only at the first call
+    if earth_model not in _taup_models:
+        from obspy.taup import TauPyModel
+
+        _taup_models[earth_model] = TauPyModel(model=earth_model)
+    return _taup_models[earth_model]
+
+
+def taup_cache_arrivals(arrivals):
+    # Convert ObsPy arrivals to TauPCachedArrival instances
+    # - Can be pickled and send between processes without the Earth model
+    return [
+        TauPCachedArrival(
+            name=str(arrival.name),
+            time=float(arrival.time),
+            ray_param=float(arrival.ray_param),
+            path=np.asarray(arrival.path).copy(),
+        )
+        for arrival in arrivals
+    ]
+
+
+def taup_cache_key(source_depth, receiver_dist, phases, earth_model="iasp91"):
+    # Content-addressed key
+    # - Hypocentral depth and epicentral distance are rounded to avoid
+    #   floating point noise, e.g. from np.arange
+    # - Order and duplicates of the phases do not matter
+    # - For a custom Earth model file, its modification time is included
+    model_str = str(earth_model)
+    if os.path.isfile(model_str):
+        model_str = f"{os.path.abspath(model_str)}@{os.path.getmtime(model_str)}"
+
+    key_str = "|".join(
+        [
+            f"v{TAUP_CACHE_VERSION}",
+            model_str,
+            f"{float(source_depth):.6f}",
+            f"{float(receiver_dist):.6f}",
+            ",".join(sorted(set(phases))),
+        ]
+    )
+    key_hash = hashlib.sha1(key_str.encode("utf-8")).hexdigest()
+
+    # Start with the Earth model name to allow invalidating per Earth model
+    model_name = os.path.splitext(os.path.basename(str(earth_model)))[0]
+    return f"{model_name}_{key_hash}"
+
+
+def taup_cache_load(key, cache_dir=None):
+    # Returns a list of TauPCachedArrival instances or None if not cached
+    if cache_dir == None:
+        cache_dir = TAUP_CACHE_DIR
+    file_cache = os.path.join(cache_dir, f"{key}.npz")
+
+    try:
+        with np.load(file_cache, allow_pickle=False) as data:
+            arrivals = [
+                TauPCachedArrival(
+                    name=str(data["names"][i_arr]),
+                    time=float(data["times"][i_arr]),
+                    ray_param=float(data["ray_params"][i_arr]),
+                    path=data[f"path_{i_arr}"],
+                )
+                for i_arr in range(len(data["names"]))
+            ]
+    except (OSError, KeyError, ValueError):
+        # Not cached (yet) or damaged file
+        return None
+
+    # Mark as recently used
+    os.utime(file_cache)
+
+    return arrivals
+
+
+def taup_cache_save(key, arrivals, cache_dir=None, max_size=TAUP_CACHE_SIZE):
+    # Store arrivals and evict least recently used files if the cache is full
+    # - max_size: Maximum size of the cache | MB | None for no limit
+    if cache_dir == None:
+        cache_dir = TAUP_CACHE_DIR
+    os.makedirs(cache_dir, exist_ok=True)
+
+    arrays = {
+        "names": np.array([arrival.name for arrival in arrivals], dtype=str),
+        "times": np.array([arrival.time for arrival in arrivals], dtype=float),
+        "ray_params": np.array(
+            [arrival.ray_param for arrival in arrivals], dtype=float
+        ),
+    }
+    for i_arr, arrival in enumerate(arrivals):
+        arrays[f"path_{i_arr}"] = np.asarray(arrival.path)
+
+    # Write to a temporary file first to not leave damaged files behind
+    # (np.savez appends ".npz" to file names without this extension)
+    file_cache = os.path.join(cache_dir, f"{key}.npz")
+    file_temp = os.path.join(cache_dir, f"{key}_{os.getpid()}.tmp.npz")
+    np.savez(file_temp, **arrays)
+    os.replace(file_temp, file_cache)
+
+    if max_size != None:
+        taup_cache_evict(cache_dir=cache_dir, max_size=max_size)
+
+
+def taup_cache_evict(cache_dir=None, max_size=TAUP_CACHE_SIZE):
+    # Remove least recently used files until the cache is not larger than
+    # max_size (MB)
+    if cache_dir == None:
+        cache_dir = TAUP_CACHE_DIR
+    if not os.path.isdir(cache_dir):
+        return
+
+    files_cache = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(".npz") and ".tmp" not in entry.name:
+            stat = entry.stat()
+            files_cache.append((stat.st_mtime, stat.st_size, entry.path))
+
+    size_total = sum(file_cache[1] for file_cache in files_cache)
+    for _, size, path in sorted(files_cache):
+        if size_total <= max_size * 1024**2:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:  # Removed by another process
+            pass
+        size_total -= size
+
+
+def taup_cache_clear(cache_dir=None, earth_model=None):
+    # Invalidate the cache
+    # - earth_model: Remove only the files of this Earth model |
+    #   Default remove all files
+    if cache_dir == None:
+        cache_dir = TAUP_CACHE_DIR
+    if not os.path.isdir(cache_dir):
+        return
+
+    prefix = ""
+    if earth_model != None:
+        prefix = os.path.splitext(os.path.basename(str(earth_model)))[0] + "_"
+
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(".npz") and entry.name.startswith(prefix):
+            os.remove(entry.path)
+
+
+def taup_ray_paths(
+    source_depth,
+    receiver_dist,
+    phases,
+    earth_model="iasp91",
+    model=None,
+    cache=True,
+    cache_dir=None,
+    cache_size=TAUP_CACHE_SIZE,
+):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - source_depth: Hypocentral depth | km
+    # - receiver_dist: Epicentral distance | degrees
+    # - phases: Seismological phases | list of strings
+    # Optional
+    # - earth_model: Earth model | Default "iasp91"
+    # - model: Already loaded TauPyModel instance of earth_model |
+    #   Default see taup_model, only used if the travel paths are not cached
+    # - cache: Use the on-disk cache | Default True
+    # - cache_dir: Folder of the cache | Default TAUP_CACHE_DIR
+    # - cache_size: Maximum size of the cache | MB | Default TAUP_CACHE_SIZE
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - arrivals: List of TauPCachedArrival instances
+
+    if cache == True:
+        key = taup_cache_key(source_depth, receiver_dist, phases, earth_model)
+        arrivals = taup_cache_load(key, cache_dir=cache_dir)
+        if arrivals != None:
+            return arrivals
+
+    # https://docs.obspy.org/packages/autogen/obspy.taup.tau.TauPyModel.html
+    if model == None:
+        model = taup_model(earth_model)
+
+    arrivals = taup_cache_arrivals(
+        model.get_ray_paths(
+            source_depth_in_km=source_depth,
+            distance_in_degree=receiver_dist,
+            phase_list=phases,
+        )
+    )
+
+    if cache == True:
+        taup_cache_save(key, arrivals, cache_dir=cache_dir, max_size=cache_size)
+
+    return arrivals
@@ -0,0 +1,164 @@
+# #############################################################################
+# This functions
+# - Sample the great circles between many pairs of points (e.g. epicenters and
+#   a recording station) at once via NumPy
+# - Write all great circles as one multi-segment file, the segment headers
+#   carry the color (-W) or the value for a colormap (-Z)
+# - Plot all great circles with one GMT call per transparency level
+#   (transparency optional depending on the density of the great circles)
+# - Is used by 007_dissertation_F_2025/01_epi_bfo/map_epi_bfo_xks.py
+# -----------------------------------------------------------------------------
+# Related to
+# - Fröhlich Y., Grund M. & Ritter J. R. R. (2024).
+#   Lateral and vertical variations of seismic anisotropy in the lithosphere-
+#   asthenosphere system underneath Central Europe from long-term splitting
+#   measurements. Geophysical Journal International, 239(1), 112-135.
+#   https://doi.org/10.1093/gji/ggae245.
+# - Fröhlich Y. (2025). Shear wave splitting analysis of long-term data:
+#   Anisotropy studies in the Upper Rhine Graben area, Central Europe.
+#   Dissertation, Karlsruhe Institute of Technology, Geophysical Institute.
+#   https://doi.org/10.5445/IR/1000183786.
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import numpy as np
+
+from taup_pierce import taup_pierce_coords, taup_pierce_dist_az
+
+
+def taup_great_circle(lon_1, lat_1, lon_2, lat_2, step=1):
+    # Great circles from the points 1 to the points 2
+    # - lon_1, lat_1, lon_2, lat_2: Coordinates | degrees | arrays of the same
+    #   length or single values (e.g. one recording station)
+    # - step: Maximum distance between two samples | degrees | Default 1
+    # Returns lon, lat | degrees | shape (pair, sample), the same number of
+    # samples for all great circles
+    lon_1, lat_1, lon_2, lat_2 = np.broadcast_arrays(
+        *[
+            np.atleast_1d(np.asarray(coord, dtype=float))
+            for coord in [lon_1, lat_1, lon_2, lat_2]
+        ]
+    )
+    dist, az, _ = taup_pierce_dist_az(lat_1, lon_1, lat_2, lon_2)
+
+    n_samples = max(2, int(np.ceil(np.max(dist, initial=0) / step)) + 1)
+    fraction = np.linspace(0, 1, n_samples)
+    lat, lon = taup_pierce_coords(
+        lat_1[:, None], lon_1[:, None], az[:, None], dist[:, None] * fraction
+    )
+    return lon, lat
+
+
+def taup_great_circle_write(file_out, lon, lat, colors=None, zvalues=None):
+    # Write great circles as multi-segment file
+    # - lon, lat: Great circles, see taup_great_circle
+    # - colors: Pens of the segments, "-W" in the segment headers |
+    #   list of strings, e.g. "0.15p,red"
+    # - zvalues: Values of the segments for a colormap, "-Z" in the segment
+    #   headers
+    headers = np.full(len(lon), ">", dtype=object)
+    if colors is not None:
+        headers = headers + " -W" + np.asarray(colors, dtype=object)
+    if zvalues is not None:
+        headers = headers + " -Z" + np.asarray(zvalues, dtype=str).astype(object)
+
+    with open(file_out, mode="w") as file_segments:
+        for header, lon_seg, lat_seg in zip(headers, lon, lat):
+            file_segments.write(f"{header}\n")
+            np.savetxt(file_segments, np.column_stack([lon_seg, lat_seg]), fmt="%.4f")
+
+
+def taup_great_circle_transparency(
+    baz, bin_width=5, min_transparency=50, max_transparency=90
+):
+    # Transparency per great circle depending on the density
+    # - baz: Backazimuths of the great circles | degrees N
+    # - bin_width: Width of the backazimuth bins to count the great circles
+    #   with (nearly) the same path | degrees | Default 5
+    # - min_transparency, max_transparency: Transparency of single and of many
+    #   great circles per bin | percent | Default 50 and 90
+    # Returns transparency | percent | multiples of 10 to limit the number of
+    # GMT calls
+    i_bin = np.floor(np.asarray(baz, dtype=float) % 360 / bin_width).astype(int)
+    count = np.bincount(i_bin)[i_bin]
+    transparency = min_transparency + (max_transparency - min_transparency) * (
+        1 - 1 / np.sqrt(count)
+    )
+    return (np.round(transparency / 10) * 10).astype(int)
+
+
+def taup_great_circle_plot(
+    fig,
+    lon_1,
+    lat_1,
+    lon_2,
+    lat_2,
+    pen="0.15p,black",
+    step=1,
+    colors=None,
+    zvalues=None,
+    cmap=None,
+    transparency=None,
+    density=False,
+):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - fig: PyGMT figure instance
+    # - lon_1, lat_1, lon_2, lat_2: Start and end points of the great circles,
+    #   e.g. epicenters and recording station | degrees
+    # Optional
+    # - pen: Pen of the great circles | Default "0.15p,black"
+    # - step: Maximum distance between two samples | degrees | Default 1
+    # - colors: Color per great circle, e.g. by quality | list of strings
+    # - zvalues: Value per great circle for cmap, e.g. backazimuth
+    # - cmap: Colormap for zvalues | Default current colormap
+    # - transparency: Transparency of all great circles | percent
+    # - density: Set the transparency depending on the number of great circles
+    #   with (nearly) the same backazimuth, see taup_great_circle_transparency |
+    #   Default False
+    from pygmt.helpers import GMTTempFile
+
+    lon, lat = taup_great_circle(lon_1, lat_1, lon_2, lat_2, step=step)
+
+    pen_width = pen.split(",")[0]
+    args_plot = {"pen": pen}
+    if colors is not None:
+        colors = [f"{pen_width},{color}" for color in colors]
+    if zvalues is not None:
+        args_plot = {"pen": f"{pen_width}+cl", "cmap": True if cmap == None else cmap}
+
+    if density == True:
+        # Backazimuth at the end points, e.g. the recording station
+        _, _, baz = taup_pierce_dist_az(lat_1, lon_1, lat_2, lon_2)
+        transparencies = np.broadcast_to(
+            taup_great_circle_transparency(np.atleast_1d(baz)), (len(lon),)
+        )
+    else:
+        transparencies = np.full(len(lon), -1)
+
+    # One multi-segment file and GMT call per transparency level
+    for level in np.unique(transparencies):
+        select = transparencies == level
+        with GMTTempFile(suffix=".txt") as tmp_file:
+            taup_great_circle_write(
+                tmp_file.name,
+                lon[select],
+                lat[select],
+                colors=None if colors is None else np.asarray(colors)[select],
+                zvalues=None if zvalues is None else np.asarray(zvalues)[select],
+            )
+            fig.plot(
+                data=tmp_file.name,
+                transparency=transparency if level == -1 else level,
+                **args_plot,
+            )
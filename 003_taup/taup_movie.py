@@ -0,0 +1,317 @@
+# #############################################################################
+# Animation of travel paths with increasing epicentral distance
+# - Calculate the travel paths of all frames via taup_batch in a process pool
+# - Plot the Earth concentric shells (background) only once
+# - Plot the travel paths of the frames in a process pool as transparent
+#   layers and put them on top of the background
+# - Write numbered PNG files and assemble them to a GIF and / or APNG via
+#   Pillow (no ffmpeg required)
+# -----------------------------------------------------------------------------
+# Related to
+# - Fröhlich Y., Grund M. & Ritter J. R. R. (2024).
+#   Lateral and vertical variations of seismic anisotropy in the lithosphere-
+#   asthenosphere system underneath Central Europe from long-term splitting
+#   measurements. Geophysical Journal International, 239(1), 112-135.
+#   https://doi.org/10.1093/gji/ggae245.
+# - Fröhlich Y. (2025). Shear wave splitting analysis of long-term data:
+#   Anisotropy studies in the Upper Rhine Graben area, Central Europe.
+#   Dissertation, Karlsruhe Institute of Technology, Geophysical Institute.
+#   https://doi.org/10.5445/IR/1000183786.
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Versions
+# - PyGMT v0.16.0 - v0.18.0 -> https://www.pygmt.org
+# - GMT 6.5.0 - 6.6.0 -> https://www.generic-mapping-tools.org
+# - Pillow >= 9.1 -> https://python-pillow.org
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from gmt_length import gmt_length
+from taup_batch import taup_batch
+from taup_path_curve import taup_center, taup_earth, taup_path
+
+
+def _movie_canvas(fig, fig_path_width, margin=2):
+    # Plot a white frame with a fixed size around the polar plot
+    # - The background and all frames are cropped to this frame when saving,
+    #   i.e., they have the same size and can be put on top of each other
+    # - margin: Space around the polar plot | centimeters
+    width = gmt_length(fig_path_width) + 2 * margin
+    fig.shift_origin(xshift=f"{-margin}c", yshift=f"{-margin}c")
+    fig.plot(
+        x=[0, width, width, 0, 0],
+        y=[0, 0, width, width, 0],
+        region=[0, width, 0, width],
+        projection=f"X{width}c",
+        pen="0.1p,white",
+        no_clip=True,
+    )
+    fig.shift_origin(xshift=f"{margin}c", yshift=f"{margin}c")
+
+
+def _movie_basemap(fig, settings):
+    import pygmt
+
+    _, center_point = taup_center(settings["min_dist"], settings["max_dist"])
+    pygmt.config(FONT=settings["font_size"])
+    fig.basemap(
+        region=[
+            settings["min_dist"],
+            settings["max_dist"],
+            settings["r_earth"] - settings["max_depth"],
+            settings["r_earth"] - settings["min_depth"],
+        ],
+        projection=f"P{settings['fig_path_width']}+a+t{center_point}+z",
+        frame="+n",
+    )
+
+
+def _movie_frame(i_frame, receiver_dist, arrivals, settings, file_background):
+    # Plot the travel paths of one frame and put them on top of the background
+    import pygmt
+    from PIL import Image
+
+    fig = pygmt.Figure()
+    _movie_basemap(fig, settings)
+    taup_path(
+        source_depth=settings["source_depth"],
+        receiver_dist=receiver_dist,
+        phases=settings["phases"],
+        earth_model=settings["earth_model"],
+        r_earth=settings["r_earth"],
+        min_depth=settings["min_depth"],
+        max_depth=settings["max_depth"],
+        min_dist=settings["min_dist"],
+        max_dist=settings["max_dist"],
+        font_size=settings["font_size"],
+        fig_path_width=settings["fig_path_width"],
+        fig_path_instance=fig,
+        path_overlay=True,
+        thick_line_path=settings["thick_line_path"],
+        legend_path=False,
+        arrivals=arrivals,
+        fig_show=False,
+    )
+    _movie_canvas(fig, settings["fig_path_width"])
+
+    path_frames = settings["path_frames"]
+    file_layer = os.path.join(path_frames, f"layer_{i_frame:04d}.png")
+    file_frame = os.path.join(path_frames, f"frame_{i_frame:04d}.png")
+    fig.savefig(fname=file_layer, dpi=settings["dpi"], transparent=True)
+
+    with Image.open(file_background) as image_background:
+        image_background = image_background.convert("RGBA")
+    with Image.open(file_layer) as image_layer:
+        image_layer = image_layer.convert("RGBA")
+    # Rounding may lead to one pixel difference
+    if image_layer.size != image_background.size:
+        image_layer = image_layer.resize(image_background.size)
+    Image.alpha_composite(image_background, image_layer).convert("RGB").save(
+        file_frame
+    )
+    os.remove(file_layer)
+
+    return file_frame
+
+
+def taup_movie(
+    source_depth,
+    receiver_dists,
+    phases,
+    earth_model="iasp91",
+    r_earth=6371,
+    min_depth=0,
+    max_depth=None,
+    min_dist=0,
+    max_dist=360,
+    step_dist=30,
+    font_size="6.5p",
+    earth_color="gray",
+    fig_path_width="8c",
+    thick_line_path="0.8p",
+    path_frames="02_your_example_frames",
+    dpi=150,
+    fps=5,
+    gif=True,
+    apng=False,
+    n_workers=None,
+):
+    # %%
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - source_depth: Hypocentral depth | km
+    # - receiver_dists: Epicentral distances, one per frame | degrees
+    # - phases: Seismological phases | list of strings
+    # Optional
+    # - earth_model, r_earth, min_depth, max_depth, min_dist, max_dist,
+    #   step_dist, font_size, earth_color, fig_path_width, thick_line_path:
+    #   see taup_path in taup_path_curve.py | Default full Earth, 0-360°
+    # - path_frames: Folder for the numbered PNG files and the animations |
+    #   Default "02_your_example_frames"
+    # - dpi: Resolution of the frames | Default 150
+    # - fps: Frames per second of the animations | Default 5
+    # - gif: Assemble the frames to a GIF | Default True
+    # - apng: Assemble the frames to an animated PNG | Default False
+    # - n_workers: Number of worker processes | Default number of CPUs
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - files_frame: List of the file names of the frames
+    # - stats: Dictionary with run times per stage | seconds,
+    #   and the rendered frames per second
+
+    if max_depth == None:
+        max_depth = r_earth
+    if n_workers == None:
+        n_workers = os.cpu_count()
+
+    receiver_dists = [float(receiver_dist) for receiver_dist in receiver_dists]
+    os.makedirs(path_frames, exist_ok=True)
+
+    settings = {
+        "source_depth": source_depth,
+        "phases": phases,
+        "earth_model": earth_model,
+        "r_earth": r_earth,
+        "min_depth": min_depth,
+        "max_depth": max_depth,
+        "min_dist": min_dist,
+        "max_dist": max_dist,
+        "font_size": font_size,
+        "fig_path_width": fig_path_width,
+        "thick_line_path": thick_line_path,
+        "path_frames": path_frames,
+        "dpi": dpi,
+    }
+    stats = {"n_frames": len(receiver_dists)}
+
+    # -------------------------------------------------------------------------
+    # Calculate travel paths of all frames
+    time_start = time.perf_counter()
+    paths = taup_batch(
+        source_depths=[source_depth],
+        receiver_dists=receiver_dists,
+        phase_lists=[phases],
+        earth_model=earth_model,
+        n_workers=n_workers,
+    )
+    stats["time_paths"] = time.perf_counter() - time_start
+
+    # -------------------------------------------------------------------------
+    # Plot background once
+    # Import PyGMT only after the process pool of taup_batch is closed
+    import pygmt
+    from PIL import Image
+
+    time_start = time.perf_counter()
+    fig_background = pygmt.Figure()
+    _movie_basemap(fig_background, settings)
+    taup_earth(
+        fig_path=fig_background,
+        min_dist=min_dist,
+        max_dist=max_dist,
+        min_depth=min_depth,
+        max_depth=max_depth,
+        r_earth=r_earth,
+        font_size=font_size,
+        earth_color=earth_color,
+    )
+    with pygmt.config(FORMAT_GEO_MAP="+D"):  # 0°-360°
+        fig_background.basemap(frame=[f"xa{step_dist}f5", "wbNe"])
+    _movie_canvas(fig_background, fig_path_width)
+    file_background = os.path.join(path_frames, "background.png")
+    fig_background.savefig(fname=file_background, dpi=dpi)
+    stats["time_background"] = time.perf_counter() - time_start
+
+    # -------------------------------------------------------------------------
+    # Plot frames in parallel
+    # Use new processes (spawn) to not share the GMT session of this process
+    time_start = time.perf_counter()
+    args_frames = [
+        (
+            i_frame,
+            receiver_dist,
+            paths[(float(source_depth), receiver_dist, tuple(phases))],
+            settings,
+            file_background,
+        )
+        for i_frame, receiver_dist in enumerate(receiver_dists)
+    ]
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(n_workers, len(args_frames))),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        files_frame = list(executor.map(_movie_frame, *zip(*args_frames)))
+    stats["time_frames"] = time.perf_counter() - time_start
+
+    # -------------------------------------------------------------------------
+    # Assemble animations
+    time_start = time.perf_counter()
+    images = [Image.open(file_frame) for file_frame in files_frame]
+    duration = int(np.round(1000 / fps))  # milliseconds per frame
+    file_movie = os.path.join(path_frames, "taup_movie")
+    if gif == True:
+        images[0].save(
+            f"{file_movie}.gif",
+            save_all=True,
+            append_images=images[1:],
+            duration=duration,
+            loop=0,
+        )
+    if apng == True:
+        images[0].save(
+            f"{file_movie}.png",
+            format="PNG",
+            save_all=True,
+            append_images=images[1:],
+            duration=duration,
+            loop=0,
+        )
+    for image in images:
+        image.close()
+    stats["time_assemble"] = time.perf_counter() - time_start
+
+    stats["time_total"] = (
+        stats["time_paths"]
+        + stats["time_background"]
+        + stats["time_frames"]
+        + stats["time_assemble"]
+    )
+    stats["fps_render"] = stats["n_frames"] / stats["time_total"]
+    print(
+        f"{stats['n_frames']} frames in {stats['time_total']:.1f} s"
+        f" -> {stats['fps_render']:.2f} frames per second"
+    )
+
+    return files_frame, stats
+
+
+# %%
+# -----------------------------------------------------------------------------
+# Examples
+# -----------------------------------------------------------------------------
+# Required for the process pools
+if __name__ == "__main__":
+
+    files_frame, stats = taup_movie(
+        source_depth=500,
+        receiver_dists=np.arange(0, 181, 2),
+        phases=["P", "PcP", "S", "ScS"],
+        apng=True,
+    )
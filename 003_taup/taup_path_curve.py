@@ -33,6 +33,13 @@
 # - Updated: 2025/03/31 - Enhancement: Introduce function taup_symbol
 # - Updated: 2025/03/31 - Enhancement: Add crust
 # - Updated: 2025/05/01 - Maintenance: Adjust creating legend for travel time curves
+# - Updated: 2026/10/17 - Enhancement: Cache travel paths on disk
+# - Updated: 2026/10/17 - Enhancement: Pass precalculated travel paths, e.g. from taup_batch
+# - Updated: 2026/10/17 - Enhancement: Travel time curves from travel time table
+# - Updated: 2026/10/17 - Refractor: Introduce function taup_arrival_table
+# - Updated: 2026/10/17 - Refractor: Share with 004_earthquakes_eruptions, import lazily
+# - Updated: 2026/10/17 - Enhancement: Plot travel paths as multi-segment data per phase
+# - Updated: 2026/10/17 - Refractor: Introduce functions taup_center and taup_earth
 # -----------------------------------------------------------------------------
 # Versions
 # - PyGMT v0.16.0 - v0.18.0 -> https://www.pygmt.org
@@ -45,13 +52,157 @@
 # #############################################################################
 
 
+import io
+
 import numpy as np
-import pygmt
-from obspy.taup import TauPyModel
 
+from taup_arrivals import taup_arrival_table
+from taup_batch import taup_batch
+from taup_cache import taup_ray_paths
 from taup_color import taup_color
 from taup_style import taup_style
 from taup_symbol import taup_symbol
+from taup_time_table import taup_time_curve, taup_time_table_build
+
+
+def taup_center(min_dist, max_dist):
+    # Returns the shift and the center of the polar plot | degrees
+    add_dist = 0
+    if min_dist > 0: add_dist = min_dist
+    elif min_dist < 0 and max_dist < 0: add_dist = max_dist
+
+    center_point = (np.abs(max_dist) - np.abs(min_dist)) / 2 + add_dist
+    if min_dist == 0 and max_dist == 360: center_point = 0
+
+    return add_dist, center_point
+
+
+def taup_earth(
+    fig_path,
+    min_dist,
+    max_dist,
+    min_depth,
+    max_depth,
+    r_earth=6371,
+    font_size="4p",
+    earth_color="tan",
+):
+    # Plot Earth concentric shells or circles and depth labels into the polar
+    # plot of fig_path, for the arguments see taup_path
+    import pygmt
+
+    add_dist, center_point = taup_center(min_dist, max_dist)
+
+    # -------------------------------------------------------------------------
+    # Set up colors for Earth concentric shells or circles
+    bounds = [30, 120, 440, 660, 2700, 2900, 5120, 6371]  # depth in kilometers
+    earth_colors = ["none", "white", "tan", "gray", "bilbao_gray", "bilbao_brown"]
+
+    # Adjust for your needs
+    if earth_color not in earth_colors:
+        pygmt.makecpt(
+            cmap=earth_color, series=[0, len(bounds), 1], transparency=50,
+        )
+
+    match earth_color:
+        case "none":
+            colors = ["white@100"] * len(bounds)
+        case "white":
+            colors = ["white"] * len(bounds)
+        case "tan":
+            colors = [
+                "white", "244/236/236", "235/222/204", "229/211/188",
+                "224/203/176", "220/197/167", "217/193/160", "white",
+            ]
+        case "gray":
+            colors = [
+                "white", "246.03", "228.09", "210.16",
+                "193.22", "gray69", "159.34", "white",
+            ]
+        case "bilbao_gray":
+            colors = [
+                "white", "245.03/245.03/244.06", "225.09/224.09/223.09", "208.16/206.16/199.31",
+                "197.22/193.22/177.22", "190.28/183.28/156.28", "184.34/172.34/135.34", "white",
+            ]
+        case "bilbao_brown":
+            colors = [
+                "white", "197.22/193.22/177.22", "190.28/183.28/156.28", "184.34/172.34/135.34",
+                "177.41/157.41/116.41", "172/142.47/105", "168/127.53/98.531", "white",
+            ]
+
+    # -------------------------------------------------------------------------
+    # Plot dicontinuities
+    circle_step = 1
+    circle_x = np.arange(min_dist, max_dist + circle_step, circle_step)
+    circle_y = np.ones(len(circle_x))
+
+    for i_bound, bound in enumerate(bounds):
+        # Plot Earth concentric circles
+        fill_used = "+z"
+        zvalue_used = i_bound
+        camp_used = True
+        if earth_color in earth_colors:
+            fill_used = colors[i_bound]
+            zvalue_used = None
+            camp_used = None
+        fig_path.plot(
+            x=circle_x,
+            y=circle_y * (r_earth - bound),
+            close="+y",
+            pen="0.4p,gray10",
+            fill=fill_used,
+            zvalue=zvalue_used,
+            cmap=camp_used,
+        )
+        # Add depth labels
+        if max_dist != 360:
+            angle_sign = -1
+            if min_dist < 0 and max_dist < 0: angle_sign = 1
+            angle_depth = (np.abs(min_dist) + np.abs(max_dist)) / 2 + angle_sign * add_dist
+            angle_flip = 0
+            justify_depth = "RM"
+            if max_dist - min_dist > 200:  # degrees
+                angle_flip = 180
+                justify_depth = "LM"
+            if bound > min_depth and bound < max_depth:
+                fig_path.text(
+                    x=min_dist,
+                    y=r_earth - bound,
+                    text=bound,
+                    font=font_size,
+                    angle=angle_depth + angle_flip,
+                    justify=justify_depth,
+                    offset="-0.05c/-0.05c",
+                    fill="white@30",
+                    no_clip=True,
+                )
+        else:
+            match bound:
+                case 6371: y_offset = 0
+                case 5120: y_offset = 200
+                case 2900: y_offset = -200
+                case 2700: y_offset = 200
+                case 660: y_offset = -200
+                case 440: y_offset = -50
+                case 120: y_offset = -70
+                case 30: y_offset = -1000  # outside of plot
+            fig_path.plot(
+                x=np.linspace(min_dist, max_dist, max_dist),
+                y=np.ones(max_dist) * (r_earth - bound + y_offset),
+                style=f"qn1:+l{bound} km+f{font_size}+v+i+gwhite@30+o+c0.03c/0.03c",
+            )
+            if bound == 6371:
+                fig_path.text(
+                    x=180,
+                    y=r_earth - bound,
+                    text=f"{bound} km",
+                    font=font_size,
+                    justify="MC",
+                    fill="white@30",
+                    clearance="0.03c/0.03c+tO",
+                    offset=f"0c/{y_offset}c",
+                )
+
 
 def taup_path(
     source_depth,
@@ -79,6 +230,11 @@ def taup_path(
     legend_curve=True,
     fig_save=False,
     save_path="",
+    cache=True,
+    cache_dir=None,
+    arrivals=None,
+    path_multisegment=False,
+    fig_show=True,
 ):
     # %%
     # -------------------------------------------------------------------------
@@ -117,6 +273,13 @@ def taup_path(
     # - legend_curve: Add legend for travel time curves | Default True
     # - fig_save: Save figure to file | Default False
     # - save_path: Path of folder to save figure | Default current working directory
+    # - cache: Reuse travel paths stored on disk, see taup_cache.py | Default True
+    # - cache_dir: Folder of the cache | Default see TAUP_CACHE_DIR in taup_cache.py
+    # - arrivals: Precalculated travel paths for source_depth, receiver_dist, and
+    #   phases, e.g. from taup_batch.py | Default calculate or read from cache
+    # - path_multisegment: Plot all travel paths and travel times of the same phase
+    #   with one call, i.e., one legend entry per phase | Default False
+    # - fig_show: Show figures | Default True
     # -------------------------------------------------------------------------
     # Returns
     # -------------------------------------------------------------------------
@@ -129,14 +292,16 @@ def taup_path(
     # -------------------------------------------------------------------------
     # General stuff
     # -------------------------------------------------------------------------
+    # Import PyGMT only at the first call to speed up importing this module
+    import pygmt
+    from pygmt.helpers import GMTTempFile
+
     if max_depth == None:
         max_depth = r_earth
 
     if max_dist == None:
         max_dist = int(np.round(receiver_dist)) + 10
 
-    rad2deg = 360 / (2 * np.pi)
-
     # -------------------------------------------------------------------------
     # Region
     max_radius = r_earth - min_depth
@@ -162,13 +327,18 @@ def taup_path(
     # https://docs.obspy.org/packages/autogen/obspy.taup.tau.TauPyModel.html
     # last access: 2023/12/11
 
-    model = TauPyModel(model=earth_model)
-
-    pp_temp = model.get_ray_paths(
-        source_depth_in_km=source_depth,
-        distance_in_degree=receiver_dist,
-        phase_list=phases,
-    )
+    # Already calculated travel paths are read from the cache, see taup_cache.py
+    if arrivals != None:
+        pp_temp = arrivals
+    else:
+        pp_temp = taup_ray_paths(
+            source_depth=source_depth,
+            receiver_dist=receiver_dist,
+            phases=phases,
+            earth_model=earth_model,
+            cache=cache,
+            cache_dir=cache_dir,
+        )
 
 
     # %%
@@ -178,12 +348,7 @@ def taup_path(
 
     # -------------------------------------------------------------------------
     # Set up polar plot
-    add_dist = 0
-    if min_dist > 0: add_dist = min_dist
-    elif min_dist < 0 and max_dist < 0: add_dist = max_dist
-
-    center_point = (np.abs(max_dist) - np.abs(min_dist)) / 2 + add_dist
-    if min_dist == 0 and max_dist == 360: center_point = 0
+    add_dist, center_point = taup_center(min_dist, max_dist)
 
     # -------------------------------------------------------------------------
     # Create or continue PyGMT Figure instance for travel curve plot
@@ -201,122 +366,25 @@ def taup_path(
         )
 
     # -------------------------------------------------------------------------
-    # Set up colors for Earth concentric shells or circles
-    bounds = [30, 120, 440, 660, 2700, 2900, 5120, 6371]  # depth in kilometers
-    earth_colors = ["none", "white", "tan", "gray", "bilbao_gray", "bilbao_brown"]
-
-    # Adjust for your needs
-    if earth_color not in earth_colors:
-        pygmt.makecpt(
-            cmap=earth_color, series=[0, len(bounds), 1], transparency=50,
+    # Plot Earth concentric shells or circles and depth labels
+    if path_overlay == False:
+        taup_earth(
+            fig_path=fig_path,
+            min_dist=min_dist,
+            max_dist=max_dist,
+            min_depth=min_depth,
+            max_depth=max_depth,
+            r_earth=r_earth,
+            font_size=font_size,
+            earth_color=earth_color,
         )
 
-    match earth_color:
-        case "none":
-            colors = ["white@100"] * len(bounds)
-        case "white":
-            colors = ["white"] * len(bounds)
-        case "tan":
-            colors = [
-                "white", "244/236/236", "235/222/204", "229/211/188",
-                "224/203/176", "220/197/167", "217/193/160", "white",
-            ]
-        case "gray":
-            colors = [
-                "white", "246.03", "228.09", "210.16",
-                "193.22", "gray69", "159.34", "white",
-            ]
-        case "bilbao_gray":
-            colors = [
-                "white", "245.03/245.03/244.06", "225.09/224.09/223.09", "208.16/206.16/199.31",
-                "197.22/193.22/177.22", "190.28/183.28/156.28", "184.34/172.34/135.34", "white",
-            ]
-        case "bilbao_brown":
-            colors = [
-                "white", "197.22/193.22/177.22", "190.28/183.28/156.28", "184.34/172.34/135.34",
-                "177.41/157.41/116.41", "172/142.47/105", "168/127.53/98.531", "white",
-            ]
-
     color_fig_curve = "white"
     if earth_color in ["tan", "bilao_gray", "bilbao_brown"]:
         color_fig_curve = "tan"
     elif earth_color == "gray":
         color_fig_curve = "gray"
 
-    # -------------------------------------------------------------------------
-    # Plot dicontinuities
-    circle_step = 1
-    circle_x = np.arange(min_dist, max_dist + circle_step, circle_step)
-    circle_y = np.ones(len(circle_x))
-
-    if path_overlay == False:
-        for i_bound, bound in enumerate(bounds):
-            # Plot Earth concentric circles
-            fill_used = "+z"
-            zvalue_used = i_bound
-            camp_used = True
-            if earth_color in earth_colors:
-                fill_used = colors[i_bound]
-                zvalue_used = None
-                camp_used = None
-            fig_path.plot(
-                x=circle_x,
-                y=circle_y * (r_earth - bound),
-                close="+y",
-                pen="0.4p,gray10",
-                fill=fill_used,
-                zvalue=zvalue_used,
-                cmap=camp_used,
-            )
-            # Add depth labels
-            if max_dist != 360:
-                angle_sign = -1
-                if min_dist < 0 and max_dist < 0: angle_sign = 1
-                angle_depth = (np.abs(min_dist) + np.abs(max_dist)) / 2 + angle_sign * add_dist
-                angle_flip = 0
-                justify_depth = "RM"
-                if max_dist - min_dist > 200:  # degrees
-                    angle_flip = 180
-                    justify_depth = "LM"
-                if bound > min_depth and bound < max_depth:
-                    fig_path.text(
-                        x=min_dist,
-                        y=r_earth - bound,
-                        text=bound,
-                        font=font_size,
-                        angle=angle_depth + angle_flip,
-                        justify=justify_depth,
-                        offset="-0.05c/-0.05c",
-                        fill="white@30",
-                        no_clip=True,
-                    )
-            else:
-                match bound:
-                    case 6371: y_offset = 0
-                    case 5120: y_offset = 200
-                    case 2900: y_offset = -200
-                    case 2700: y_offset = 200
-                    case 660: y_offset = -200
-                    case 440: y_offset = -50
-                    case 120: y_offset = -70
-                    case 30: y_offset = -1000  # outside of plot
-                fig_path.plot(
-                    x=np.linspace(min_dist, max_dist, max_dist),
-                    y=np.ones(max_dist) * (r_earth - bound + y_offset),
-                    style=f"qn1:+l{bound} km+f{font_size}+v+i+gwhite@30+o+c0.03c/0.03c",
-                )
-                if bound == 6371:
-                    fig_path.text(
-                        x=180,
-                        y=r_earth - bound,
-                        text=f"{bound} km",
-                        font=font_size,
-                        justify="MC",
-                        fill="white@30",
-                        clearance="0.03c/0.03c+tO",
-                        offset=f"0c/{y_offset}c",
-                    )
-
     # -------------------------------------------------------------------------
     # Create or continue PyGMT Figure instance for travel time plot
     if time_curve == True:
@@ -342,8 +410,12 @@ def taup_path(
 
     # -------------------------------------------------------------------------
     # Iterate over phases
+    # Columnar table of all arrivals, see taup_arrivals.py
+    pp_table = taup_arrival_table(pp_temp, r_earth=r_earth)
+
     fig_name_phase = []
-    for i_phase in range(len(pp_temp)):
+    pp_groups = {}
+    for i_phase in range(len(pp_table["name"])):
 
     # -------------------------------------------------------------------------
         # Plot travel paths
@@ -353,60 +425,104 @@ def taup_path(
         # Adjust number of columns for your needs
         if i_phase == 0: leg_col_str = "+N3"
 
-        pp_depth = []
-        pp_dist = []
-
-        for i_depth in range(len(pp_temp[i_phase].path)):
-            pp_temp_depth = pp_temp[i_phase].path[i_depth][3]
-            pp_temp_dist = pp_temp[i_phase].path[i_depth][2]
-
-            pp_depth.append(r_earth - pp_temp_depth)
-            pp_dist.append(pp_temp_dist * rad2deg)
+        i_start = pp_table["offset"][i_phase]
+        i_end = pp_table["offset"][i_phase + 1]
+        pp_depth = pp_table["radius"][i_start:i_end]
+        pp_dist = pp_table["dist"][i_start:i_end]
 
-        phase_label = str(pp_temp[i_phase])
-        phase_label_split = phase_label.split(" ")
-        phase_time = phase_label_split[4]
-        phase_time_split = phase_time.split(".")
+        phase_name = str(pp_table["name"][i_phase])
+        # Full seconds as shown with three decimals by ObsPy
+        phase_time = int(np.round(pp_table["time"][i_phase], 3))
 
         # Account for "anders herum gelaufene" phase
-        pp_dist_used = np.array(pp_dist)
+        pp_dist_used = pp_dist
         if (np.round(pp_dist_used.max(), 3) > receiver_dist) or (
             receiver_dist > 180 and np.round(pp_dist_used.max(), 3) < receiver_dist
         ):
             pp_dist_used = pp_dist_used * -1
 
-        fig_path.plot(
-            x=pp_dist_used,
-            y=pp_depth,
-            pen=f"{thick_line_path},{phase_colors[phase_label_split[0]]},{phase_styles[phase_label_split[0]]}",
-            label=f"{phase_label_split[0]} | {phase_time_split[0]} s+S0.5c/1c{leg_col_str}",
-        )
+        pen_path = f"{thick_line_path},{phase_colors[phase_name]},{phase_styles[phase_name]}"
+
+        # Collect travel paths and times of the same phase, plotted after the loop
+        if path_multisegment == True:
+            if phase_name not in pp_groups:
+                pp_groups[phase_name] = {"pen": pen_path, "paths": [], "times": []}
+            pp_groups[phase_name]["paths"].append(np.column_stack([pp_dist_used, pp_depth]))
+            pp_groups[phase_name]["times"].append(phase_time)
+        else:
+            fig_path.plot(
+                x=pp_dist_used,
+                y=pp_depth,
+                pen=pen_path,
+                label=f"{phase_name} | {phase_time} s+S0.5c/1c{leg_col_str}",
+            )
 
     # -------------------------------------------------------------------------
         # Plot travel times
-        if time_curve == True:
+        if time_curve == True and path_multisegment == False:
 
             fig_curve.plot(
                 x=receiver_dist,
-                y=phase_time_split[0],
-                style=f"{phase_symbol[phase_label_split[0]]}0.13c",
-                fill=phase_colors[phase_label_split[0]],
+                y=phase_time,
+                style=f"{phase_symbol[phase_name]}0.13c",
+                fill=phase_colors[phase_name],
                 pen="0.001p,gray10",
                 no_clip=True,
             )
 
     # -------------------------------------------------------------------------
         # Use only the existing phases in the file name
-        fig_name_phase.append(phase_label_split[0])
+        fig_name_phase.append(phase_name)
         # Remove doublictes
         fig_name_phase = list(dict.fromkeys(fig_name_phase))
     # Use submitted phase list in case the list of the existing phases is empty
     if fig_name_phase == []:
         fig_name_phase = phases
 
+    # -------------------------------------------------------------------------
+    # Plot all travel paths and times of one phase with one call each
+    # Travel paths are passed as multi-segment file, the segment headers carry
+    # the pens
+    for i_group, (phase_name, pp_group) in enumerate(pp_groups.items()):
+        leg_col_str = ""
+        if i_group == 0: leg_col_str = "+N3"
+        times_str = ", ".join(str(time) for time in pp_group["times"])
+
+        with GMTTempFile(suffix=".txt") as tmp_file:
+            with open(tmp_file.name, mode="w") as file_segments:
+                for pp_path in pp_group["paths"]:
+                    file_segments.write(f"> -W{pp_group['pen']}\n")
+                    np.savetxt(file_segments, pp_path, fmt="%.6f")
+            fig_path.plot(
+                data=tmp_file.name,
+                pen=pp_group["pen"],
+                label=f"{phase_name} | {times_str} s+S0.5c/1c{leg_col_str}",
+            )
+
+        if time_curve == True:
+            fig_curve.plot(
+                x=np.full(len(pp_group["times"]), receiver_dist),
+                y=pp_group["times"],
+                style=f"{phase_symbol[phase_name]}0.13c",
+                fill=phase_colors[phase_name],
+                pen="0.001p,gray10",
+                no_clip=True,
+            )
+
     # -------------------------------------------------------------------------
     # Add legend for phases in travel time plot
-    if time_curve == True and legend_curve == True:
+    # Legend entries are passed as legend specification instead of plotting
+    # one dummy symbol per phase
+    if time_curve == True and legend_curve == True and path_multisegment == True:
+        spec_curve = io.StringIO()
+        for phase in phases:
+            spec_curve.write(
+                f"S 0.15c c 0.05c {phase_colors[phase]} 0.05p,gray10 0.3c {phase}\n"
+            )
+        fig_curve.legend(
+            spec=spec_curve, position="JRT+jTL+o0.2/0c+w2c", box=box_standard,
+        )
+    elif time_curve == True and legend_curve == True:
         for phase in phases:
             col_str = ""
             info_str = ""
@@ -509,8 +625,9 @@ def taup_path(
 
     # -------------------------------------------------------------------------
     # Show and save figures
-    fig_path.show()
-    if time_curve == True: fig_curve.show()
+    if fig_show == True:
+        fig_path.show()
+        if time_curve == True: fig_curve.show()
 
     plot_range_str = f"{min_depth}to{max_depth}km_{min_dist}to{max_dist}deg_"
     fig_name_start = f"{save_path}map_travel"
@@ -541,111 +658,170 @@ def taup_path(
 # -----------------------------------------------------------------------------
 # Examples
 # -----------------------------------------------------------------------------
-fig_path, fig_curve = taup_path(
-    fig_path_width="8c",
-    font_size="6.5p",
-    earth_color="gray",
-    source_depth=500,
-    receiver_dist=142,
-    max_dist=360,
-    phases=["S", "ScS", "PKS", "PKKS", "SKS", "SKKS", "SKIKS", "SKJKS"],
-    time_curve=True,
-    # fig_save=True,
-    # save_path="02_your_example_figures/",
-)
-
-fig_path = taup_path(
-    fig_path_width="8c",
-    font_size="6.5p",
-    earth_color="gray",
-    source_depth=500,
-    receiver_dist=142,
-    min_dist=100,
-    max_dist=180,
-    min_depth=660,
-    max_depth=4000,
-    phases=["S", "ScS", "PKS", "PKKS", "SKS", "SKKS", "SKIKS", "SKJKS"],
-    # fig_save=True,
-    # save_path="02_your_example_figures/",
-)
+# Required for the process pool of taup_batch
+if __name__ == "__main__":
 
-# -----------------------------------------------------------------------------
-fig_path = taup_path(
-    fig_path_width="8c",
-    font_size="6.5p",
-    source_depth=500,
-    receiver_dist=95,
-    min_dist=-5,
-    max_dist=100,
-    phases=["SKS", "pSKS", "sSKS", "SKKS", "pSKKS", "sSKKS"],
-    # fig_save=True,
-    # save_path="02_your_example_figures/",
-)
-
-fig_path = taup_path(
-    fig_path_width="8c",
-    font_size="6.5p",
-    source_depth=500,
-    receiver_dist=95,
-    min_dist=-5,
-    max_dist=100,
-    min_depth=0,
-    max_depth=4000,
-    phases=["SKS", "pSKS", "sSKS", "SKKS", "pSKKS", "sSKKS"],
-    # fig_save=True,
-    # save_path="02_your_example_figures/",
-)
-
-fig_path = taup_path(
-    fig_path_width="8c",
-    font_size="6.5p",
-    source_depth=500,
-    receiver_dist=95,
-    min_dist=-3,
-    max_dist=7,
-    step_dist=5,
-    min_depth=0,
-    max_depth=800,
-    phases=["SKS", "pSKS", "sSKS", "SKKS", "pSKKS", "sSKKS"],
-    # fig_save=True,
-    # save_path="02_your_example_figures/",
-)
+    fig_path, fig_curve = taup_path(
+        fig_path_width="8c",
+        font_size="6.5p",
+        earth_color="gray",
+        source_depth=500,
+        receiver_dist=142,
+        max_dist=360,
+        phases=["S", "ScS", "PKS", "PKKS", "SKS", "SKKS", "SKIKS", "SKJKS"],
+        time_curve=True,
+        # fig_save=True,
+        # save_path="02_your_example_figures/",
+    )
 
-# -----------------------------------------------------------------------------
-dist_min = 0  # degrees
-dist_max = 80
-dist_step = 20
-for dist in np.arange(dist_min, dist_max + dist_step, dist_step):
-
-    if dist == dist_min:
-        fig_path_instance = None
-        fig_curve_instance = None
-        path_overlay = False
-    else:
-        fig_path_instance = fig_path
-        fig_curve_instance = fig_curve
-        path_overlay = True
+    # Same with one call per phase, e.g. only one PKKS legend entry for both arrivals
+    fig_path, fig_curve = taup_path(
+        fig_path_width="8c",
+        font_size="6.5p",
+        earth_color="gray",
+        source_depth=500,
+        receiver_dist=142,
+        max_dist=360,
+        phases=["S", "ScS", "PKS", "PKKS", "SKS", "SKKS", "SKIKS", "SKJKS"],
+        time_curve=True,
+        path_multisegment=True,
+    )
+
+    fig_path = taup_path(
+        fig_path_width="8c",
+        font_size="6.5p",
+        earth_color="gray",
+        source_depth=500,
+        receiver_dist=142,
+        min_dist=100,
+        max_dist=180,
+        min_depth=660,
+        max_depth=4000,
+        phases=["S", "ScS", "PKS", "PKKS", "SKS", "SKKS", "SKIKS", "SKJKS"],
+        # fig_save=True,
+        # save_path="02_your_example_figures/",
+    )
+
+    # -------------------------------------------------------------------------
+    fig_path = taup_path(
+        fig_path_width="8c",
+        font_size="6.5p",
+        source_depth=500,
+        receiver_dist=95,
+        min_dist=-5,
+        max_dist=100,
+        phases=["SKS", "pSKS", "sSKS", "SKKS", "pSKKS", "sSKKS"],
+        # fig_save=True,
+        # save_path="02_your_example_figures/",
+    )
+
+    fig_path = taup_path(
+        fig_path_width="8c",
+        font_size="6.5p",
+        source_depth=500,
+        receiver_dist=95,
+        min_dist=-5,
+        max_dist=100,
+        min_depth=0,
+        max_depth=4000,
+        phases=["SKS", "pSKS", "sSKS", "SKKS", "pSKKS", "sSKKS"],
+        # fig_save=True,
+        # save_path="02_your_example_figures/",
+    )
+
+    fig_path = taup_path(
+        fig_path_width="8c",
+        font_size="6.5p",
+        source_depth=500,
+        receiver_dist=95,
+        min_dist=-3,
+        max_dist=7,
+        step_dist=5,
+        min_depth=0,
+        max_depth=800,
+        phases=["SKS", "pSKS", "sSKS", "SKKS", "pSKKS", "sSKKS"],
+        # fig_save=True,
+        # save_path="02_your_example_figures/",
+    )
+
+    # -------------------------------------------------------------------------
+    dist_min = 0  # degrees
+    dist_max = 80
+    dist_step = 20
+    dists = np.arange(dist_min, dist_max + dist_step, dist_step)
+    phases_sweep = ["P", "PcP"]
+    depth_sweep = 500  # kilometers
+
+    # Calculate all travel paths in parallel before plotting
+    paths_sweep = taup_batch(
+        source_depths=[depth_sweep],
+        receiver_dists=dists,
+        phase_lists=[phases_sweep],
+    )
 
-    fig_save = False
-    if dist == dist_max: fig_save = True  # Save only the last figure
+    for dist in dists:
+
+        if dist == dist_min:
+            fig_path_instance = None
+            fig_curve_instance = None
+            path_overlay = False
+        else:
+            fig_path_instance = fig_path
+            fig_curve_instance = fig_curve
+            path_overlay = True
+
+        fig_save = False
+        if dist == dist_max: fig_save = True  # Save only the last figure
+
+        fig_path, fig_curve = taup_path(
+            fig_path_width="8c",
+            font_size="6.5p",
+            earth_color="gray",
+            thick_line_path="0.5p",
+            receiver_dist=dist,
+            phases=phases_sweep,
+            source_depth=depth_sweep,
+            arrivals=paths_sweep[(depth_sweep, dist, tuple(phases_sweep))],
+            min_dist=0,
+            max_dist=360,
+            fig_path_instance=fig_path_instance,
+            path_overlay=path_overlay,
+            time_curve=True,
+            fig_curve_instance=fig_curve_instance,
+            curve_dist_range=[dist_min - dist_step, dist_max + dist_step],
+            curve_time_range=[0, 2700],
+            legend_path=False,
+            # fig_save=fig_save,
+            # save_path="02_your_example_figures/",
+        )
+
+    # -------------------------------------------------------------------------
+    # Dense travel time curves from a precalculated travel time table
+    # The table is calculated once per Earth model and grid and read from disk
+    # afterwards, see taup_time_table.py
+    phases_table = ["S", "ScS", "PKS", "PKKS", "SKS", "SKKS", "SKIKS", "SKJKS"]
+    table = taup_time_table_build(
+        source_depths=[0, 100, 200, 300, 400, 500, 600, 700],
+        dists=np.arange(0, 180.1, 0.1),
+        phases=phases_table,
+    )
 
     fig_path, fig_curve = taup_path(
         fig_path_width="8c",
         font_size="6.5p",
         earth_color="gray",
-        thick_line_path="0.5p",
-        receiver_dist=dist,
-        phases=["P", "PcP"],
         source_depth=500,
-        min_dist=0,
+        receiver_dist=142,
         max_dist=360,
-        fig_path_instance=fig_path_instance,
-        path_overlay=path_overlay,
+        phases=phases_table,
         time_curve=True,
-        fig_curve_instance=fig_curve_instance,
-        curve_dist_range=[dist_min - dist_step, dist_max + dist_step],
-        curve_time_range=[0, 2700],
         legend_path=False,
-        # fig_save=fig_save,
-        # save_path="02_your_example_figures/",
     )
+    taup_time_curve(
+        fig_curve=fig_curve,
+        table=table,
+        source_depth=500,
+        phases=phases_table,
+        thick_line_curve="0.8p",
+    )
+    fig_curve.show()
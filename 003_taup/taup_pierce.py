@@ -0,0 +1,465 @@
+# #############################################################################
+# This functions
+# - Calculate piercing points of core-refracted shear waves (default SKS,
+#   SKKS, PKS) at arbitrary depths via ObsPy and TauP (get_pierce_points
+#   with add_depth)
+# - Take an event table (latitude, longitude, depth) and a station table
+#   (station, latitude, longitude)
+# - Spread the TauP calculations over a process pool with one TauPyModel per
+#   worker; the TauP calculation depends only on the hypocentral depth and the
+#   epicentral distance, the geographic coordinates of all piercing points are
+#   calculated vectorized via NumPy on the sphere afterwards
+# - Cache the results on disk as columnar table (one NumPy array per column)
+# - Write the column layouts read by
+#   - 002_paper_FGR_2024 (Figure_9, Figure_S22): pps/*_pp200km_*, *_pp2700km_*
+#     lon | lat | phi_SL | phi_GMT | dt | si | baz | thick (tab-separated)
+#   - 007_dissertation_F_2025/02_3d_bfo: 02_pp2700km
+#     # pp_lon_degE pp_lat_degN phi_NdegE (tab-separated)
+#   - 007_dissertation_F_2025/02_3d_bfo: 03_pp410km
+#     lon,lat,depth (comma-separated)
+# -----------------------------------------------------------------------------
+# Related to
+# - Fröhlich Y., Grund M. & Ritter J. R. R. (2024).
+#   Lateral and vertical variations of seismic anisotropy in the lithosphere-
+#   asthenosphere system underneath Central Europe from long-term splitting
+#   measurements. Geophysical Journal International, 239(1), 112-135.
+#   https://doi.org/10.1093/gji/ggae245.
+# - Fröhlich Y. (2025). Shear wave splitting analysis of long-term data:
+#   Anisotropy studies in the Upper Rhine Graben area, Central Europe.
+#   Dissertation, Karlsruhe Institute of Technology, Geophysical Institute.
+#   https://doi.org/10.5445/IR/1000183786.
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from taup_cache import TAUP_CACHE_DIR, taup_model
+
+
+# Default folder of the piercing point tables
+TAUP_PIERCE_DIR = os.path.join(TAUP_CACHE_DIR, "pierce")
+# Default seismological phases
+PIERCE_PHASES = ["SKS", "SKKS", "PKS"]
+# Columns of the piercing point table
+PIERCE_COLUMNS = [
+    "event",
+    "station",
+    "phase",
+    "depth",
+    "lon",
+    "lat",
+    "dist",
+    "time",
+    "baz",
+]
+
+
+# TauPyModel instance of the current worker process
+_worker_model = None
+
+
+def _worker_init(earth_model):
+    global _worker_model
+    _worker_model = taup_model(earth_model)
+
+
+def _worker_pierce(source_depth, receiver_dist, phases, depths, side):
+    # Distance from the source | degrees and travel time | seconds at the
+    # piercing points of one hypocentral depth and epicentral distance
+    # Shape (phase, depth), NaN if the phase does not exist or does not reach
+    # the depth
+    pierce_dist = np.full((len(phases), len(depths)), np.nan)
+    pierce_time = np.full((len(phases), len(depths)), np.nan)
+    arrivals = _worker_model.get_pierce_points(
+        source_depth_in_km=source_depth,
+        distance_in_degree=receiver_dist,
+        phase_list=phases,
+        add_depth=list(depths),
+    )
+    phases_done = set()
+    for arrival in arrivals:
+        # For phases with several arrivals the first one is used
+        if arrival.name not in phases or arrival.name in phases_done:
+            continue
+        phases_done.add(arrival.name)
+        i_phase = phases.index(arrival.name)
+        pierce = arrival.pierce
+        for i_depth, depth in enumerate(depths):
+            i_pierce = np.flatnonzero(np.isclose(pierce["depth"], depth))
+            if len(i_pierce) == 0:
+                continue
+            # Upgoing (receiver) or downgoing (source) part of the travel path
+            i_pierce = i_pierce[-1] if side == "receiver" else i_pierce[0]
+            pierce_dist[i_phase, i_depth] = np.rad2deg(pierce["dist"][i_pierce])
+            pierce_time[i_phase, i_depth] = pierce["time"][i_pierce]
+    return pierce_dist, pierce_time
+
+
+def taup_pierce_dist_az(lat_1, lon_1, lat_2, lon_2):
+    # Epicentral distance | degrees, azimuth and backazimuth | degrees N
+    # between points 1 and 2 on the sphere, vectorized
+    lat_1, lon_1, lat_2, lon_2 = np.deg2rad(
+        np.broadcast_arrays(lat_1, lon_1, lat_2, lon_2)
+    )
+    dlon = lon_2 - lon_1
+    dist = np.arccos(
+        np.clip(
+            np.sin(lat_1) * np.sin(lat_2)
+            + np.cos(lat_1) * np.cos(lat_2) * np.cos(dlon),
+            -1,
+            1,
+        )
+    )
+    az = np.arctan2(
+        np.sin(dlon) * np.cos(lat_2),
+        np.cos(lat_1) * np.sin(lat_2) - np.sin(lat_1) * np.cos(lat_2) * np.cos(dlon),
+    )
+    baz = np.arctan2(
+        -np.sin(dlon) * np.cos(lat_1),
+        np.cos(lat_2) * np.sin(lat_1) - np.sin(lat_2) * np.cos(lat_1) * np.cos(dlon),
+    )
+    return np.rad2deg(dist), np.rad2deg(az) % 360, np.rad2deg(baz) % 360
+
+
+def taup_pierce_coords(lat, lon, az, dist):
+    # Latitude and longitude | degrees of the points at the distance dist
+    # (degrees) from (lat, lon) in the direction az (degrees N), vectorized
+    lat, lon, az, dist = np.deg2rad(np.broadcast_arrays(lat, lon, az, dist))
+    lat_pp = np.arcsin(
+        np.clip(
+            np.sin(lat) * np.cos(dist) + np.cos(lat) * np.sin(dist) * np.cos(az),
+            -1,
+            1,
+        )
+    )
+    lon_pp = lon + np.arctan2(
+        np.sin(az) * np.sin(dist) * np.cos(lat),
+        np.cos(dist) - np.sin(lat) * np.sin(lat_pp),
+    )
+    # Longitude in -180° to 180°
+    lon_pp = (np.rad2deg(lon_pp) + 180) % 360 - 180
+    return np.rad2deg(lat_pp), lon_pp
+
+
+def taup_pierce(
+    events,
+    stations,
+    depths,
+    phases=None,
+    earth_model="iasp91",
+    side="receiver",
+    pairwise=False,
+    n_workers=None,
+    cache=True,
+    cache_dir=None,
+):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - events: Event table, e.g. pandas DataFrame or dictionary, with the
+    #   columns "latitude" | degrees N, "longitude" | degrees E, "depth" | km
+    # - stations: Station table with the columns "station", "latitude" |
+    #   degrees N, "longitude" | degrees E
+    # - depths: Depths of the piercing points | km | list of floats
+    # Optional
+    # - phases: Seismological phases | list of strings | Default PIERCE_PHASES
+    # - earth_model: Earth model | Default "iasp91"
+    # - side: Piercing points on the "receiver" side (upgoing part) or on the
+    #   "source" side (downgoing part) of the travel path | Default "receiver"
+    # - pairwise: Combine the i-th event with the i-th station (tables of the
+    #   same length) instead of each event with each station | Default False
+    # - n_workers: Number of worker processes | Default number of CPUs
+    #   Use 1 to calculate in the current process
+    # - cache: Use the on-disk cache | Default True
+    # - cache_dir: Folder of the cache | Default TAUP_PIERCE_DIR
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - pierce: Dictionary with one NumPy array per column (PIERCE_COLUMNS),
+    #   one row per existing piercing point
+    #   - "event", "station": Row index into the event and station tables
+    #   - "phase": Seismological phase | string
+    #   - "depth": Depth | km
+    #   - "lon", "lat": Piercing point | degrees E, degrees N
+    #   - "dist": Distance from the source along the travel path | degrees
+    #   - "time": Travel time up to the piercing point | seconds
+    #   - "baz": Backazimuth at the station | degrees N
+    #   and the key "stations" with the station names
+
+    if phases == None:
+        phases = PIERCE_PHASES
+    if side not in ["receiver", "source"]:
+        raise ValueError(f"side must be 'receiver' or 'source', not '{side}'")
+    if cache_dir == None:
+        cache_dir = TAUP_PIERCE_DIR
+
+    phases = list(phases)
+    depths = np.asarray(depths, dtype=float)
+    event_lat = np.asarray(events["latitude"], dtype=float)
+    event_lon = np.asarray(events["longitude"], dtype=float)
+    event_depth = np.asarray(events["depth"], dtype=float)
+    station_names = np.asarray(stations["station"], dtype=str)
+    station_lat = np.asarray(stations["latitude"], dtype=float)
+    station_lon = np.asarray(stations["longitude"], dtype=float)
+
+    # Identify the table by its content
+    key_str = "|".join(
+        [
+            str(earth_model),
+            side,
+            str(pairwise),
+            ",".join(phases),
+            depths.tobytes().hex(),
+            np.stack([event_lat, event_lon, event_depth]).tobytes().hex(),
+            np.stack([station_lat, station_lon]).tobytes().hex(),
+        ]
+    )
+    key_hash = hashlib.sha1(key_str.encode("utf-8")).hexdigest()[:16]
+    model_name = os.path.splitext(os.path.basename(str(earth_model)))[0]
+    file_pierce = os.path.join(cache_dir, f"{model_name}_{key_hash}.npz")
+
+    if cache == True and os.path.isfile(file_pierce):
+        return taup_pierce_load(file_pierce)
+
+    # -------------------------------------------------------------------------
+    # Event-station pairs
+    if pairwise == True:
+        i_event = np.arange(len(event_lat))
+        i_station = np.arange(len(station_lat))
+        if len(i_event) != len(i_station):
+            raise ValueError("events and stations must have the same length")
+    else:
+        i_event, i_station = np.meshgrid(
+            np.arange(len(event_lat)), np.arange(len(station_lat)), indexing="ij"
+        )
+        i_event = i_event.ravel()
+        i_station = i_station.ravel()
+
+    receiver_dist, az, baz = taup_pierce_dist_az(
+        event_lat[i_event],
+        event_lon[i_event],
+        station_lat[i_station],
+        station_lon[i_station],
+    )
+    source_depth = event_depth[i_event]
+
+    # -------------------------------------------------------------------------
+    # TauP calculations, only once per hypocentral depth and epicentral
+    # distance (rounded to avoid floating point noise)
+    combis = np.round(np.column_stack([source_depth, receiver_dist]), 6)
+    combis_unique, i_combi = np.unique(combis, axis=0, return_inverse=True)
+    i_combi = i_combi.ravel()
+
+    if n_workers == None:
+        n_workers = os.cpu_count()
+    n_workers = max(1, min(n_workers, len(combis_unique)))
+
+    n_combis = len(combis_unique)
+    if n_combis == 0:
+        results = []
+    elif n_workers == 1:
+        _worker_init(earth_model)
+        results = [
+            _worker_pierce(combi[0], combi[1], phases, depths, side)
+            for combi in combis_unique
+        ]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_worker_init,
+            initargs=(earth_model,),
+        ) as executor:
+            results = list(
+                executor.map(
+                    _worker_pierce,
+                    combis_unique[:, 0],
+                    combis_unique[:, 1],
+                    [phases] * n_combis,
+                    [depths] * n_combis,
+                    [side] * n_combis,
+                    chunksize=max(1, n_combis // (4 * n_workers)),
+                )
+            )
+
+    # Shape (pair, phase, depth)
+    shape = (len(i_event), len(phases), len(depths))
+    if n_combis == 0:
+        pierce_dist = np.full(shape, np.nan)
+        pierce_time = np.full(shape, np.nan)
+    else:
+        pierce_dist = np.stack([result[0] for result in results])[i_combi]
+        pierce_time = np.stack([result[1] for result in results])[i_combi]
+
+    # -------------------------------------------------------------------------
+    # Geographic coordinates of all piercing points at once
+    exists = np.isfinite(pierce_dist)
+    i_pair, i_phase, i_depth = np.nonzero(exists)
+    pierce_lat, pierce_lon = taup_pierce_coords(
+        event_lat[i_event[i_pair]],
+        event_lon[i_event[i_pair]],
+        az[i_pair],
+        pierce_dist[exists],
+    )
+
+    pierce = {
+        "event": i_event[i_pair],
+        "station": i_station[i_pair],
+        "phase": np.array(phases, dtype=str)[i_phase],
+        "depth": depths[i_depth],
+        "lon": pierce_lon,
+        "lat": pierce_lat,
+        "dist": pierce_dist[exists],
+        "time": pierce_time[exists],
+        "baz": baz[i_pair],
+        "stations": station_names,
+    }
+
+    if cache == True:
+        os.makedirs(cache_dir, exist_ok=True)
+        file_temp = os.path.join(cache_dir, f"{model_name}_{key_hash}.tmp.npz")
+        np.savez(file_temp, **pierce)
+        os.replace(file_temp, file_pierce)
+
+    return pierce
+
+
+def taup_pierce_load(file_pierce):
+    # Returns the dictionary of a piercing point table, see taup_pierce
+    with np.load(file_pierce, allow_pickle=False) as data:
+        return {column: data[column] for column in data.files}
+
+
+def taup_pierce_select(pierce, depth=None, phase=None, station=None, mask=None):
+    # Rows of a piercing point table
+    # - depth: Depth | km, phase: Seismological phase, station: Station name |
+    #   Default all
+    # - mask: Additional boolean array with one value per row | Default all
+    select = np.ones(len(pierce["lon"]), dtype=bool)
+    if depth != None:
+        select &= np.isclose(pierce["depth"], depth)
+    if phase != None:
+        select &= pierce["phase"] == phase
+    if station != None:
+        select &= pierce["stations"][pierce["station"]] == station
+    if mask is not None:
+        select &= mask
+    table = {column: pierce[column][select] for column in PIERCE_COLUMNS}
+    table["stations"] = pierce["stations"]
+    return table
+
+
+def taup_pierce_write(file_out, pierce, layout="fgr", splitting=None, thick=0.07):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - file_out: Name of the text file
+    # - pierce: Piercing point table, e.g. of one depth, phase, and station
+    #   via taup_pierce_select
+    # Optional
+    # - layout: Column layout | Default "fgr"
+    #   "fgr": lon | lat | phi_SL | phi_GMT | dt | si | baz | thick,
+    #          tab-separated, as in pps/ of 002_paper_FGR_2024
+    #   "bfo_pp": lon | lat | phi, tab-separated with header, as in
+    #             02_pp2700km/ of 007_dissertation_F_2025/02_3d_bfo
+    #   "bfo_depth": lon,lat,depth, comma-separated, as in 03_pp410km/ of
+    #                007_dissertation_F_2025/02_3d_bfo
+    # - splitting: Dictionary with splitting parameters, one value per row,
+    #   keys "phi" (fast polarization direction | degrees N), "dt" (delay time
+    #   | seconds), "si" (splitting intensity) | Default NaN
+    # - thick: Thickness of the bars | centimeters | Default 0.07
+
+    if splitting == None:
+        splitting = {}
+    n_pp = len(pierce["lon"])
+    nan = np.full(n_pp, np.nan)
+    phi = np.asarray(splitting.get("phi", nan), dtype=float)
+
+    match layout:
+        case "fgr":
+            # phi_GMT: direction for GMT (counter-clockwise from horizontal)
+            columns = np.column_stack(
+                [
+                    pierce["lon"],
+                    pierce["lat"],
+                    phi,
+                    90 - phi,
+                    np.asarray(splitting.get("dt", nan), dtype=float),
+                    np.asarray(splitting.get("si", nan), dtype=float),
+                    pierce["baz"],
+                    np.full(n_pp, thick),
+                ]
+            )
+            np.savetxt(file_out, columns, fmt="%.5g", delimiter="\t")
+        case "bfo_pp":
+            columns = np.column_stack([pierce["lon"], pierce["lat"], phi])
+            np.savetxt(
+                file_out,
+                columns,
+                fmt="%.5g",
+                delimiter="\t",
+                header="pp_lon_degE pp_lat_degN phi_NdegE",
+            )
+        case "bfo_depth":
+            columns = np.column_stack([pierce["lon"], pierce["lat"], pierce["depth"]])
+            np.savetxt(file_out, columns, fmt="%.15g", delimiter=",")
+        case _:
+            raise ValueError(
+                f"layout must be 'fgr', 'bfo_pp', or 'bfo_depth', not '{layout}'"
+            )
+
+
+# %%
+# -----------------------------------------------------------------------------
+# Examples
+# -----------------------------------------------------------------------------
+# Required for the process pool
+if __name__ == "__main__":
+
+    path_out = "02_your_example_figures"
+    os.makedirs(path_out, exist_ok=True)
+
+    events = {
+        "latitude": [-56.04, 51.48, -17.87, 36.77],
+        "longitude": [-25.33, 178.10, -178.51, 141.64],
+        "depth": [33, 36, 580, 44],
+    }
+    stations = {"station": ["BFO"], "latitude": [48.3311], "longitude": [8.3303]}
+
+    pierce = taup_pierce(events, stations, depths=[100, 300, 410, 2700])
+
+    # New depth slices in the layouts of 002_paper_FGR_2024 and
+    # 007_dissertation_F_2025/02_3d_bfo
+    for depth in [100, 300]:
+        for phase, phase_short in zip(PIERCE_PHASES, ["K", "KK", "P"]):
+            pierce_slice = taup_pierce_select(
+                pierce, depth=depth, phase=phase, station="BFO"
+            )
+            taup_pierce_write(
+                f"{path_out}/BFO_pp{depth}km_{phase_short}_sp_goodfair_hd0km.txt",
+                pierce_slice,
+                layout="fgr",
+            )
+    taup_pierce_write(
+        f"{path_out}/BFO_pp2700km_K_goodfair.txt",
+        taup_pierce_select(pierce, depth=2700, phase="SKS"),
+        layout="bfo_pp",
+    )
+    taup_pierce_write(
+        f"{path_out}/BFO_pp410km_K_goodfair.txt",
+        taup_pierce_select(pierce, depth=410, phase="SKS"),
+        layout="bfo_depth",
+    )
@@ -0,0 +1,403 @@
+# #############################################################################
+# This functions
+# - Calculate geographic travel paths (rays) for event-station pairs via ObsPy
+#   and TauP in a process pool with one TauPyModel per worker; the TauP
+#   calculation depends only on the hypocentral depth and the epicentral
+#   distance, the geographic coordinates of all samples are calculated
+#   vectorized via NumPy on the sphere afterwards
+# - Store all rays of a group in one folder as ragged arrays
+#   - lon.npy, lat.npy, depth.npy: samples of all rays, concatenated | float32
+#   - offset.npy: start index of each ray, with one more entry for the end of
+#     the last ray | int64
+#   - index.npz: event, station, phase, and extent (lon, lat, depth) per ray
+# - Load the arrays memory-mapped and serve single rays and depth-filtered
+#   parts of rays as NumPy views (no copy) and select rays by region and depth
+# - Convert existing text files of rays (one file per ray as in
+#   007_dissertation_F_2025/02_3d_bfo/01_in_data/01_paths/ or GMT multi-segment
+#   files as in 002_paper_FGR_2024/Figure_S22/01_in_data/rays/) to this format
+# -----------------------------------------------------------------------------
+# Related to
+# - Fröhlich Y., Grund M. & Ritter J. R. R. (2024).
+#   Lateral and vertical variations of seismic anisotropy in the lithosphere-
+#   asthenosphere system underneath Central Europe from long-term splitting
+#   measurements. Geophysical Journal International, 239(1), 112-135.
+#   https://doi.org/10.1093/gji/ggae245.
+# - Fröhlich Y. (2025). Shear wave splitting analysis of long-term data:
+#   Anisotropy studies in the Upper Rhine Graben area, Central Europe.
+#   Dissertation, Karlsruhe Institute of Technology, Geophysical Institute.
+#   https://doi.org/10.5445/IR/1000183786.
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from taup_cache import (
+    TAUP_CACHE_SIZE,
+    taup_cache_evict,
+    taup_model,
+    taup_ray_paths,
+)
+from taup_pierce import taup_pierce_coords, taup_pierce_dist_az
+
+
+# TauPyModel instance of the current worker process
+_worker_model = None
+
+
+def _worker_init(earth_model):
+    global _worker_model
+    _worker_model = taup_model(earth_model)
+
+
+def _worker_path(source_depth, receiver_dist, phases, earth_model, cache, cache_dir):
+    # Travel path of the first arrival of one hypocentral depth and epicentral
+    # distance: name, distance from the source | degrees, depth | km
+    # None if no phase exists
+    arrivals = taup_ray_paths(
+        source_depth=source_depth,
+        receiver_dist=receiver_dist,
+        phases=phases,
+        earth_model=earth_model,
+        model=_worker_model,
+        cache=cache,
+        cache_dir=cache_dir,
+        cache_size=None,
+    )
+    if len(arrivals) == 0:
+        return None
+    arrival = min(arrivals, key=lambda arrival: arrival.time)
+    return arrival.name, np.rad2deg(arrival.path["dist"]), arrival.path["depth"]
+
+
+def taup_rays(
+    events,
+    stations,
+    phases,
+    earth_model="iasp91",
+    pairwise=True,
+    n_workers=None,
+    cache=True,
+    cache_dir=None,
+    cache_size=TAUP_CACHE_SIZE,
+):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - events: Event table, e.g. pandas DataFrame or dictionary, with the
+    #   columns "latitude" | degrees N, "longitude" | degrees E, "depth" | km
+    # - stations: Station table with the columns "station", "latitude" |
+    #   degrees N, "longitude" | degrees E
+    # - phases: Seismological phases | list of strings
+    #   The first arrival of these phases is used per event-station pair
+    # Optional
+    # - earth_model: Earth model | Default "iasp91"
+    # - pairwise: Combine the i-th event with the i-th station (tables of the
+    #   same length) | Default True
+    #   Use False to combine each event with each station
+    # - n_workers: Number of worker processes | Default number of CPUs
+    #   Use 1 to calculate in the current process
+    # - cache, cache_dir, cache_size: On-disk cache of the travel paths, see
+    #   taup_ray_paths in taup_cache.py | Default True, TAUP_CACHE_DIR,
+    #   TAUP_CACHE_SIZE
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - rays: Dictionary of NumPy arrays, see taup_rays_load
+    #   Event-station pairs without arrival are left out
+
+    phases = list(phases)
+    event_lat = np.asarray(events["latitude"], dtype=float)
+    event_lon = np.asarray(events["longitude"], dtype=float)
+    event_depth = np.asarray(events["depth"], dtype=float)
+    station_names = np.asarray(stations["station"], dtype=str)
+    station_lat = np.asarray(stations["latitude"], dtype=float)
+    station_lon = np.asarray(stations["longitude"], dtype=float)
+
+    # -------------------------------------------------------------------------
+    # Event-station pairs
+    if pairwise == True:
+        if len(event_lat) != len(station_lat):
+            raise ValueError("events and stations must have the same length")
+        i_event = np.arange(len(event_lat))
+        i_station = np.arange(len(station_lat))
+    else:
+        i_event, i_station = np.meshgrid(
+            np.arange(len(event_lat)), np.arange(len(station_lat)), indexing="ij"
+        )
+        i_event = i_event.ravel()
+        i_station = i_station.ravel()
+
+    receiver_dist, az, _ = taup_pierce_dist_az(
+        event_lat[i_event],
+        event_lon[i_event],
+        station_lat[i_station],
+        station_lon[i_station],
+    )
+
+    # -------------------------------------------------------------------------
+    # TauP calculations, only once per hypocentral depth and epicentral
+    # distance (rounded to avoid floating point noise)
+    combis = np.round(np.column_stack([event_depth[i_event], receiver_dist]), 6)
+    combis_unique, i_combi = np.unique(combis, axis=0, return_inverse=True)
+    i_combi = i_combi.ravel()
+    n_combis = len(combis_unique)
+
+    if n_workers == None:
+        n_workers = os.cpu_count()
+    n_workers = max(1, min(n_workers, n_combis))
+
+    args_combis = (
+        combis_unique[:, 0],
+        combis_unique[:, 1],
+        [phases] * n_combis,
+        [earth_model] * n_combis,
+        [cache] * n_combis,
+        [cache_dir] * n_combis,
+    )
+    if n_combis == 0:
+        paths = []
+    elif n_workers == 1:
+        _worker_init(earth_model)
+        paths = list(map(_worker_path, *args_combis))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_worker_init,
+            initargs=(earth_model,),
+        ) as executor:
+            paths = list(
+                executor.map(
+                    _worker_path,
+                    *args_combis,
+                    chunksize=max(1, n_combis // (4 * n_workers)),
+                )
+            )
+
+    if cache == True and n_combis > 0 and cache_size != None:
+        taup_cache_evict(cache_dir=cache_dir, max_size=cache_size)
+
+    # -------------------------------------------------------------------------
+    # Ragged arrays of all pairs with arrival
+    exists = np.array([path != None for path in paths], dtype=bool)
+    i_pair = np.flatnonzero(exists[i_combi]) if n_combis > 0 else np.array([], int)
+    paths_pair = [paths[i_combi[i]] for i in i_pair]
+
+    n_samples = np.array([len(path[1]) for path in paths_pair], dtype=np.int64)
+    offset = np.zeros(len(paths_pair) + 1, dtype=np.int64)
+    np.cumsum(n_samples, out=offset[1:])
+
+    if len(paths_pair) > 0:
+        dist = np.concatenate([path[1] for path in paths_pair])
+        depth = np.concatenate([path[2] for path in paths_pair])
+    else:
+        dist = np.array([], dtype=float)
+        depth = np.array([], dtype=float)
+
+    # Geographic coordinates of all samples at once
+    lat, lon = taup_pierce_coords(
+        np.repeat(event_lat[i_event[i_pair]], n_samples),
+        np.repeat(event_lon[i_event[i_pair]], n_samples),
+        np.repeat(az[i_pair], n_samples),
+        dist,
+    )
+
+    return _rays_index(
+        {
+            "lon": lon.astype(np.float32),
+            "lat": lat.astype(np.float32),
+            "depth": depth.astype(np.float32),
+            "offset": offset,
+            "event": i_event[i_pair],
+            "station": i_station[i_pair],
+            "phase": np.array([path[0] for path in paths_pair], dtype=str),
+            "stations": station_names,
+        }
+    )
+
+
+def _rays_index(rays):
+    # Add the extent of each ray, reduceat requires rays with samples
+    starts = rays["offset"][:-1]
+    for column in ["lon", "lat", "depth"]:
+        if len(starts) == 0:
+            rays[f"{column}_min"] = np.array([], dtype=np.float32)
+            rays[f"{column}_max"] = np.array([], dtype=np.float32)
+            continue
+        rays[f"{column}_min"] = np.minimum.reduceat(rays[column], starts)
+        rays[f"{column}_max"] = np.maximum.reduceat(rays[column], starts)
+    return rays
+
+
+def taup_rays_save(path_rays, rays):
+    # Store the rays in the folder path_rays
+    os.makedirs(path_rays, exist_ok=True)
+    np.savez(
+        os.path.join(path_rays, "index.npz"),
+        **{
+            column: values
+            for column, values in rays.items()
+            if column not in ["lon", "lat", "depth", "offset"]
+        },
+    )
+    for column in ["lon", "lat", "depth"]:
+        np.save(os.path.join(path_rays, f"{column}.npy"), rays[column])
+    # Write offset last, its existence marks a complete folder
+    np.save(os.path.join(path_rays, "offset.tmp.npy"), rays["offset"])
+    os.replace(
+        os.path.join(path_rays, "offset.tmp.npy"),
+        os.path.join(path_rays, "offset.npy"),
+    )
+
+
+def taup_rays_load(path_rays):
+    # Returns a dictionary with the keys
+    # - "lon", "lat", "depth": Samples of all rays, concatenated, memory-mapped
+    #   | degrees E, degrees N, km
+    # - "offset": Start index of each ray in the sample arrays, with one more
+    #   entry for the end of the last ray
+    # - "event", "station": Row index into the event and station tables
+    # - "phase": Seismological phase per ray
+    # - "stations": Station names
+    # - "lon_min", "lon_max", "lat_min", "lat_max", "depth_min", "depth_max":
+    #   Extent per ray
+    with np.load(os.path.join(path_rays, "index.npz")) as index:
+        rays = {column: index[column] for column in index.files}
+    for column in ["lon", "lat", "depth", "offset"]:
+        rays[column] = np.load(
+            os.path.join(path_rays, f"{column}.npy"), mmap_mode="r"
+        )
+    return rays
+
+
+def taup_rays_select(rays, region=None, min_depth=None, max_depth=None):
+    # Indices of the rays with at least a part inside the region
+    # [lon_min, lon_max, lat_min, lat_max] | degrees and depth range | km
+    # Based on the extent of the rays, i.e., a ray may pass by the region
+    select = np.ones(len(rays["offset"]) - 1, dtype=bool)
+    if region != None:
+        select &= (rays["lon_max"] >= region[0]) & (rays["lon_min"] <= region[1])
+        select &= (rays["lat_max"] >= region[2]) & (rays["lat_min"] <= region[3])
+    if min_depth != None:
+        select &= rays["depth_max"] >= min_depth
+    if max_depth != None:
+        select &= rays["depth_min"] <= max_depth
+    return np.flatnonzero(select)
+
+
+def taup_rays_ray(rays, i_ray):
+    # Samples of one ray as views (no copy): lon, lat, depth
+    start, end = rays["offset"][i_ray], rays["offset"][i_ray + 1]
+    return rays["lon"][start:end], rays["lat"][start:end], rays["depth"][start:end]
+
+
+def taup_rays_parts(rays, i_ray, min_depth=None, max_depth=None):
+    # Parts of one ray within the depth range | km as list of views (no copy)
+    # of lon, lat, depth; e.g. the downgoing and the upgoing part
+    lon, lat, depth = taup_rays_ray(rays, i_ray)
+    inside = np.ones(len(depth), dtype=bool)
+    if min_depth != None:
+        inside &= depth >= min_depth
+    if max_depth != None:
+        inside &= depth <= max_depth
+    # Start and end indices of the contiguous parts
+    edges = np.flatnonzero(np.diff(np.concatenate([[0], inside, [0]]).astype(int)))
+    return [
+        (lon[start:end], lat[start:end], depth[start:end])
+        for start, end in zip(edges[::2], edges[1::2])
+    ]
+
+
+def taup_rays_from_text(files_rays, phase=""):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - files_rays: Text files of rays | list of strings
+    #   - One ray per file with the columns lon,lat,depth (comma-separated)
+    #   - GMT multi-segment files with the columns lon lat (whitespace-
+    #     separated, segments starting with ">"), depth set to 0
+    # Optional
+    # - phase: Seismological phase of all rays | Default ""
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - rays: Dictionary of NumPy arrays, see taup_rays_load; "event" is the
+    #   index of the file, "station" is -1
+
+    segments = []
+    i_files = []
+    for i_file, file_rays in enumerate(files_rays):
+        with open(file_rays) as file_in:
+            lines = file_in.read().splitlines()
+        segment = []
+        for line in lines + [">"]:
+            line = line.strip()
+            if line.startswith(">"):
+                if len(segment) > 0:
+                    segments.append(segment)
+                    i_files.append(i_file)
+                segment = []
+            elif line != "" and not line.startswith("#"):
+                segment.append(line.replace(",", " ").split())
+
+    columns = [np.array(segment, dtype=float) for segment in segments]
+    n_samples = np.array([len(column) for column in columns], dtype=np.int64)
+    offset = np.zeros(len(columns) + 1, dtype=np.int64)
+    np.cumsum(n_samples, out=offset[1:])
+
+    samples = np.zeros((offset[-1], 3), dtype=np.float32)
+    for column, start, end in zip(columns, offset[:-1], offset[1:]):
+        samples[start:end, : min(3, column.shape[1])] = column[:, :3]
+
+    return _rays_index(
+        {
+            "lon": samples[:, 0].copy(),
+            "lat": samples[:, 1].copy(),
+            "depth": samples[:, 2].copy(),
+            "offset": offset,
+            "event": np.array(i_files, dtype=int),
+            "station": np.full(len(columns), -1),
+            "phase": np.full(len(columns), phase),
+            "stations": np.array([], dtype=str),
+        }
+    )
+
+
+# %%
+# -----------------------------------------------------------------------------
+# Examples
+# -----------------------------------------------------------------------------
+# Required for the process pool
+if __name__ == "__main__":
+
+    path_out = "02_your_example_figures"
+
+    events = {
+        "latitude": [-56.04, 51.48, -17.87, 36.77],
+        "longitude": [-25.33, 178.10, -178.51, 141.64],
+        "depth": [33, 36, 580, 44],
+    }
+    stations = {"station": ["BFO"], "latitude": [48.3311], "longitude": [8.3303]}
+
+    rays = taup_rays(events, stations, phases=["SKS"], pairwise=False)
+    taup_rays_save(f"{path_out}/BFO_rays_SKS", rays)
+
+    rays = taup_rays_load(f"{path_out}/BFO_rays_SKS")
+    # Upgoing parts of the rays from the core-mantle boundary to the surface
+    # close to the station
+    for i_ray in taup_rays_select(rays, region=[-30, 50, 20, 80], max_depth=2891):
+        parts = taup_rays_parts(rays, i_ray, max_depth=2891)
+        lon, lat, depth = parts[-1]
+        print(rays["phase"][i_ray], len(depth), lon[0], lat[0], depth[0])
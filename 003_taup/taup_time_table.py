@@ -0,0 +1,294 @@
+# #############################################################################
+# This functions
+# - Calculate a table of travel times via ObsPy and TauP on a grid of
+#   hypocentral depths x epicentral distances x seismological phases
+# - Store the table on disk as NumPy file, read it memory-mapped
+# - Interpolate travel times vectorized for arbitrary depths and distances
+# - Plot travel time curves with one call of Figure.plot per phase
+# - Is related to the function taup_path_curve.py
+# -----------------------------------------------------------------------------
+# Related to
+# - Fröhlich Y., Grund M. & Ritter J. R. R. (2024).
+#   Lateral and vertical variations of seismic anisotropy in the lithosphere-
+#   asthenosphere system underneath Central Europe from long-term splitting
+#   measurements. Geophysical Journal International, 239(1), 112-135.
+#   https://doi.org/10.1093/gji/ggae245.
+# - Fröhlich Y. (2025). Shear wave splitting analysis of long-term data:
+#   Anisotropy studies in the Upper Rhine Graben area, Central Europe.
+#   Dissertation, Karlsruhe Institute of Technology, Geophysical Institute.
+#   https://doi.org/10.5445/IR/1000183786.
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from taup_cache import TAUP_CACHE_DIR, taup_model
+
+
+# Default folder of the travel time tables
+TAUP_TABLE_DIR = os.path.join(TAUP_CACHE_DIR, "tables")
+
+
+# TauPyModel instance of the current worker process
+_worker_model = None
+
+
+def _worker_init(earth_model):
+    global _worker_model
+    _worker_model = taup_model(earth_model)
+
+
+def _worker_times(source_depth, dists, phases):
+    # Travel times for one hypocentral depth | shape (distance, phase)
+    # For phases with several arrivals (triplications) the first one is used
+    times = np.full((len(dists), len(phases)), np.nan)
+    for i_dist, dist in enumerate(dists):
+        arrivals = _worker_model.get_travel_times(
+            source_depth_in_km=source_depth,
+            distance_in_degree=dist,
+            phase_list=phases,
+        )
+        for arrival in arrivals:
+            if arrival.name not in phases:
+                continue
+            i_phase = phases.index(arrival.name)
+            if not arrival.time >= times[i_dist, i_phase]:  # also NaN
+                times[i_dist, i_phase] = arrival.time
+    return times
+
+
+def taup_time_table_build(
+    source_depths,
+    dists,
+    phases,
+    earth_model="iasp91",
+    table_dir=None,
+    n_workers=None,
+    overwrite=False,
+):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - source_depths: Hypocentral depths of the grid | km | sorted ascending
+    # - dists: Epicentral distances of the grid | degrees | sorted ascending
+    # - phases: Seismological phases | list of strings
+    # Optional
+    # - earth_model: Earth model | Default "iasp91"
+    # - table_dir: Folder to store the tables | Default TAUP_TABLE_DIR
+    # - n_workers: Number of worker processes | Default number of CPUs
+    # - overwrite: Calculate again even if the table exists | Default False
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - table: Dictionary, see taup_time_table_load
+
+    if table_dir == None:
+        table_dir = TAUP_TABLE_DIR
+
+    source_depths = np.asarray(source_depths, dtype=float)
+    dists = np.asarray(dists, dtype=float)
+    phases = list(phases)
+
+    # Identify the table by its content
+    key_str = "|".join(
+        [
+            str(earth_model),
+            source_depths.tobytes().hex(),
+            dists.tobytes().hex(),
+            ",".join(phases),
+        ]
+    )
+    key_hash = hashlib.sha1(key_str.encode("utf-8")).hexdigest()[:16]
+    model_name = os.path.splitext(os.path.basename(str(earth_model)))[0]
+    path_table = os.path.join(table_dir, f"{model_name}_{key_hash}")
+
+    if overwrite == False and os.path.isfile(os.path.join(path_table, "times.npy")):
+        return taup_time_table_load(path_table)
+
+    # -------------------------------------------------------------------------
+    # Calculate travel times, one hypocentral depth per task
+    if n_workers == None:
+        n_workers = os.cpu_count()
+    n_workers = max(1, min(n_workers, len(source_depths)))
+
+    if n_workers == 1:
+        _worker_init(earth_model)
+        times_depth = [
+            _worker_times(source_depth, dists, phases)
+            for source_depth in source_depths
+        ]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_worker_init,
+            initargs=(earth_model,),
+        ) as executor:
+            times_depth = list(
+                executor.map(
+                    _worker_times,
+                    source_depths,
+                    [dists] * len(source_depths),
+                    [phases] * len(source_depths),
+                )
+            )
+
+    # Shape (depth, distance, phase)
+    times = np.stack(times_depth).astype(np.float32)
+
+    # -------------------------------------------------------------------------
+    # Store on disk
+    os.makedirs(path_table, exist_ok=True)
+    np.savez(
+        os.path.join(path_table, "axes.npz"),
+        source_depths=source_depths,
+        dists=dists,
+        phases=np.array(phases, dtype=str),
+        earth_model=np.array(str(earth_model)),
+    )
+    # Write times last, its existence marks a complete table
+    np.save(os.path.join(path_table, "times.tmp.npy"), times)
+    os.replace(
+        os.path.join(path_table, "times.tmp.npy"),
+        os.path.join(path_table, "times.npy"),
+    )
+
+    return taup_time_table_load(path_table)
+
+
+def taup_time_table_load(path_table):
+    # Returns a dictionary with the keys
+    # - "times": Travel times, memory-mapped | seconds |
+    #   shape (depth, distance, phase), NaN if the phase does not exist
+    # - "source_depths", "dists", "phases", "earth_model": Axes of the grid
+    with np.load(os.path.join(path_table, "axes.npz")) as axes:
+        table = {
+            "source_depths": axes["source_depths"],
+            "dists": axes["dists"],
+            "phases": [str(phase) for phase in axes["phases"]],
+            "earth_model": str(axes["earth_model"]),
+        }
+    table["times"] = np.load(os.path.join(path_table, "times.npy"), mmap_mode="r")
+    return table
+
+
+def _interp_weights(grid, values):
+    # Indices of the lower grid points and weights of the upper grid points
+    # Values outside of the grid get NaN weights
+    values = np.asarray(values, dtype=float)
+    if len(grid) == 1:
+        index = np.zeros(values.shape, dtype=int)
+        weight = np.where(values == grid[0], 0.0, np.nan)
+        return index, index, weight
+
+    index = np.clip(np.searchsorted(grid, values, side="right") - 1, 0, len(grid) - 2)
+    weight = (values - grid[index]) / (grid[index + 1] - grid[index])
+    weight[(weight < 0) | (weight > 1)] = np.nan
+    return index, index + 1, weight
+
+
+def taup_time_table_query(table, source_depth, dists, phase):
+    # Travel times of one phase for one hypocentral depth and many distances
+    # - Bilinear interpolation between the grid points
+    # - NaN outside of the grid and where the phase does not exist at one of
+    #   the neighboring grid points
+    # Returns a NumPy array with the shape of dists | seconds
+    i_phase = table["phases"].index(phase)
+    times = table["times"][..., i_phase]
+
+    z_low, z_upp, z_weight = _interp_weights(table["source_depths"], [source_depth])
+    x_low, x_upp, x_weight = _interp_weights(table["dists"], np.atleast_1d(dists))
+
+    times_low = times[z_low[0]]
+    times_upp = times[z_upp[0]]
+    times_dist_low = times_low[x_low] * (1 - x_weight) + times_low[x_upp] * x_weight
+    times_dist_upp = times_upp[x_low] * (1 - x_weight) + times_upp[x_upp] * x_weight
+    # Avoid 0 * NaN for distances and depths at the grid points
+    times_dist_low = np.where(x_weight == 0, times_low[x_low], times_dist_low)
+    times_dist_upp = np.where(x_weight == 0, times_upp[x_low], times_dist_upp)
+    times_dist_low = np.where(x_weight == 1, times_low[x_upp], times_dist_low)
+    times_dist_upp = np.where(x_weight == 1, times_upp[x_upp], times_dist_upp)
+
+    if z_weight[0] == 0:
+        return times_dist_low
+    if z_weight[0] == 1:
+        return times_dist_upp
+    return times_dist_low * (1 - z_weight[0]) + times_dist_upp * z_weight[0]
+
+
+def taup_time_curve(
+    fig_curve,
+    table,
+    source_depth,
+    phases,
+    dists=None,
+    thick_line_curve="1p",
+    symbol=False,
+    legend_curve=False,
+):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - fig_curve: PyGMT Figure instance with the travel time plot, e.g. from
+    #   taup_path with time_curve=True
+    # - table: Travel time table, see taup_time_table_build
+    # - source_depth: Hypocentral depth | km
+    # - phases: Seismological phases | list of strings
+    # Optional
+    # - dists: Epicentral distances | degrees | Default grid of the table
+    # - thick_line_curve: Thickness of line for travel time curve | Default "1p"
+    # - symbol: Plot symbols instead of lines | Default False
+    # - legend_curve: Add labels for the legend | Default False
+    # -------------------------------------------------------------------------
+    # Travel time curves are plotted with one call of Figure.plot per phase.
+    # Gaps, i.e., distances where the phase does not exist, are NaN values and
+    # separate the segments of the line.
+
+    from taup_color import taup_color
+    from taup_style import taup_style
+    from taup_symbol import taup_symbol
+
+    phase_colors = taup_color()
+    phase_styles = taup_style()
+    phase_symbols = taup_symbol()
+
+    if dists is None:
+        dists = table["dists"]
+
+    for phase in phases:
+        times = taup_time_table_query(table, source_depth, dists, phase)
+        if np.isnan(times).all():
+            continue
+
+        label = None
+        if legend_curve == True:
+            label = f"{phase}+S0.15c"
+
+        if symbol == True:
+            fig_curve.plot(
+                x=dists,
+                y=times,
+                style=f"{phase_symbols[phase]}0.05c",
+                fill=phase_colors[phase],
+                label=label,
+            )
+        else:
+            fig_curve.plot(
+                x=dists,
+                y=times,
+                pen=f"{thick_line_curve},{phase_colors[phase]},{phase_styles[phase]}",
+                label=label,
+            )
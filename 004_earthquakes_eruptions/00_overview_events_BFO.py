@@ -7,6 +7,7 @@
 # - Updated: 2025/03/28 - Reorganize folder, rewrite code
 # - Updated: 2025/03/29 - Introduce dictionary for events
 # - Updated: 2025/07/31 - Polish code, highlight XKS epicentral distance range
+# - Updated: 2026/10/17 - Move dictionary of events to event_table.py
 # -----------------------------------------------------------------------------
 # Versions
 # - PyGMT v0.16.0 - v0.18.0 -> https://www.pygmt.org
@@ -19,9 +20,12 @@
 # #############################################################################
 
 
-import pandas as pd
 import pygmt as gmt
 
+# Dictionary of events, shared with the event pages of all events, see
+# event_table.py
+from event_table import df_events
+
 # -----------------------------------------------------------------------------
 # General stuff
 # -----------------------------------------------------------------------------
@@ -41,66 +45,6 @@ name_sta = "BFO"
 lon_sta = 8.33
 lat_sta = 48.33
 
-# -----------------------------------------------------------------------------
-# Set up dictionary of events
-df_events = pd.DataFrame(
-    {
-        "event_type": [
-            "eruption",
-            "eruption",
-            "earthquake",
-            "earthquake",
-            "earthquake",
-            "earthquake",
-            "earthquake",
-            "earthquake",
-            "earthquake",
-            "earthquake",
-            "earthquake",  # swarm
-            "earthquake",  # doublet
-        ],
-        "location": [
-            "La Palma",
-            "Tonga",
-            "Esmeraldas",
-            "Turkey, Syria",
-            "Marocco",
-            "Japan",
-            "Taiwan",
-            "Myanmar",
-            "Kamtschatka",
-            "Afghanistan",
-            "Santorini",
-            "Venezuela",
-        ],
-        "date": [
-            "2021/09/19-2021/12/13",
-            "2022/01/14-15",
-            "2022/03/27",
-            "2023/02/06",
-            "2023/09/08",
-            "2024/01/01",
-            "2024/04/02",
-            "2025/03/28",
-            "2025/07/30",
-            "2025/08/31",
-            "2025/01/27-2025/03/03",
-            "2026/06/24",
-        ],
-        "lon": [
-            -17.84, -175.393, -79.611, 37.042, -8.391, 136.91, 121.562, 95.92,
-            160.324, 70.734, 25.43, -68.53,
-        ],
-        "lat": [
-            28.57, -20.545, -0.904, 37.166, 31.064, 37.23, 23.819, 22.01,
-            52.512, 34.519, 36.42, 10.46,
-        ],
-        "event_id": [
-            "01", "02", "03", "04", "05", "06", "07", "08", "09", "10", "11", "12",
-        ],
-    }
-)
-
 # -----------------------------------------------------------------------------
 # Colors
 color_sta = "255/215/0"
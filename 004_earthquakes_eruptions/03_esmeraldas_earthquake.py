@@ -6,6 +6,7 @@
 # - Updated: 2024/04/23 - Improve coding style
 # - Updated: 2025/03/28 - Reorganize folder, rewrite code
 # - Updated: 2026/02/04 - Use parameter names of PyGMT v0.18.0
+# - Updated: 2026/10/17 - Cache cropped elevation grid, choose resolution by DPI
 # -----------------------------------------------------------------------------
 # Versions
 # - PyGMT v0.18.0 -> https://www.pygmt.org
@@ -20,13 +21,15 @@
 
 import pygmt as gmt
 
+from relief_cache import relief_grid
+
 # -----------------------------------------------------------------------------
 # General stuff
 # -----------------------------------------------------------------------------
 # >>> Adjust for your needs <<<
 fig_name = "03_esmeraldas_earthquake"  # Name of output figure
 dpi_png = 360  # Resolution of output PNG
-grid_res = "01m"  # Resolution of elevation grid
+grid_res = "01m"  # Finest resolution of elevation grid
 grid_reg = "g"  # Registration of elevation grid
 
 # -----------------------------------------------------------------------------
@@ -99,8 +102,12 @@ fig = gmt.Figure()
 fig.basemap(region=region, projection="M15c", frame=["wSnE", "af"])
 
 # -----------------------------------------------------------------------------
-# Download and plot elevation grid
-fig.grdimage(grid=f"@earth_relief_{grid_res}_{grid_reg}", region=region, cmap="oleron")
+# Download (only once, see relief_cache.py) and plot elevation grid
+fig.grdimage(
+    grid=relief_grid(region, grid_res, grid_reg, width=project_main, dpi=dpi_png),
+    region=region,
+    cmap="oleron",
+)
 
 # -----------------------------------------------------------------------------
 # Plot plate boundaries
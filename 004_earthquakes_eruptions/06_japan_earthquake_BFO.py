@@ -9,6 +9,13 @@
 # - Updated: 2024/04/23 - Improve coding style
 # - Updated: 2025/03/28 - Reorganize folder, rewrite code
 # - Updated: 2026/02/04 - Use parameter names of PyGMT v0.18.0
+# - Updated: 2026/10/17 - Use shared taup_path from 003_taup
+# - Updated: 2026/10/17 - Cache waveforms on disk, allow offline runs
+# - Updated: 2026/10/17 - Request and filter only the time window of the phases
+# - Updated: 2026/10/17 - Use local copy of the USGS catalog
+# - Updated: 2026/10/17 - Cache cropped elevation grid, choose resolution by DPI
+# - Updated: 2026/10/17 - Plot seismograms via waveform_panel (decimated, one call per panel)
+# - Updated: 2026/10/17 - Use vectorized geo_distance instead of gps2dist_azimuth
 # -----------------------------------------------------------------------------
 # Versions
 # - PyGMT v0.18.0 -> https://www.pygmt.org
@@ -21,16 +28,32 @@
 # #############################################################################
 
 
+import os
+import sys
+
 import contextily as ctx
 import numpy as np
-import pandas as pd
 import pygmt as gmt
 from obspy import UTCDateTime as utc
-from obspy.clients.fdsn import Client as Client_fdsn
-from obspy.geodetics.base import gps2dist_azimuth
-from obspy.taup import TauPyModel
+
+# Use the shared TauP functions of 003_taup
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "003_taup")
+)
+# Use the shared USGS catalog and geo_distance of 005_global_seismicity
+sys.path.append(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "005_global_seismicity"
+    )
+)
+from taup_cache import taup_model
 from taup_color import taup_color
 from taup_path_curve import taup_path
+from relief_cache import relief_grid
+from geo_distance import geo_distance
+from usgs_catalog import usgs_catalog_get
+from waveform_cache import waveform_get_filtered, waveform_window
+from waveform_panel import waveform_panel
 
 # %%
 # -----------------------------------------------------------------------------
@@ -143,29 +166,14 @@ region_jp = [lon_min, lon_max, lat_min, lat_max]  # "JP+r1"
 # Earthquake data from USGS
 # -----------------------------------------------------------------------------
 # Set up request
+# Read from the local copy of the USGS catalog, only missing time windows are
+# downloaded, see 005_global_seismicity/usgs_catalog.py
 # see https://earthquake.usgs.gov/fdsnws/event/1/
 # last access: 2024/01/04
-url_usgs = "https://earthquake.usgs.gov/fdsnws/event/1/query.csv"
-
 start_date_request = "2000-01-01"
 end_date_request = "2023-12-31"
 min_magnitude_request = "6"
 max_magnitude_request = "10"
-order_records = "time-asc"  # 'magnitude'
-
-url_usgs_request = (
-    url_usgs
-    + "?"
-    + "&".join(
-        [
-            "starttime=" + start_date_request + "%2000:00:00",
-            "endtime=" + end_date_request + "%2000:00:00",
-            "minmagnitude=" + min_magnitude_request,
-            "maxmagnitude=" + max_magnitude_request,
-            "orderby=" + order_records,
-        ]
-    )
-)
 
 eq_catalog_name = (
     "global_seismicity_"
@@ -178,8 +186,14 @@ eq_catalog_name = (
     + max_magnitude_request
 )
 
-# Download data into a pandas DataFrame
-data_eq_raw = pd.read_csv(url_usgs_request)
+# Load data into a pandas DataFrame, only the region around the earthquake
+data_eq_raw = usgs_catalog_get(
+    start_date_request,
+    end_date_request,
+    min_magnitude=min_magnitude_request,
+    max_magnitude=max_magnitude_request,
+    region=region_jp,
+)
 
 # Filter data
 # for magnitude types mw, mwc, mwb, mwr, mww
@@ -213,11 +227,10 @@ sec_after = 120  # seconds
 freq_low = 0.020  # Hz
 freq_upp = 0.150  # Hz
 
-# Choose Earth model for travel time calculation
-earth_model = TauPyModel(model="iasp91")
-
-# Initialize a client object for FDSN web service
-fdsn_client = Client_fdsn("BGR")
+# FDSN data center or folder of a local SDS archive (offline stand-in)
+# Fetched data is cached on disk, see waveform_cache.py
+# Use only the cache via the environment variable WAVEFORM_OFFLINE=1
+waveform_client = "BGR"
 
 # Set Parameters for data request
 station = "BFO"
@@ -225,29 +238,10 @@ network = "GR"
 channel = "BH*"
 location = "*"
 location = ",00"  # location code: test for non or 00
-starttime_req = utc(2024, 1, 1, 0, 0, 0, 0)
-endtime_req = utc(2024, 1, 2, 0, 0, 0, 0)
-
-# -----------------------------------------------------------------------------
-# Request data
-st = fdsn_client.get_waveforms(
-    network,
-    station,
-    location,
-    channel,
-    starttime_req,
-    endtime_req,
-)
 
-# Apply bandpass filter
-st_filtered = st.copy()
-st_filtered = st_filtered.filter(
-    "bandpass",
-    freqmin=freq_low,
-    freqmax=freq_upp,
-    corners=4,
-    zerophase=True,
-)
+# Shared time window around earthquake
+starttime_eq = utc(2024, 1, 1, 7, 0, 0)
+endtime_eq = utc(2024, 1, 1, 9, 0, 0)
 
 
 # %%
@@ -258,8 +252,9 @@ st_filtered = st_filtered.filter(
 # last access: 2023/12/07
 
 # Define Earth model
-taup_model = "iasp91"
-earth_model = TauPyModel(model=taup_model)
+# Loaded only once and shared with taup_path
+earth_model_name = "iasp91"
+earth_model = taup_model(earth_model_name)
 
 # Select desired phase, has to be a list
 taup_phase = ["P", "S", "ScS", "SKS", "SKKS"]
@@ -270,15 +265,12 @@ taup_lat = []
 receiver_lat = center_lat
 receiver_lon = center_lon
 
-# Great circle distance in m, azimuth A->B in degrees, azimuth B->A in degrees
-dist_temp, azi_temp, bazi_temp = gps2dist_azimuth(
-    lat_epi,
-    lon_epi,
-    lat_bfo,
-    lon_bfo,
+# Epicentral distance in degrees, azimuth A->B in degrees, azimuth B->A in
+# degrees on the WGS84 ellipsoid, see geo_distance.py
+dist_temp_m2deg, azi_temp, bazi_temp = (
+    float(value[0, 0])
+    for value in geo_distance(lon_epi, lat_epi, lon_bfo, lat_bfo, ellipsoid=True)
 )
-# Convert meters to degrees
-dist_temp_m2deg = dist_temp / 1000 * (360 / 2 / np.pi / 6371)
 
 arrivals = earth_model.get_travel_times(
     source_depth_in_km=aki_eq_jp["depth"],
@@ -286,6 +278,33 @@ arrivals = earth_model.get_travel_times(
     phase_list=taup_phase,
 )
 
+# -----------------------------------------------------------------------------
+# Request data
+# Only the time window around the phases and the shared time window, padded by
+# the taper for the band pass filter, instead of the whole day
+starttime_req, endtime_req = waveform_window(
+    time_origin,
+    arrivals,
+    sec_before=sec_before,
+    sec_after=sec_after,
+    starttime=starttime_eq,
+    endtime=endtime_eq,
+)
+
+# Apply bandpass filter only to the padded time window
+st_filtered = waveform_get_filtered(
+    network,
+    station,
+    location,
+    channel,
+    starttime_req,
+    endtime_req,
+    freq_low=freq_low,
+    freq_upp=freq_upp,
+    corners=4,
+    client=waveform_client,
+)
+
 
 # %%
 # -----------------------------------------------------------------------------
@@ -298,12 +317,8 @@ fig = gmt.Figure()
 # === Upper Left: Elevation with beachball ===
 fig.basemap(region=region_jp, projection=proj_merca, frame=["WsNe", "af"])
 
-# Add elevation grid
-grid_topo = gmt.datasets.load_earth_relief(
-    region=region_jp,
-    resolution="01m",
-    registration="gridline",
-)
+# Add elevation grid, cropped only once and cached, see relief_cache.py
+grid_topo = relief_grid(region_jp, "01m", "g", width=proj_merca, dpi=dpi_png)
 fig.grdimage(grid_topo, cmap="oleron")
 fig.colorbar(frame=["x+lelevation", "y+lm"])
 
@@ -525,123 +540,64 @@ fig.show()
 fig.shift_origin(xshift="w+3c", yshift="4.8c")
 
 # Cut to shared time window around earthquake
-starttime_eq = utc(2024, 1, 1, 7, 0, 0)
-endtime_eq = utc(2024, 1, 1, 9, 0, 0)
 st_eq = st_filtered.copy()
 st_eq = st_eq.trim(starttime_eq, endtime_eq)
 
-tr_len = len(st_eq[0].data)  # amount of samples
 tr_delta = st_eq[0].stats.delta
-sample_vec = np.arange(0, tr_len, 1)
-y_lim = 1  # normalized
-
-# Shift by difference between cut starttime and origin time
-Dtime_cut_origin = starttime_eq - time_origin
 
+# Rotate, normalize, decimate to the figure resolution, and mark the arrival
+# times of the phases, see waveform_panel.py
 for time_window in ["eq", "phase"]:
     if time_window == "eq":
-        st_used = st_eq
-        sample_show_start = 0
-        sample_show_end = tr_len
-    elif time_window == "phase":
-        # Rotate in LQT coordinate system
-        st_lqt = st_eq.copy()
-        st_lqt = st_lqt.rotate(
-            method="ZNE->LQT",
-            back_azimuth=bazi_temp,
-            inclination=inc,
-        )
-        st_used = st_lqt
-        # Show only time window around SKS phase
-        sample_show_start = 38000  # 24000  # 34000
-        sample_show_end = 44000  # 60000  # 45000
-
-    st_maxs = []
-    for i_tr in range(3):
-        st_maxs.append(abs(st_used[i_tr].data[sample_show_start:sample_show_end]).max())
-    st_max = np.array(st_maxs).max()
-
-    for i_tr in range(3):
-        tr_temp = st_used[i_tr]
-        tr_temp_chan = tr_temp.stats.channel
-        tr_temp_abs_max = abs(tr_temp.data[sample_show_start:sample_show_end]).max()
-
+        rotate = None
+        window = None
         x_f = 6000
-        if time_window == "phase":
-            x_f = 1200
-
-        if i_tr == 0:
-            frame_used = ["Wsne", f"xf{x_f}", "ya"]
-        if i_tr == 1:
-            frame_used = ["Wsne", f"xf{x_f}", "ya+lnorm. amplitude per component"]
-        if i_tr == 2 and time_window == "eq":
-            frame_used = ["WSne", f"xa12000f{x_f}", "ya"]
-        if i_tr == 2 and time_window == "phase":
-            frame_used = [
-                "WSne",
-                f"xa2400f{x_f}",
-                f"x+lsamples after {tr_temp.stats.starttime} (UTC)"
-                + f" with @~D@~t = {tr_delta} s",
-                "ya",
-            ]
-
-        # Use colors as in SplitLab
-        if tr_temp_chan == "BHE" or tr_temp_chan == "BHQ":
-            color_tr = "blue"
-        elif tr_temp_chan == "BHN" or tr_temp_chan == "BHT":
-            color_tr = "red"
-        elif tr_temp_chan == "BHZ" or tr_temp_chan == "BHL":
-            color_tr = "darkgreen"
-
-        fig.basemap(
-            region=[sample_show_start, sample_show_end, -y_lim, y_lim],
-            projection="X16c/2c",
-            frame=frame_used,
-        )
-
-        # Plot seismograms
-        fig.plot(
-            x=sample_vec,
-            y=tr_temp.data / tr_temp_abs_max,
-            pen=f"0.2p,{color_tr}",
-            label=tr_temp_chan,
-        )
-
-        # Mark arrival times of phases and add labels for phase names
-        for i_phase in range(len(arrivals)):
-            phase_text = str(arrivals[i_phase]).split(" ")[0]
-
-            arrival_time = arrivals[i_phase].time
-            arrival_time_samples = (-1 * Dtime_cut_origin + arrival_time) / tr_delta
-            fig.plot(
-                x=[arrival_time_samples, arrival_time_samples],
-                y=[-y_lim, y_lim],
-                pen="1p," + dict_color_phase[phase_text],
-            )
-
+        frame_last = ["WSne", f"xa12000f{x_f}", "ya"]
         # Add labels for backazimuth, epicentral distance, and used filter
-        if time_window == "eq":
-            for i_label, label in enumerate(
-                [
-                    f"BAZ = {round(bazi_temp, 3)}°",
-                    f"@~D@~ = {round(dist_temp_m2deg, 3)}°",
-                    f"band pass [{freq_low},{freq_upp}] Hz",
-                ]
-            ):
-                if i_tr == i_label:
-                    fig.text(
-                        text=label,
-                        position="TL",
-                        justify="TL",
-                        font=font,
-                        offset="0.3c/-0.3c",
-                        pen="0.5p,gray30",
-                        fill="white@30",
-                        clearance=clearance_standard,
-                    )
-        fig.legend(position="jTR+jTR+o0.1c+w1.5c", box=box_standard)
-
-        fig.shift_origin(yshift="-h-0.5c")
+        labels = [
+            f"BAZ = {round(bazi_temp, 3)}°",
+            f"@~D@~ = {round(dist_temp_m2deg, 3)}°",
+            f"band pass [{freq_low},{freq_upp}] Hz",
+        ]
+    elif time_window == "phase":
+        # Rotate in LQT coordinate system
+        rotate = "LQT"
+        # Show only time window around SKS phase | samples
+        window = [38000, 44000]  # [24000, 60000]  # [34000, 45000]
+        x_f = 1200
+        frame_last = [
+            "WSne",
+            f"xa2400f{x_f}",
+            f"x+lsamples after {st_eq[0].stats.starttime} (UTC)"
+            + f" with @~D@~t = {tr_delta} s",
+            "ya",
+        ]
+        labels = None
+
+    waveform_panel(
+        fig,
+        st_eq,
+        time_reference=time_origin,
+        arrivals=arrivals,
+        window=window,
+        x_unit="samples",
+        rotate=rotate,
+        back_azimuth=bazi_temp,
+        inclination=inc,
+        width="16c",
+        height="2c",
+        dpi=dpi_png,
+        phase_colors=dict_color_phase,
+        frames=[
+            ["Wsne", f"xf{x_f}", "ya"],
+            ["Wsne", f"xf{x_f}", "ya+lnorm. amplitude per component"],
+            frame_last,
+        ],
+        labels=labels,
+        box=box_standard,
+        font=font,
+        clearance=clearance_standard,
+    )
 
     fig.shift_origin(yshift="-h+1.2c")
 
@@ -654,6 +610,7 @@ fig.shift_origin(xshift="-10c", yshift="4c")
 
 # Generate plot for travel paths with self-defined function
 taup_path(
+    earth_model=earth_model_name,
     fig_path_instance=fig,
     fig_path_width="7c",
     max_dist=360,
@@ -7,6 +7,7 @@
 # - Created: 2025/07/30
 # - Updated: 2025/08/03 - Add profile for elevation
 # - Updated: 2025/08/04 - Fix profile for elevation, add plate names and motion direction
+# - Updated: 2026/10/17 - Cache cropped elevation grid, choose resolution by DPI
 # -----------------------------------------------------------------------------
 # Versions
 # - PyGMT v0.18.0 -> https://www.pygmt.org
@@ -21,6 +22,8 @@
 
 import pygmt as gmt
 
+from relief_cache import relief_grid
+
 
 # %%
 # -----------------------------------------------------------------------------
@@ -29,7 +32,7 @@ import pygmt as gmt
 # >>> Adjust for your needs <<<
 fig_name = "09_kamtschatka_earthquake"  # Name of output figure
 dpi_png = 360  # Resolution of output PNG
-grid_res = "03m"  # Resolution of elevation grid
+grid_res = "03m"  # Finest resolution of elevation grid
 grid_reg = "g"  # Registration of elevation grid
 
 # -----------------------------------------------------------------------------
@@ -58,8 +61,8 @@ y_max = 3000
 # File name for plate boundaries after Bird 2003
 file_pb = "plate_boundaries_Bird_2003.txt"
 
-# File name for elevation grid
-grid = f"@earth_relief_{grid_res}_{grid_reg}"
+# File name for elevation grid, cropped once and cached, see relief_cache.py
+grid = relief_grid(region, grid_res, grid_reg, width=projection_main, dpi=dpi_png)
 
 # -----------------------------------------------------------------------------
 # Coordinates of epicenter
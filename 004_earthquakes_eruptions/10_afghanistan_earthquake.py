@@ -8,6 +8,7 @@
 # History
 # - Created: 2025/09/01
 # - Updated: 2026/02/04 - Use parameter names of PyGMT v0.18.0
+# - Updated: 2026/10/17 - Cache cropped elevation grid, choose resolution by DPI
 # -----------------------------------------------------------------------------
 # Versions
 # - PyGMT v0.18.0 -> https://www.pygmt.org
@@ -22,6 +23,8 @@
 
 import pygmt as gmt
 
+from relief_cache import relief_grid
+
 
 # %%
 # -----------------------------------------------------------------------------
@@ -30,7 +33,7 @@ import pygmt as gmt
 # >>> Adjust for your needs <<<
 fig_name = "10_afghanistan_earthquake"  # Name of output figure
 dpi_png = 360  # Resolution of output PNG
-grid_res = "30s"  # Resolution of elevation grid
+grid_res = "30s"  # Finest resolution of elevation grid
 grid_reg = "g"  # Registration of elevation grid
 
 # -----------------------------------------------------------------------------
@@ -59,8 +62,8 @@ y_max = 5000
 # File name for plate boundaries after Bird 2003
 file_pb = "plate_boundaries_Bird_2003.txt"
 
-# File name for elevation grid
-grid = f"@earth_relief_{grid_res}_{grid_reg}"
+# File name for elevation grid, cropped once and cached, see relief_cache.py
+grid = relief_grid(region, grid_res, grid_reg, width=projection_main, dpi=dpi_png)
 
 # -----------------------------------------------------------------------------
 # Coordinates of epicenter
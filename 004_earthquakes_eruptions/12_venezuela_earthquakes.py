@@ -5,6 +5,7 @@
 # -----------------------------------------------------------------------------
 # History
 # - Created: 2026/07/05
+# - Updated: 2026/10/17 - Cache cropped elevation grid, choose resolution by DPI
 # -----------------------------------------------------------------------------
 # Versions
 # - PyGMT v0.18.0 -> https://www.pygmt.org
@@ -20,13 +21,15 @@
 import numpy as np
 import pygmt as gmt
 
+from relief_cache import relief_grid
+
 # -----------------------------------------------------------------------------
 # General stuff
 # -----------------------------------------------------------------------------
 # >>> Adjust for your needs <<<
 fig_name = "12_venezuela_earthquake"  # Name of output figure
 dpi_png = 360  # Resolution of output PNG
-grid_res = "05m"  # Resolution of elevation grid
+grid_res = "05m"  # Finest resolution of elevation grid
 grid_reg = "g"  # Registration of elevation grid
 
 # -----------------------------------------------------------------------------
@@ -83,9 +86,11 @@ fig = gmt.Figure()
 fig.basemap(region=region, projection=projection_main, frame=["wSnE", "af"])
 
 # -----------------------------------------------------------------------------
-# Download and plot elevation grid
+# Download (only once, see relief_cache.py) and plot elevation grid
 fig.grdimage(
-    grid=f"@earth_relief_{grid_res}_{grid_reg}", region=region, cmap="oleron"
+    grid=relief_grid(region, grid_res, grid_reg, width=projection_main, dpi=dpi_png),
+    region=region,
+    cmap="oleron",
 )
 
 # -----------------------------------------------------------------------------
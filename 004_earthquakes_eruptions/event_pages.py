@@ -0,0 +1,446 @@
+# #############################################################################
+# This functions
+# - Produce the standard figures of an event page from one row of df_events
+#   (see event_table.py)
+#   - map: elevation around the epicenter with plate boundaries and beachball
+#   - epi: epicentral distance plot centered on the recording station BFO
+#   - seismograms: band pass filtered seismograms at BFO in the ZNE and around
+#     the SKS phase (or the first arrival) in the LQT coordinate system, with
+#     marks at the arrival times of the phases
+#   - taup: travel paths of the phases via taup_path of 003_taup
+# - Seismograms and travel paths only for events with origin time and
+#   hypocentral depth, beachball only for events with focal mechanism
+# - Build the event pages of all events in one run over a process pool, each
+#   worker builds the pages of whole events
+# -----------------------------------------------------------------------------
+# Usage
+#   python event_pages.py [--events 06 07] [--n-workers 4] [--show]
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Versions
+# - PyGMT v0.18.0 -> https://www.pygmt.org
+# - GMT 6.6.0 -> https://www.generic-mapping-tools.org
+# - ObsPy >= 1.4 -> https://docs.obspy.org
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import argparse
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+# Use the shared TauP functions of 003_taup
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "003_taup")
+)
+# Use the shared geo_distance of 005_global_seismicity
+sys.path.append(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "005_global_seismicity"
+    )
+)
+from event_table import df_events
+from geo_distance import geo_distance
+from taup_cache import taup_model
+from relief_cache import relief_grid
+from waveform_cache import waveform_get_filtered, waveform_window
+from waveform_panel import waveform_panel
+
+
+# %%
+# -----------------------------------------------------------------------------
+# General stuff
+# -----------------------------------------------------------------------------
+# >>> Adjust for your needs <<<
+dpi_png = 360  # Resolution of output PNG
+
+# Paths
+path_in = os.path.join(os.path.dirname(os.path.abspath(__file__)), "01_in_data")
+path_out = os.path.join(os.path.dirname(os.path.abspath(__file__)), "02_out_figs")
+
+# File name for plate boundaries after Bird 2003
+file_pb = "plate_boundaries_Bird_2003.txt"
+
+# Recording station, here Black Forest Observatory BFO
+name_sta = "BFO"
+lon_sta = 8.33
+lat_sta = 48.33
+
+# -----------------------------------------------------------------------------
+# Colors
+color_sta = "255/215/0"  # station # -> GMT gold
+color_eq = "255/90/0"  # earthquake # -> orange
+color_pd = "216.750/82.875/24.990"  # plate boundaries # -> dark orange
+color_sl = "darkgray"  # shorelines
+color_land = "gray90"
+color_water = "steelblue"
+
+# Standards
+font = "9p"
+pen_epi = "0.5p,black"
+box_standard = "+gwhite@30+p0.5p,gray30+r1.5p"
+clearance_standard = "0.1c/0.1c+tO"
+
+# -----------------------------------------------------------------------------
+# Region and projections
+map_size = "10c"
+region_half_width = 5  # degrees around the epicenter
+epi_min = 90  # degrees | Epicentral distance range for XKS phases
+epi_max = 150
+epi_plot = 160
+
+# -----------------------------------------------------------------------------
+# Seismological data
+earth_model_name = "iasp91"
+taup_phase = ["P", "S", "ScS", "SKS", "SKKS"]
+sec_before = 20  # seconds
+sec_after = 120  # seconds
+freq_low = 0.020  # Hz
+freq_upp = 0.150  # Hz
+waveform_client = "BGR"  # see waveform_cache.py
+network = "GR"
+channel = "BH*"
+location = ",00"
+
+
+# %%
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+def event_name(event):
+    # File name of the event page, e.g. "06_japan"
+    location_slug = re.sub(r"[^a-z0-9]+", "_", event["location"].lower()).strip("_")
+    return f"{event['event_id']}_{location_slug}"
+
+
+def event_has_origin(event):
+    return pd.notna(event["time_origin"]) and pd.notna(event["depth"])
+
+
+def event_has_meca(event):
+    return all(
+        pd.notna(event[key]) for key in ["strike", "dip", "rake", "magnitude", "depth"]
+    )
+
+
+def event_arrivals(event):
+    # Epicentral distance, backazimuth, and TauP arrivals at the station
+    # Epicentral distance in degrees and backazimuth on the WGS84 ellipsoid
+    dist_deg, _, baz = (
+        float(value[0, 0])
+        for value in geo_distance(
+            event["lon"], event["lat"], lon_sta, lat_sta, ellipsoid=True
+        )
+    )
+
+    arrivals = taup_model(earth_model_name).get_travel_times(
+        source_depth_in_km=event["depth"],
+        distance_in_degree=dist_deg,
+        phase_list=taup_phase,
+    )
+    return dist_deg, baz, arrivals
+
+
+# %%
+# -----------------------------------------------------------------------------
+# Figures
+# -----------------------------------------------------------------------------
+def event_map(fig, event):
+    # Elevation around the epicenter with plate boundaries and beachball
+    lon_epi = event["lon"]
+    lat_epi = event["lat"]
+    region = [
+        lon_epi - region_half_width,
+        lon_epi + region_half_width,
+        max(lat_epi - region_half_width, -89),
+        min(lat_epi + region_half_width, 89),
+    ]
+
+    fig.basemap(region=region, projection=f"M{map_size}", frame=["WsNe", "af"])
+    fig.grdimage(
+        grid=relief_grid(region, "01m", "g", width=map_size, dpi=dpi_png),
+        region=region,
+        cmap="oleron",
+    )
+    fig.colorbar(frame=["x+lelevation", "y+lm"])
+    fig.coast(shorelines=f"1/0.01p,{color_sl}")
+    fig.plot(data=f"{path_in}/{file_pb}", pen=f"1p,{color_pd}")
+
+    fig.plot(
+        x=lon_epi,
+        y=lat_epi,
+        style=f"k{path_in}/earthquake.def/1.3c",
+        fill=color_eq,
+        pen=color_eq,
+    )
+    if event_has_meca(event):
+        fig.meca(
+            spec={key: event[key] for key in ["strike", "dip", "rake", "magnitude"]},
+            scale="1c",
+            longitude=lon_epi,
+            latitude=lat_epi,
+            depth=event["depth"],
+            plot_longitude=lon_epi + region_half_width / 2,
+            plot_latitude=lat_epi + region_half_width / 2,
+            compression_fill=color_eq,  # PyGMT v0.18.0
+            offset=pen_epi,
+            outline=pen_epi,
+        )
+
+    fig.text(
+        text=f"{event['location']} | {event['date']}",
+        position="TL",
+        justify="TL",
+        font=font,
+        offset="0.2c/-0.2c",
+        fill="white@30",
+        pen=f"0.5p,{color_eq}",
+        clearance=clearance_standard,
+    )
+
+
+def event_epi(fig, event):
+    # Epicentral distance plot centered on the recording station
+    center_coord = {"x": lon_sta, "y": lat_sta}
+
+    fig.basemap(
+        region="g", projection=f"E{lon_sta}/{lat_sta}/{epi_plot}/{map_size}", frame=True
+    )
+    fig.coast(land=color_land, shorelines=f"1/0.01p,{color_sl}")
+    fig.plot(data=f"{path_in}/{file_pb}", pen=f"0.3p,{color_pd}")
+
+    # Epicentral distance range for XKS phases
+    for epi_limit in [epi_min, epi_max]:
+        fig.plot(style=f"E-{epi_limit * 2}+d", pen=f"1p,{color_sta},-", **center_coord)
+
+    fig.plot(
+        x=event["lon"],
+        y=event["lat"],
+        style=f"k{path_in}/earthquake.def/1.1c",
+        fill=color_eq,
+        pen=color_eq,
+    )
+
+    fig.plot(style="i0.4c", fill=color_sta, pen="0.5p,black", **center_coord)
+    fig.text(
+        text=name_sta,
+        offset="0c/-0.65c",
+        font=font,
+        fill="white@30",
+        pen=f"1p,{color_sta}",
+        clearance=clearance_standard,
+        **center_coord,
+    )
+
+
+def event_seismograms(fig, st, time_origin, dist_deg, baz, arrivals):
+    # Seismograms in the ZNE and around the SKS phase in the LQT coordinate system
+    # Show the SKS phase, otherwise the first arrival
+    arrivals_sks = [arrival for arrival in arrivals if arrival.name == "SKS"]
+    arrival_show = arrivals_sks[0] if len(arrivals_sks) > 0 else arrivals[0]
+
+    for time_window in ["eq", "phase"]:
+        rotate = None
+        window = None
+        labels = [
+            f"BAZ = {round(baz, 3)}° | @~D@~ = {round(dist_deg, 3)}° | "
+            + f"band pass [{freq_low},{freq_upp}] Hz",
+            None,
+            None,
+        ]
+        if time_window == "phase":
+            rotate = "LQT"
+            window = [arrival_show.time - sec_before, arrival_show.time + sec_after]
+            labels = None
+
+        waveform_panel(
+            fig,
+            st,
+            time_reference=time_origin,
+            arrivals=arrivals,
+            window=window,
+            rotate=rotate,
+            back_azimuth=baz,
+            inclination=arrival_show.incident_angle,
+            components=["ZL", "NQ", "ET"],
+            dpi=dpi_png,
+            frames=[
+                ["Wsne", "xaf", "ya"],
+                ["Wsne", "xaf", "ya"],
+                ["WSne", "xaf+ltime after origin time / s", "ya"],
+            ],
+            labels=labels,
+            box=box_standard,
+            font=font,
+            clearance=clearance_standard,
+        )
+
+        fig.shift_origin(yshift="-h+1.2c")
+
+
+# %%
+# -----------------------------------------------------------------------------
+# Event pages
+# -----------------------------------------------------------------------------
+def event_page(event, fig_show=False, fig_save=True, figures_out=None):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - event: Row of df_events | pandas Series or dictionary
+    # Optional
+    # - fig_show: Show figures | Default False
+    # - fig_save: Save figures as PNG to path_out | Default True
+    # - figures_out: Figures to produce, from "map", "epi", "seismograms",
+    #   "taup" | Default all possible for the event
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - files: File names of the saved figures | list of strings
+    import pygmt as gmt
+    from obspy import UTCDateTime as utc
+
+    from taup_path_curve import taup_path
+
+    if figures_out == None:
+        figures_out = ["map", "epi", "seismograms", "taup"]
+    if not event_has_origin(event):
+        figures_out = [fig_out for fig_out in figures_out if fig_out in ["map", "epi"]]
+
+    figs = {}
+    if "map" in figures_out:
+        figs["map"] = gmt.Figure()
+        event_map(figs["map"], event)
+    if "epi" in figures_out:
+        figs["epi"] = gmt.Figure()
+        event_epi(figs["epi"], event)
+
+    if "seismograms" in figures_out or "taup" in figures_out:
+        time_origin = utc(event["time_origin"])
+        dist_deg, baz, arrivals = event_arrivals(event)
+
+    if "seismograms" in figures_out and len(arrivals) > 0:
+        starttime_req, endtime_req = waveform_window(
+            time_origin, arrivals, sec_before=sec_before, sec_after=sec_after
+        )
+        st = waveform_get_filtered(
+            network,
+            name_sta,
+            location,
+            channel,
+            starttime_req,
+            endtime_req,
+            freq_low=freq_low,
+            freq_upp=freq_upp,
+            client=waveform_client,
+        )
+        if len(st) >= 3:
+            figs["seismograms"] = gmt.Figure()
+            event_seismograms(
+                figs["seismograms"], st, time_origin, dist_deg, baz, arrivals
+            )
+
+    if "taup" in figures_out:
+        figs["taup"] = gmt.Figure()
+        taup_path(
+            earth_model=earth_model_name,
+            fig_path_instance=figs["taup"],
+            fig_path_width="7c",
+            max_dist=360,
+            font_size="7p",
+            source_depth=event["depth"],
+            receiver_dist=dist_deg,
+            phases=taup_phase,
+            fig_show=False,
+        )
+
+    files = []
+    for fig_out, fig in figs.items():
+        if fig_show == True:
+            fig.show()
+        if fig_save == True:
+            os.makedirs(path_out, exist_ok=True)
+            file_out = f"{path_out}/{event_name(event)}_{fig_out}.png"
+            fig.savefig(fname=file_out, dpi=dpi_png)
+            files.append(file_out)
+    return files
+
+
+def _worker_event_page(event, fig_show, fig_save):
+    # Return the error instead of raising it, to build the other event pages
+    try:
+        return event_page(event, fig_show=fig_show, fig_save=fig_save)
+    except Exception as error:
+        return error
+
+
+def event_pages(events=None, n_workers=None, fig_show=False, fig_save=True):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Optional
+    # - events: Events | pandas DataFrame with the columns of df_events |
+    #   Default df_events
+    # - n_workers: Number of worker processes | Default number of CPUs
+    # - fig_show: Show figures | Default False
+    # - fig_save: Save figures as PNG to path_out | Default True
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - results: File names of the saved figures or the error per event ID |
+    #   dictionary
+    if events is None:
+        events = df_events
+    events = [event for _, event in events.iterrows()]
+    n_events = len(events)
+
+    if n_workers == None:
+        n_workers = os.cpu_count()
+    n_workers = max(1, min(n_workers, n_events))
+
+    args_events = (events, [fig_show] * n_events, [fig_save] * n_events)
+    if n_events == 0:
+        results = []
+    elif n_workers == 1:
+        results = list(map(_worker_event_page, *args_events))
+    else:
+        # One event per task, the events differ strongly in run time
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(_worker_event_page, *args_events))
+
+    return {event["event_id"]: result for event, result in zip(events, results)}
+
+
+# %%
+# -----------------------------------------------------------------------------
+# Run
+# -----------------------------------------------------------------------------
+# Required for the process pool
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Build the event pages")
+    parser.add_argument("--events", nargs="*", default=None)
+    parser.add_argument("--n-workers", type=int, default=None)
+    parser.add_argument("--show", action="store_true")
+    args = parser.parse_args()
+
+    events = df_events
+    if args.events != None:
+        events = df_events[df_events["event_id"].isin(args.events)]
+
+    results = event_pages(events, n_workers=args.n_workers, fig_show=args.show)
+    for event_id, result in results.items():
+        if isinstance(result, Exception):
+            print(f"{event_id}: failed, {type(result).__name__}: {result}")
+        else:
+            print(f"{event_id}: {', '.join(result)}")
@@ -0,0 +1,148 @@
+# #############################################################################
+# This functions
+# - Hold the table of events df_events of 004_earthquakes_eruptions
+# - Read hypocentral depth and focal mechanism of the earthquakes from the
+#   files 01_in_data/meca_*.txt, i.e. the files plotted by the event scripts
+# - Is used by 00_overview_events_BFO.py and event_pages.py
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Versions
+# - pandas >= 2.0 -> https://pandas.pydata.org
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import os
+
+import pandas as pd
+
+
+# Folder of the input data
+_PATH_IN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "01_in_data")
+
+# Columns of the files meca_*.txt used for the table of events
+_MECA_COLUMNS = {"depth": 2, "strike": 3, "dip": 4, "rake": 5, "magnitude": 6}
+
+
+def event_meca(name):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - name: Name of the file 01_in_data/meca_NAME.txt, e.g. "myanmar"; for
+    #   several beachballs the first one (main shock) is used
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - meca: "depth" | km, "strike", "dip", "rake" | degrees, "magnitude" |
+    #   dictionary; None for no name
+    if pd.isna(name):
+        return {key: None for key in _MECA_COLUMNS}
+    with open(os.path.join(_PATH_IN, f"meca_{name}.txt")) as file_meca:
+        for line in file_meca:
+            if line.strip() != "" and not line.startswith("#"):
+                values = line.split()
+                return {key: float(values[i]) for key, i in _MECA_COLUMNS.items()}
+    raise ValueError(f"No beachball in meca_{name}.txt")
+
+
+# -----------------------------------------------------------------------------
+# Set up dictionary of events
+# - time_origin: Origin time (UTC), only for single earthquakes
+# - meca: Name of the file 01_in_data/meca_*.txt with hypocentral depth and
+#   focal mechanism (Aki & Richards convention)
+df_events = pd.DataFrame(
+    {
+        "event_type": [
+            "eruption",
+            "eruption",
+            "earthquake",
+            "earthquake",
+            "earthquake",
+            "earthquake",
+            "earthquake",
+            "earthquake",
+            "earthquake",
+            "earthquake",
+            "earthquake",  # swarm
+            "earthquake",  # doublet
+        ],
+        "location": [
+            "La Palma",
+            "Tonga",
+            "Esmeraldas",
+            "Turkey, Syria",
+            "Marocco",
+            "Japan",
+            "Taiwan",
+            "Myanmar",
+            "Kamtschatka",
+            "Afghanistan",
+            "Santorini",
+            "Venezuela",
+        ],
+        "date": [
+            "2021/09/19-2021/12/13",
+            "2022/01/14-15",
+            "2022/03/27",
+            "2023/02/06",
+            "2023/09/08",
+            "2024/01/01",
+            "2024/04/02",
+            "2025/03/28",
+            "2025/07/30",
+            "2025/08/31",
+            "2025/01/27-2025/03/03",
+            "2026/06/24",
+        ],
+        "lon": [
+            -17.84, -175.393, -79.611, 37.042, -8.391, 136.91, 121.562, 95.92,
+            160.324, 70.734, 25.43, -68.53,
+        ],
+        "lat": [
+            28.57, -20.545, -0.904, 37.166, 31.064, 37.23, 23.819, 22.01,
+            52.512, 34.519, 36.42, 10.46,
+        ],
+        "event_id": [
+            "01", "02", "03", "04", "05", "06", "07", "08", "09", "10", "11", "12",
+        ],
+        "time_origin": [
+            None,
+            None,
+            "2022-03-27T04:28:12",  # source: 01_in_data/info_esmeraldas.txt
+            "2023-02-06T01:17:35",  # source: 01_in_data/info_turkey.txt, (1)
+            "2023-09-08T22:11:02",  # source: 01_in_data/info_morocco.txt
+            "2024-01-01T07:10:09",  # source: 06_japan_earthquake_BFO.py
+            "2024-04-02T23:58:11",  # source: 07_taiwan_earthquake_BFO.py
+            "2025-03-28T06:20:54",  # source: 01_in_data/info_myanmar.txt
+            "2025-07-29T23:24:52",  # source: 01_in_data/info_kamtschatka.txt
+            "2025-08-31T19:17:34",  # source: 01_in_data/info_afghanistan.txt
+            None,
+            "2026-06-24T22:04:34",  # source: 01_in_data/meca_venezuela.txt, label
+        ],
+        "meca": [
+            None,
+            None,
+            "esmeraldas",
+            "turkey",
+            "morocco",
+            "japan",
+            "taiwan",
+            "myanmar",
+            "kamtschatka",
+            "afghanistan",
+            None,
+            "venezuela",
+        ],
+    }
+)
+df_events = pd.concat(
+    [df_events, pd.DataFrame([event_meca(name) for name in df_events["meca"]])],
+    axis=1,
+)
@@ -0,0 +1,139 @@
+# #############################################################################
+# This functions
+# - Cache the elevation grid (GMT remote dataset earth_relief) of a region on
+#   disk, cropped once per region, resolution, and registration via grdcut
+#   and stored as compressed NetCDF (netCDF-4, deflated)
+# - Choose the coarsest resolution of the earth_relief pyramid (01d ... 01s)
+#   which still provides one grid node per pixel for the figure width and DPI,
+#   optionally not finer than a given resolution
+# - Return the file name of the cached grid, usable for grdimage, grdview,
+#   grdtrack, ... like the name of the remote dataset
+# - Is used by the event scripts of 004_earthquakes_eruptions, by
+#   015_santorini_earthquakes_2025/santorini_earthquakes.py, and by
+#   002_paper_FGR_2024/Figure_9 and Figure_10
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Versions
+# - PyGMT v0.16.0 - v0.18.0 -> https://www.pygmt.org
+# - GMT 6.5.0 - 6.6.0 -> https://www.generic-mapping-tools.org
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import os
+import sys
+
+# Use the shared gmt_width of 003_taup
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "003_taup")
+)
+from gmt_length import gmt_width
+
+
+# Default folder of the cache, can be changed via the environment variable
+RELIEF_CACHE_DIR = os.environ.get(
+    "RELIEF_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "gmt-pygmt-plotting", "relief"),
+)
+
+# Resolutions of earth_relief with grid spacing | arc seconds
+# https://www.generic-mapping-tools.org/remote-datasets/earth-relief.html
+RELIEF_RESOLUTIONS = {
+    "01d": 3600,
+    "30m": 1800,
+    "20m": 1200,
+    "15m": 900,
+    "10m": 600,
+    "06m": 360,
+    "05m": 300,
+    "04m": 240,
+    "03m": 180,
+    "02m": 120,
+    "01m": 60,
+    "30s": 30,
+    "15s": 15,
+    "03s": 3,
+    "01s": 1,
+}
+
+def relief_resolution(region, width, dpi=300, finest=None):
+    # Coarsest resolution with at least one grid node per pixel
+    # - region: [lon_min, lon_max, lat_min, lat_max] | degrees
+    # - width: Width of the map or projection, see gmt_width in
+    #   003_taup/gmt_length.py
+    # - dpi: Resolution of the figure | Default 300
+    # - finest: Finest resolution to use, e.g. "01m" | Default "01s"
+    n_pixels = gmt_width(width) / 2.54 * dpi
+    spacing_needed = (region[1] - region[0]) * 3600 / n_pixels
+    spacing_min = RELIEF_RESOLUTIONS[finest] if finest != None else 0
+
+    resolution_used = list(RELIEF_RESOLUTIONS)[-1]
+    for resolution, spacing in RELIEF_RESOLUTIONS.items():
+        if spacing <= spacing_needed or spacing <= spacing_min:
+            resolution_used = resolution
+            break
+    return resolution_used
+
+
+def relief_grid(
+    region,
+    resolution=None,
+    registration=None,
+    width=None,
+    dpi=300,
+    cache_dir=None,
+):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - region: [lon_min, lon_max, lat_min, lat_max] | degrees
+    # Optional
+    # - resolution: Resolution of earth_relief, e.g. "01m"; with width the
+    #   finest resolution to use | Default chosen via width and dpi
+    # - registration: "g" (gridline) or "p" (pixel) | Default "g", always "p"
+    #   for "15s" and "g" for "03s" and "01s" (only these are available)
+    # - width: Width of the map or projection, e.g. "12c" or "M12c", see
+    #   relief_resolution | Default resolution is used as given
+    # - dpi: Resolution of the figure | Default 300
+    # - cache_dir: Folder of the cache | Default RELIEF_CACHE_DIR
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - file_grid: File name of the cached grid (NetCDF)
+    import pygmt
+
+    if cache_dir == None:
+        cache_dir = RELIEF_CACHE_DIR
+    if width != None:
+        resolution = relief_resolution(region, width, dpi=dpi, finest=resolution)
+    elif resolution == None:
+        raise ValueError("Provide the resolution or the width of the map")
+    # Only one registration available for some resolutions
+    if resolution == "15s":
+        registration = "p"
+    elif resolution in ["03s", "01s"] or registration == None:
+        registration = "g"
+
+    region_str = "_".join(f"{coord:g}" for coord in region)
+    file_grid = os.path.join(
+        cache_dir, f"earth_relief_{resolution}_{registration}_{region_str}.nc"
+    )
+    if not os.path.isfile(file_grid):
+        os.makedirs(cache_dir, exist_ok=True)
+        # GMT writes netCDF-4 with deflation (IO_NC4_DEFLATION_LEVEL)
+        file_temp = f"{file_grid[:-3]}.{os.getpid()}.tmp.nc"
+        with pygmt.config(IO_NC4_DEFLATION_LEVEL=5):
+            pygmt.grdcut(
+                grid=f"@earth_relief_{resolution}_{registration}",
+                region=region,
+                outgrid=file_temp,
+            )
+        os.replace(file_temp, file_grid)
+    return file_grid
@@ -0,0 +1,339 @@
+# #############################################################################
+# This functions
+# - Cache waveforms requested via FDSN web services on disk as miniSEED
+# - Store the traces in an SDS (SeisComP Data Structure) archive, one file per
+#   trace id and day:
+#   YEAR/NET/STA/CHAN.D/NET.STA.LOC.CHAN.D.YEAR.DAY
+# - Remember which time windows of which request (client, network, station,
+#   location, channel incl. wildcards) are already fetched, also time windows
+#   without data
+# - Fetch whole days or only the time window needed for one event
+# - Serve later requests, incl. shorter time windows, from disk
+# - Filter only the time window around the phases padded by a taper of some
+#   periods of the lower corner frequency instead of a whole day
+# - Allow offline runs via a local SDS archive as stand-in for the FDSN client
+# - Is used by the scripts 06_japan_earthquake_BFO.py and
+#   07_taiwan_earthquake_BFO.py
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Versions
+# - ObsPy >= 1.4 -> https://docs.obspy.org
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import os
+import urllib.parse
+
+
+# Default folder of the cache, can be changed via the environment variable
+WAVEFORM_CACHE_DIR = os.environ.get(
+    "WAVEFORM_CACHE_DIR",
+    os.path.join(
+        os.path.expanduser("~"), ".cache", "gmt-pygmt-plotting", "waveforms"
+    ),
+)
+# Never use the network if the environment variable is set to 1
+WAVEFORM_OFFLINE = os.environ.get("WAVEFORM_OFFLINE", "0") == "1"
+
+# Seconds per day
+_DAY = 86400
+
+# Initialized clients with the name of the FDSN data center as key
+_waveform_clients = {}
+
+
+def waveform_client(client="BGR"):
+    # Returns an ObsPy client with a get_waveforms method
+    # - Name of an FDSN data center, e.g. "BGR": FDSN client, initialized only
+    #   at the first call (requires network access)
+    # - Folder: SDS client as local stand-in for the FDSN client
+    # - Other objects with get_waveforms are returned unchanged
+    if not isinstance(client, str):
+        return client
+    if os.path.isdir(client):
+        from obspy.clients.filesystem.sds import Client as Client_sds
+
+        return Client_sds(client)
+    if client not in _waveform_clients:
+        from obspy.clients.fdsn import Client as Client_fdsn
+
+        _waveform_clients[client] = Client_fdsn(client)
+    return _waveform_clients[client]
+
+
+def _waveform_client_name(client):
+    if isinstance(client, str):
+        return os.path.basename(os.path.normpath(client))
+    return type(client).__name__
+
+
+def _waveform_request(client, network, station, location, channel, starttime, endtime):
+    # Request each location code of a comma-separated list on its own, as not
+    # supported by the SDS client
+    from obspy import Stream
+    from obspy.clients.fdsn.header import FDSNNoDataException
+
+    st = Stream()
+    for location_code in location.split(","):
+        try:
+            st += waveform_client(client).get_waveforms(
+                network, station, location_code, channel, starttime, endtime
+            )
+        except FDSNNoDataException:
+            pass
+    return st
+
+
+def _waveform_days(starttime, endtime):
+    # Start times of all days (UTC) overlapping with the time window
+    from obspy import UTCDateTime as utc
+
+    day = utc(starttime.date)
+    days = []
+    while day < endtime:
+        days.append(day)
+        day = day + _DAY
+    return days
+
+
+def _waveform_marker(cache_dir, client, network, station, location, channel):
+    # File listing the fetched time windows of a request, one line
+    # "starttime endtime" (timestamps) per window
+    request = ".".join(
+        urllib.parse.quote(code, safe="")
+        for code in [network, station, location, channel]
+    )
+    return os.path.join(
+        cache_dir, "requests", _waveform_client_name(client), f"{request}.txt"
+    )
+
+
+def _waveform_fetched(file_marker):
+    # Fetched time windows of a request, sorted and merged
+    if not os.path.isfile(file_marker):
+        return []
+    with open(file_marker) as file_in:
+        windows = sorted(
+            tuple(float(value) for value in line.split())
+            for line in file_in
+            if line.strip() != ""
+        )
+    windows_merged = []
+    for start, end in windows:
+        if len(windows_merged) > 0 and start <= windows_merged[-1][1]:
+            windows_merged[-1][1] = max(windows_merged[-1][1], end)
+        else:
+            windows_merged.append([start, end])
+    return windows_merged
+
+
+def _waveform_covered(windows, starttime, endtime):
+    # Check if the time window lies within one of the fetched time windows
+    return any(
+        start <= starttime.timestamp and endtime.timestamp <= end
+        for start, end in windows
+    )
+
+
+def _waveform_store(cache_dir, st):
+    # Add the traces to the SDS archive, split into days
+    from obspy import Stream, read
+
+    if len(st) == 0:
+        return
+    starttime = min(tr.stats.starttime for tr in st)
+    endtime = max(tr.stats.endtime for tr in st)
+    for day in _waveform_days(starttime, endtime):
+        st_day = st.slice(day, day + _DAY, nearest_sample=False)
+        for trace_id in sorted({tr.id for tr in st_day}):
+            network, station, location, channel = trace_id.split(".")
+            path_sds = os.path.join(
+                cache_dir,
+                str(day.year),
+                network,
+                station,
+                f"{channel}.D",
+            )
+            file_sds = os.path.join(
+                path_sds, f"{trace_id}.D.{day.year}.{day.julday:03d}"
+            )
+            st_id = Stream(traces=[tr.copy() for tr in st_day if tr.id == trace_id])
+            if os.path.isfile(file_sds):
+                # Already stored via another request or time window
+                st_id += read(file_sds)
+            # Remove overlaps, also with differing data; gaps are kept as
+            # separate traces, as masked arrays can not be written to MiniSEED
+            st_id = st_id.merge(method=1, fill_value=None).split()
+            os.makedirs(path_sds, exist_ok=True)
+            file_temp = f"{file_sds}.{os.getpid()}.tmp"
+            st_id.write(file_temp, format="MSEED")
+            os.replace(file_temp, file_sds)
+
+
+def waveform_get(
+    network,
+    station,
+    location,
+    channel,
+    starttime,
+    endtime,
+    client="BGR",
+    cache=True,
+    cache_dir=None,
+    offline=None,
+    whole_days=True,
+):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - network, station, location, channel: SEED codes, wildcards and comma-
+    #   separated lists as supported by the FDSN client, e.g. location ",00"
+    # - starttime, endtime: Time window | UTCDateTime
+    # Optional
+    # - client: Name of the FDSN data center, folder of a local SDS archive, or
+    #   ObsPy client | Default "BGR"
+    # - cache: Use the on-disk cache | Default True
+    # - cache_dir: Folder of the cache | Default WAVEFORM_CACHE_DIR
+    # - offline: Use only the cache, raise FileNotFoundError for missing time
+    #   windows | Default WAVEFORM_OFFLINE
+    # - whole_days: Fetch whole days to reuse them for other time windows, or
+    #   only the time window itself, e.g. for one event | Default True
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - st: ObsPy Stream trimmed to the time window
+    if cache_dir == None:
+        cache_dir = WAVEFORM_CACHE_DIR
+    if offline == None:
+        offline = WAVEFORM_OFFLINE
+
+    if cache == False:
+        if offline == True:
+            raise FileNotFoundError("Offline without cache")
+        return _waveform_request(
+            client, network, station, location, channel, starttime, endtime
+        )
+
+    # -------------------------------------------------------------------------
+    # Fetch the missing time windows
+    file_marker = _waveform_marker(
+        cache_dir, client, network, station, location, channel
+    )
+    windows_fetched = _waveform_fetched(file_marker)
+    if whole_days == True:
+        windows = [(day, day + _DAY) for day in _waveform_days(starttime, endtime)]
+    else:
+        windows = [(starttime, endtime)]
+    for window_start, window_end in windows:
+        if _waveform_covered(windows_fetched, window_start, window_end):
+            continue
+        if offline == True:
+            raise FileNotFoundError(
+                f"Not cached: {network}.{station}.{location}.{channel} "
+                + f"{window_start} - {window_end}"
+            )
+        st_window = _waveform_request(
+            client, network, station, location, channel, window_start, window_end
+        )
+        _waveform_store(cache_dir, st_window)
+        # Mark also time windows without data as fetched
+        os.makedirs(os.path.dirname(file_marker), exist_ok=True)
+        with open(file_marker, mode="a") as file_out:
+            file_out.write(f"{window_start.timestamp} {window_end.timestamp}\n")
+
+    # -------------------------------------------------------------------------
+    # Read from the SDS archive
+    os.makedirs(cache_dir, exist_ok=True)
+    return _waveform_request(
+        cache_dir, network, station, location, channel, starttime, endtime
+    )
+
+
+def waveform_window(
+    time_origin, arrivals, sec_before=20, sec_after=120, starttime=None, endtime=None
+):
+    # Time window needed around the phases
+    # - time_origin: Origin time of the earthquake | UTCDateTime
+    # - arrivals: TauP arrivals, e.g. of get_travel_times
+    # - sec_before, sec_after: Time before the first and after the last arrival |
+    #   seconds | Default 20 and 120
+    # - starttime, endtime: Time window to cover additionally, e.g. for plotting
+    # Returns starttime, endtime | UTCDateTime
+    times = [arrival.time for arrival in arrivals]
+    window_start = time_origin + min(times) - sec_before
+    window_end = time_origin + max(times) + sec_after
+    if starttime != None:
+        window_start = min(window_start, starttime)
+    if endtime != None:
+        window_end = max(window_end, endtime)
+    return window_start, window_end
+
+
+def waveform_get_filtered(
+    network,
+    station,
+    location,
+    channel,
+    starttime,
+    endtime,
+    freq_low,
+    freq_upp,
+    corners=4,
+    taper_periods=3,
+    client="BGR",
+    cache=True,
+    cache_dir=None,
+    offline=None,
+):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - network, station, location, channel: SEED codes, see waveform_get
+    # - starttime, endtime: Time window, e.g. of waveform_window | UTCDateTime
+    # - freq_low, freq_upp: Corner frequencies of the band pass filter | Hz
+    # Optional
+    # - corners: Corners of the band pass filter | Default 4
+    # - taper_periods: Padding before and after the time window, tapered and
+    #   cut after filtering | periods of freq_low | Default 3
+    # - client, cache, cache_dir, offline: See waveform_get
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - st_filtered: ObsPy Stream filtered (zero phase) and trimmed to the time
+    #   window
+    padding = taper_periods / freq_low
+
+    # Request only the padded time window
+    st_filtered = waveform_get(
+        network,
+        station,
+        location,
+        channel,
+        starttime - padding,
+        endtime + padding,
+        client=client,
+        cache=cache,
+        cache_dir=cache_dir,
+        offline=offline,
+        whole_days=False,
+    )
+
+    st_filtered.detrend("demean")
+    st_filtered.taper(max_percentage=None, max_length=padding, type="hann")
+    st_filtered.filter(
+        "bandpass",
+        freqmin=freq_low,
+        freqmax=freq_upp,
+        corners=corners,
+        zerophase=True,
+    )
+    return st_filtered.trim(starttime, endtime)
@@ -0,0 +1,312 @@
+# #############################################################################
+# This functions
+# - Plot the traces of an ObsPy Stream as panels below each other ("stack",
+#   e.g. ZNE or LQT components) or in one panel with offsets ("section", e.g.
+#   record section of many stations)
+# - Rotate the Stream before plotting (ZNE->LQT or NE->RT)
+# - Normalize all traces in one NumPy operation, per trace or to the maximum
+#   of the Stream, within the shown time window
+# - Decimate the traces to the resolution of the figure via min/max envelope
+#   decimation, i.e. two samples (minimum and maximum) per pixel, keeping the
+#   peak amplitudes
+# - Mark the arrival times of the phases with one GMT call per panel
+# - Is used by the scripts 06_japan_earthquake_BFO.py and
+#   07_taiwan_earthquake_BFO.py and by event_pages.py
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Versions
+# - PyGMT v0.18.0 -> https://www.pygmt.org
+# - GMT 6.6.0 -> https://www.generic-mapping-tools.org
+# - ObsPy >= 1.4 -> https://docs.obspy.org
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import os
+import sys
+
+import numpy as np
+
+# Use the colors of the phases and gmt_length of 003_taup
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "003_taup")
+)
+from gmt_length import gmt_length
+from taup_color import taup_color
+
+
+# Colors per component as in SplitLab
+WAVEFORM_COLORS = {
+    "E": "blue",
+    "Q": "blue",
+    "N": "red",
+    "T": "red",
+    "Z": "darkgreen",
+    "L": "darkgreen",
+    "R": "blue",
+}
+
+
+
+def waveform_rotate(st, rotate=None, back_azimuth=None, inclination=None):
+    # Rotated copy of the Stream
+    # - rotate: None, "LQT" (ZNE->LQT), or "RT" (NE->RT)
+    if rotate == None:
+        return st
+    st = st.copy()
+    if rotate == "LQT":
+        st.rotate(
+            method="ZNE->LQT", back_azimuth=back_azimuth, inclination=inclination
+        )
+    elif rotate == "RT":
+        st.rotate(method="NE->RT", back_azimuth=back_azimuth)
+    else:
+        raise ValueError(f"rotate must be None, 'LQT', or 'RT', not '{rotate}'")
+    return st
+
+
+def waveform_array(st):
+    # Samples of all traces as 2-D array | shape (trace, sample)
+    # - Traces of different length are cut to the shortest one
+    n_samples = min(len(tr.data) for tr in st)
+    return np.vstack([tr.data[:n_samples] for tr in st]).astype(float)
+
+
+def waveform_normalize(data, normalize="trace"):
+    # Normalized samples
+    # - data: Samples | shape (trace, sample)
+    # - normalize: "trace" (each trace to its maximum) or "stream" (all traces
+    #   to the maximum of all traces) | Default "trace"
+    amplitude = np.abs(data).max(axis=1, keepdims=True, initial=0)
+    if normalize == "stream":
+        amplitude = np.full_like(amplitude, amplitude.max(initial=0))
+    amplitude[amplitude == 0] = 1
+    return data / amplitude
+
+
+def waveform_decimate(x, data, n_pixels):
+    # Min/max envelope decimation
+    # - x: Samples of the x axis | shape (sample)
+    # - data: Samples | shape (trace, sample)
+    # - n_pixels: Number of pixels of the x axis
+    # Returns x, data | shape (trace, 2 * n_pixels), minimum and maximum per
+    # pixel in the order of occurrence
+    n_traces, n_samples = data.shape
+    if n_samples <= 2 * n_pixels:
+        return np.broadcast_to(x, data.shape), data
+
+    bin_size = int(np.ceil(n_samples / n_pixels))
+    n_bins = int(np.ceil(n_samples / bin_size))
+    # Pad the last bin with the last sample
+    data_padded = np.pad(data, ((0, 0), (0, n_bins * bin_size - n_samples)), mode="edge")
+    blocks = data_padded.reshape(n_traces, n_bins, bin_size)
+
+    i_min = blocks.argmin(axis=2)
+    i_max = blocks.argmax(axis=2)
+    i_sample = np.stack([np.minimum(i_min, i_max), np.maximum(i_min, i_max)], axis=2)
+    i_sample = i_sample + (np.arange(n_bins) * bin_size)[None, :, None]
+    i_sample = np.minimum(i_sample, n_samples - 1).reshape(n_traces, -1)
+    return x[i_sample], np.take_along_axis(data, i_sample, axis=1)
+
+
+def _waveform_write_segments(file_out, x, y, pens=None):
+    # Write the lines as multi-segment file, pens in the segment headers
+    with open(file_out, mode="w") as file_segments:
+        for i_seg in range(len(x)):
+            header = ">" if pens is None else f"> -W{pens[i_seg]}"
+            file_segments.write(f"{header}\n")
+            np.savetxt(file_segments, np.column_stack([x[i_seg], y[i_seg]]), fmt="%.6g")
+
+
+def waveform_panel(
+    fig,
+    st,
+    time_reference=None,
+    arrivals=None,
+    window=None,
+    x_unit="seconds",
+    rotate=None,
+    back_azimuth=None,
+    inclination=None,
+    components=None,
+    normalize="trace",
+    layout="stack",
+    offsets=None,
+    scale=0.5,
+    width="16c",
+    height="2c",
+    dpi=300,
+    pen_width="0.2p",
+    colors=None,
+    phase_colors=None,
+    frames=None,
+    labels=None,
+    legend=True,
+    box="+gwhite@30+p0.5p,gray30+r1.5p",
+    font="9p",
+    clearance="0.1c/0.1c+tO",
+):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - fig: PyGMT figure instance
+    # - st: ObsPy Stream, all traces with the same sampling rate and start
+    # Optional
+    # - time_reference: Time zero of the x axis for x_unit "seconds" and of the
+    #   arrival times, e.g. origin time | UTCDateTime | Default start of st
+    # - arrivals: TauP arrivals to mark, times relative to time_reference
+    # - window: Shown range of the x axis, normalization within this range |
+    #   [x_min, x_max] in x_unit | Default whole traces
+    # - x_unit: "seconds" (after time_reference) or "samples" (after the
+    #   start of st) | Default "seconds"
+    # - rotate, back_azimuth, inclination: Rotation, see waveform_rotate
+    # - components: Order of the traces by component, e.g. ["ZL", "NQ", "ET"]
+    #   | Default order of st
+    # - normalize: "trace" or "stream", see waveform_normalize | Default "trace"
+    # - layout: "stack" (one panel per trace) or "section" (one panel, traces
+    #   with offsets) | Default "stack"
+    # - offsets: Offsets of the traces for layout "section", e.g. epicentral
+    #   distance | Default index of the trace
+    # - scale: Half height of a trace for layout "section" | units of offsets |
+    #   Default 0.5
+    # - width, height: Size of one panel | Default "16c" and "2c"
+    # - dpi: Resolution of the figure, for the decimation | Default 300
+    # - pen_width: Width of the pen of the traces | Default "0.2p"
+    # - colors: Colors per trace | Default by component, see WAVEFORM_COLORS
+    # - phase_colors: Colors per phase | dictionary | Default taup_color
+    # - frames: Frames per panel | list | Default annotations at the bottom
+    #   panel only
+    # - labels: Texts per panel at the top left corner | list
+    # - legend: Add legend with the channel per panel | Default True
+    # - box, font, clearance: Box of legend, font and clearance of labels
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - st_used: Plotted (rotated) Stream
+    # The origin is shifted below the last panel, as for stacked panels
+    from obspy import Stream
+    from pygmt.helpers import GMTTempFile
+
+    st_used = waveform_rotate(st, rotate, back_azimuth, inclination)
+    if components != None:
+        st_used = Stream(
+            traces=[
+                st_used.select(component=f"[{component}]")[0]
+                for component in components
+            ]
+        )
+    if time_reference == None:
+        time_reference = st_used[0].stats.starttime
+    if phase_colors == None:
+        phase_colors = taup_color()
+
+    # -------------------------------------------------------------------------
+    # x axis and shown window
+    delta = st_used[0].stats.delta
+    data = waveform_array(st_used)
+    n_samples = data.shape[1]
+    x = np.arange(n_samples, dtype=float)
+    # Start of the traces relative to the reference time in x_unit
+    x_start = 0
+    if x_unit == "seconds":
+        x_start = st_used[0].stats.starttime - time_reference
+        x = x * delta + x_start
+    elif x_unit != "samples":
+        raise ValueError(f"x_unit must be 'seconds' or 'samples', not '{x_unit}'")
+    if window == None:
+        window = [x[0], x[-1]]
+    i_start, i_end = np.searchsorted(x, window[0]), np.searchsorted(x, window[1], "right")
+
+    # Normalize and decimate all traces at once
+    data = waveform_normalize(data[:, i_start:i_end], normalize=normalize)
+    n_pixels = int(gmt_length(width) / 2.54 * dpi)
+    x_plot, data_plot = waveform_decimate(x[i_start:i_end], data, n_pixels)
+
+    if colors == None:
+        colors = [WAVEFORM_COLORS.get(tr.stats.channel[-1], "black") for tr in st_used]
+
+    # Arrival times as x values
+    arrivals_x = []
+    if arrivals != None:
+        for arrival in arrivals:
+            arrival_x = arrival.time
+            if x_unit == "samples":
+                arrival_x = (arrival.time - (st_used[0].stats.starttime - time_reference)) / delta
+            arrivals_x.append((arrival_x, phase_colors.get(arrival.name, "black")))
+
+    # -------------------------------------------------------------------------
+    # Panels
+    if layout == "stack":
+        n_panels = len(st_used)
+        y_range = [[-1, 1]] * n_panels
+    elif layout == "section":
+        n_panels = 1
+        if offsets is None:
+            offsets = np.arange(len(st_used))
+        offsets = np.asarray(offsets, dtype=float)[:, None]
+        y_range = [[offsets.min() - 2 * scale, offsets.max() + 2 * scale]]
+    else:
+        raise ValueError(f"layout must be 'stack' or 'section', not '{layout}'")
+    if frames == None:
+        frames = [["Wsne", "xaf", "ya"]] * (n_panels - 1) + [["WSne", "xaf", "ya"]]
+
+    for i_panel in range(n_panels):
+        fig.basemap(
+            region=[window[0], window[1], *y_range[i_panel]],
+            projection=f"X{width}/{height}",
+            frame=frames[i_panel],
+        )
+
+        if layout == "stack":
+            fig.plot(
+                x=x_plot[i_panel],
+                y=data_plot[i_panel],
+                pen=f"{pen_width},{colors[i_panel]}",
+                label=st_used[i_panel].stats.channel if legend == True else None,
+            )
+        else:
+            # All traces with one GMT call
+            with GMTTempFile(suffix=".txt") as tmp_file:
+                _waveform_write_segments(
+                    tmp_file.name,
+                    x_plot,
+                    offsets + scale * data_plot,
+                    pens=[f"{pen_width},{color}" for color in colors],
+                )
+                fig.plot(data=tmp_file.name)
+
+        # Mark arrival times of phases, all with one GMT call
+        if len(arrivals_x) > 0:
+            with GMTTempFile(suffix=".txt") as tmp_file:
+                _waveform_write_segments(
+                    tmp_file.name,
+                    [[arrival_x] * 2 for arrival_x, _ in arrivals_x],
+                    [y_range[i_panel]] * len(arrivals_x),
+                    pens=[f"1p,{color}" for _, color in arrivals_x],
+                )
+                fig.plot(data=tmp_file.name)
+
+        if labels != None and labels[i_panel] != None:
+            fig.text(
+                text=labels[i_panel],
+                position="TL",
+                justify="TL",
+                font=font,
+                offset="0.3c/-0.3c",
+                pen="0.5p,gray30",
+                fill="white@30",
+                clearance=clearance,
+            )
+        if layout == "stack" and legend == True:
+            fig.legend(position="jTR+jTR+o0.1c+w1.5c", box=box)
+
+        fig.shift_origin(yshift="-h-0.5c")
+
+    return st_used
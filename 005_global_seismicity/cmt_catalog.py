@@ -0,0 +1,301 @@
+# #############################################################################
+# This functions
+# - Convert the Harvard CMT catalog (CSV file exported from SplitLab) once into
+#   a binary columnar store (Arrow IPC / Feather, uncompressed, i.e. memory-
+#   mapped without copying), with typed columns and "region" as categorical
+# - Sort the events by time and keep an index of the events sorted by moment
+#   magnitude; epicentral distance, azimuth, and backazimuth per reference
+#   station (e.g. BFO) are stored as table with an index sorted by distance
+# - Rebuild the store only if the CSV file changed
+# - Open only the needed columns and answer range queries for year, moment
+#   magnitude, and epicentral distance via binary search in the indexes
+# - Is used by 005_global_seismicity/seismicity_04_harvardcmt_beachball.py,
+#   seismicity_05_harvardcmt_aki.py, and seismicity_06_harvardcmt_time.py
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Versions
+# - pandas >= 2.0 with pyarrow -> https://pandas.pydata.org
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from geo_distance import geo_distance
+
+
+# Default folder of the store, can be changed via the environment variable
+CMT_CATALOG_DIR = os.environ.get(
+    "CMT_CATALOG_DIR",
+    os.path.join(
+        os.path.expanduser("~"), ".cache", "gmt-pygmt-plotting", "cmt_catalog"
+    ),
+)
+# Default CSV file of the catalog
+CMT_CATALOG_CSV = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "01_in_data",
+    "catalog_harvardcmt_1976to2025_mw4to10.csv",
+)
+
+# Reference stations with longitude and latitude | degrees
+CMT_STATIONS = {
+    "BFO": (8.330, 48.331),  # Black Forest Observatory
+}
+
+# Columns defining the time of the events, for sorting
+_CMT_TIME = ["year", "month", "day", "hour", "minute", "second"]
+
+
+def _cmt_store(file_csv, cache_dir):
+    # Folder of the store of the CSV file
+    name = os.path.splitext(os.path.basename(file_csv))[0]
+    return os.path.join(cache_dir, name)
+
+
+def _cmt_source(file_csv):
+    # Size and modification time of the CSV file, to detect changes
+    stat = os.stat(file_csv)
+    return f"{stat.st_size} {stat.st_mtime_ns}"
+
+
+def _cmt_write_npy(file_npy, array):
+    file_temp = f"{file_npy[:-4]}.{os.getpid()}.tmp.npy"
+    np.save(file_temp, array)
+    os.replace(file_temp, file_npy)
+
+
+def cmt_catalog_build(file_csv=None, cache_dir=None):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Optional
+    # - file_csv: CSV file of the catalog | Default CMT_CATALOG_CSV
+    # - cache_dir: Folder of the store | Default CMT_CATALOG_DIR
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - path_store: Folder of the store with
+    #   - catalog.feather: Events sorted by time
+    #   - index_magnitude.npy: Rows sorted by moment magnitude
+    #   - source.txt: Size and modification time of the CSV file
+    import pyarrow.feather as feather
+
+    if file_csv == None:
+        file_csv = CMT_CATALOG_CSV
+    if cache_dir == None:
+        cache_dir = CMT_CATALOG_DIR
+    path_store = _cmt_store(file_csv, cache_dir)
+    file_source = os.path.join(path_store, "source.txt")
+
+    source = _cmt_source(file_csv)
+    if os.path.isfile(file_source):
+        with open(file_source) as file_in:
+            if file_in.read().strip() == source:
+                return path_store
+
+    df_eq = pd.read_csv(file_csv, sep=",")
+    df_eq = df_eq.sort_values(by=_CMT_TIME, kind="stable").reset_index(drop=True)
+    # Typed columns
+    for column in df_eq.columns:
+        if pd.api.types.is_integer_dtype(df_eq[column]):
+            df_eq[column] = pd.to_numeric(df_eq[column], downcast="integer")
+    if "region" in df_eq.columns:
+        df_eq["region"] = df_eq["region"].astype("category")
+
+    os.makedirs(path_store, exist_ok=True)
+    # Remove outdated tables of the reference stations
+    for file_old in os.listdir(path_store):
+        if file_old.startswith("station_"):
+            os.remove(os.path.join(path_store, file_old))
+    file_catalog = os.path.join(path_store, "catalog.feather")
+    file_temp = f"{file_catalog}.{os.getpid()}.tmp"
+    # One chunk, uncompressed, i.e. columns are read via memory mapping
+    feather.write_feather(
+        df_eq, file_temp, compression="uncompressed", chunksize=max(len(df_eq), 1)
+    )
+    os.replace(file_temp, file_catalog)
+    _cmt_write_npy(
+        os.path.join(path_store, "index_magnitude.npy"),
+        np.argsort(df_eq["magnitude"].to_numpy(), kind="stable").astype(np.int32),
+    )
+    with open(file_source, mode="w") as file_out:
+        file_out.write(source)
+    return path_store
+
+
+def cmt_catalog_open(path_store):
+    # All columns of the store as pyarrow Table, memory-mapped
+    import pyarrow as pa
+
+    return pa.ipc.open_file(
+        pa.memory_map(os.path.join(path_store, "catalog.feather"))
+    ).read_all()
+
+
+def cmt_catalog_count(file_csv=None, cache_dir=None):
+    # Number of events in the catalog
+    return cmt_catalog_open(cmt_catalog_build(file_csv, cache_dir)).num_rows
+
+
+def cmt_catalog_station(path_store, station):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - path_store: Folder of the store, see cmt_catalog_build
+    # - station: Name in CMT_STATIONS or (longitude, latitude) | degrees
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - df_station: "dis", "azi", "bazi" per event in the order of the store |
+    #   degrees | pandas DataFrame
+    # - index_dis: Rows sorted by epicentral distance
+    # Computed on the WGS84 ellipsoid (geo_distance.py), i.e. as the column
+    # "dis" of the CSV file, once per station and stored as
+    # station_NAME_wgs84.feather and station_NAME_wgs84_index_dis.npy
+    import pyarrow.feather as feather
+
+    if isinstance(station, str):
+        name = station
+        lon_sta, lat_sta = CMT_STATIONS[station]
+    else:
+        lon_sta, lat_sta = station
+        name = f"{lon_sta:g}_{lat_sta:g}"
+    file_station = os.path.join(path_store, f"station_{name}_wgs84.feather")
+    file_index = os.path.join(path_store, f"station_{name}_wgs84_index_dis.npy")
+
+    if not os.path.isfile(file_index):
+        table = cmt_catalog_open(path_store).select(["longitude", "latitude"])
+        dis, azi, bazi = geo_distance(
+            table.column("longitude").to_numpy(),
+            table.column("latitude").to_numpy(),
+            lon_sta,
+            lat_sta,
+            ellipsoid=True,
+        )
+        df_station = pd.DataFrame(
+            {
+                "dis": dis[:, 0],
+                "azi": azi[:, 0],
+                "bazi": bazi[:, 0],
+            }
+        )
+        file_temp = f"{file_station}.{os.getpid()}.tmp"
+        feather.write_feather(df_station, file_temp, compression="uncompressed")
+        os.replace(file_temp, file_station)
+        _cmt_write_npy(
+            file_index,
+            np.argsort(df_station["dis"].to_numpy(), kind="stable").astype(np.int32),
+        )
+
+    df_station = feather.read_feather(file_station, memory_map=True)
+    return df_station, np.load(file_index, mmap_mode="r")
+
+
+def _cmt_range(values_sorted, value_min, value_max):
+    # Start and end of the range [value_min, value_max] via binary search
+    start = 0 if value_min == None else np.searchsorted(values_sorted, value_min, "left")
+    end = (
+        len(values_sorted)
+        if value_max == None
+        else np.searchsorted(values_sorted, value_max, "right")
+    )
+    return start, end
+
+
+def _cmt_intersect(rows, rows_index, n_events):
+    # Rows in both, sorted by time
+    mask = np.zeros(n_events, dtype=bool)
+    mask[rows_index] = True
+    return rows[mask[rows]]
+
+
+def cmt_catalog_query(
+    columns=None,
+    year_min=None,
+    year_max=None,
+    min_magnitude=None,
+    max_magnitude=None,
+    min_depth=None,
+    max_depth=None,
+    station=None,
+    dist_min=None,
+    dist_max=None,
+    file_csv=None,
+    cache_dir=None,
+):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Optional
+    # - columns: Columns to read, e.g. ["longitude", "latitude"] | Default all
+    # - year_min, year_max: Time window, both included | years
+    # - min_magnitude, max_magnitude: Range of moment magnitude, both included
+    # - min_depth, max_depth: Range of hypocentral depth, both included | km
+    # - station: Reference station, see cmt_catalog_station; replaces the
+    #   columns "dis", "azi", and "bazi" | Default columns of the CSV file
+    # - dist_min, dist_max: Range of epicentral distance to station, both
+    #   included | degrees
+    # - file_csv, cache_dir: See cmt_catalog_build
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - df_eq: Events sorted by time | pandas DataFrame
+    path_store = cmt_catalog_build(file_csv, cache_dir)
+    table = cmt_catalog_open(path_store)
+    n_events = table.num_rows
+
+    # Time window as range of the rows, as sorted by time
+    row_start, row_end = _cmt_range(
+        table.column("year").to_numpy(), year_min, year_max
+    )
+    rows = np.arange(row_start, row_end)
+
+    # Moment magnitude via the sorted index
+    if min_magnitude != None or max_magnitude != None:
+        index_mag = np.load(os.path.join(path_store, "index_magnitude.npy"), mmap_mode="r")
+        magnitude = table.column("magnitude").to_numpy()
+        start, end = _cmt_range(magnitude[index_mag], min_magnitude, max_magnitude)
+        rows = _cmt_intersect(rows, index_mag[start:end], n_events)
+
+    df_station = None
+    if station != None:
+        df_station, index_dis = cmt_catalog_station(path_store, station)
+        if dist_min != None or dist_max != None:
+            dis = df_station["dis"].to_numpy()
+            start, end = _cmt_range(dis[index_dis], dist_min, dist_max)
+            rows = _cmt_intersect(rows, index_dis[start:end], n_events)
+    elif dist_min != None or dist_max != None:
+        raise ValueError("Provide the station for a range of epicentral distance")
+
+    # Hypocentral depth without index
+    if min_depth != None or max_depth != None:
+        depth = table.column("depth").to_numpy()[rows]
+        mask = np.ones(len(rows), dtype=bool)
+        if min_depth != None:
+            mask &= depth >= min_depth
+        if max_depth != None:
+            mask &= depth <= max_depth
+        rows = rows[mask]
+
+    # Read only the needed columns and rows
+    if columns == None:
+        columns = table.column_names
+    columns_station = []
+    if df_station is not None:
+        columns_station = [column for column in columns if column in df_station.columns]
+    columns_catalog = [column for column in columns if column not in columns_station]
+    df_eq = table.select(columns_catalog).take(rows).to_pandas()
+    for column in columns_station:
+        df_eq[column] = df_station[column].to_numpy()[rows]
+    return df_eq[columns]
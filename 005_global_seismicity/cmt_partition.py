@@ -0,0 +1,124 @@
+# #############################################################################
+# This functions
+# - Assign a depth bin code (np.digitize) and a class code, e.g. the faulting
+#   style based on the rake (np.select), to all events in one vectorized pass
+# - Faulting styles: other, strike-slip left, strike-slip right, dip-slip
+#   normal, dip-slip reverse
+# - Distance classes: closer, farther, and within the epicentral distance range
+#   of the XKS phases
+# - Partition the events by depth bin and class with one stable sort, i.e. the
+#   order within each subset (e.g. descending by magnitude) is kept, and hand
+#   out the subsets as slices (views) of the sorted DataFrame, computed once
+#   and reused for several figures
+# - Is used by 005_global_seismicity/seismicity_04_harvardcmt_beachball.py
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Versions
+# - NumPy >= 1.25 -> https://numpy.org
+# - pandas >= 2.0 -> https://pandas.pydata.org
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import numpy as np
+
+
+# Class codes, index in the list
+CMT_FAULT_CLASSES = ["other", "ssl", "ssr", "dsn", "dsr"]
+CMT_DISTANCE_CLASSES = ["close", "far", "xks"]
+
+
+def cmt_depth_bin(depth_km, depth_edges):
+    # Depth bin code per event, -1 outside of the edges
+    # - depth_km: Hypocentral depth | km
+    # - depth_edges: Edges of the depth bins [depth_min, depth_max[, e.g.
+    #   [0, 10, 20, 30, 50, 100, 600] | km
+    depth_bin = np.digitize(depth_km, depth_edges) - 1
+    depth_bin[depth_bin >= len(depth_edges) - 1] = -1
+    return depth_bin
+
+
+def cmt_fault_class(rake, rake_intval=10):
+    # Faulting style code per event, see CMT_FAULT_CLASSES
+    # - rake: Rake | degrees, [-180, 180]
+    # - rake_intval: Interval considered around the rake value of the faulting
+    #   styles, -/+ | degrees | Default 10
+    rake = np.asarray(rake)
+    return np.select(
+        [
+            np.abs(rake) <= rake_intval,  # strike-slip left
+            np.abs(rake) >= 180 - rake_intval,  # strike-slip right
+            np.abs(rake + 90) <= rake_intval,  # dip-slip normal
+            np.abs(rake - 90) <= rake_intval,  # dip-slip reverse
+        ],
+        [1, 2, 3, 4],
+        default=0,
+    )
+
+
+def cmt_distance_class(dis, dist_min=90, dist_max=150):
+    # Distance class code per event, see CMT_DISTANCE_CLASSES
+    # - dis: Epicentral distance | degrees
+    # - dist_min, dist_max: Distance range of the XKS phases | degrees |
+    #   Default 90 and 150
+    dis = np.asarray(dis)
+    return np.select([dis < dist_min, dis > dist_max], [0, 1], default=2)
+
+
+def cmt_partition(df_eq, depth_bin, event_class=None, n_bins=None, n_classes=1):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - df_eq: Events | pandas DataFrame
+    # - depth_bin: Depth bin code per event, e.g. of cmt_depth_bin
+    # Optional
+    # - event_class: Class code per event, e.g. of cmt_fault_class | Default
+    #   all events in class 0
+    # - n_bins: Number of depth bins | Default maximum code + 1
+    # - n_classes: Number of classes, e.g. len(CMT_FAULT_CLASSES) | Default 1
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - df_bins: Events per depth bin | dictionary with the depth bin code as
+    #   key
+    # - df_groups: Events per depth bin and class | dictionary with (depth bin
+    #   code, class code) as key
+    # All subsets are slices of one sorted DataFrame, events outside the depth
+    # bins (code -1) are dropped; empty subsets are included
+    depth_bin = np.asarray(depth_bin)
+    if event_class is None:
+        event_class = np.zeros(len(depth_bin), dtype=int)
+    event_class = np.asarray(event_class)
+    if n_bins == None:
+        n_bins = int(depth_bin.max(initial=-1)) + 1
+
+    # One combined code, sorted stable to keep the order within the subsets
+    code = np.where(depth_bin >= 0, depth_bin * n_classes + event_class, -1)
+    i_sort = np.argsort(code, kind="stable")
+    code_sorted = code[i_sort]
+    df_sorted = df_eq.iloc[i_sort]
+
+    # Start of each code in the sorted array, incl. -1 and the end
+    bounds = np.searchsorted(code_sorted, np.arange(-1, n_bins * n_classes + 1))
+
+    df_groups = {}
+    for i_bin in range(n_bins):
+        for i_class in range(n_classes):
+            i_code = i_bin * n_classes + i_class + 1
+            df_groups[(i_bin, i_class)] = df_sorted.iloc[
+                bounds[i_code] : bounds[i_code + 1]
+            ]
+    df_bins = {
+        i_bin: df_sorted.iloc[
+            bounds[i_bin * n_classes + 1] : bounds[(i_bin + 1) * n_classes + 1]
+        ]
+        for i_bin in range(n_bins)
+    }
+    return df_bins, df_groups
@@ -0,0 +1,180 @@
+# #############################################################################
+# This functions
+# - Bin epicenters on the sphere into (nearly) equal-area cells: bands of
+#   constant latitude width, each divided into a number of longitude cells
+#   proportional to the cosine of the latitude (igloo-type grid)
+# - Compute per cell with NumPy: number of events, maximum moment magnitude,
+#   summed scalar seismic moment, area, and events per area
+# - Write the non-empty cells as one multi-segment file of polygons with the
+#   value for the colormap in the segment headers, i.e. plotted with one GMT
+#   call; the figure only depends on the number of cells, not of events
+# - Is used by 005_global_seismicity/seismicity_02_usgsfdsn_epicenter.py
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Versions
+# - NumPy >= 1.25 -> https://numpy.org
+# - pandas >= 2.0 -> https://pandas.pydata.org
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import numpy as np
+import pandas as pd
+
+
+# Mean Earth radius | km
+DENSITY_RADIUS = 6371
+
+
+def density_cells(cell_size=2):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Optional
+    # - cell_size: Latitude width of the bands, about the width of the cells |
+    #   degrees | Default 2
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - lat_edges: Edges of the bands | degrees | shape (n_bands + 1)
+    # - n_lon: Number of cells per band | shape (n_bands)
+    # - offset: Index of the first cell of each band | shape (n_bands + 1)
+    n_bands = int(round(180 / cell_size))
+    lat_edges = np.linspace(-90, 90, n_bands + 1)
+    lat_mid = (lat_edges[:-1] + lat_edges[1:]) / 2
+    n_lon = np.maximum(
+        1, np.round(360 * np.cos(np.radians(lat_mid)) / (180 / n_bands))
+    ).astype(int)
+    offset = np.concatenate([[0], np.cumsum(n_lon)])
+    return lat_edges, n_lon, offset
+
+
+def density_index(longitude, latitude, cells):
+    # Cell index per event
+    # - longitude, latitude: Epicenters | degrees
+    # - cells: Output of density_cells
+    lat_edges, n_lon, offset = cells
+    longitude = np.asarray(longitude, dtype=float)
+    latitude = np.asarray(latitude, dtype=float)
+    i_band = np.clip(np.digitize(latitude, lat_edges) - 1, 0, len(n_lon) - 1)
+    i_lon = np.floor(((longitude + 180) % 360) / 360 * n_lon[i_band]).astype(int)
+    i_lon = np.minimum(i_lon, n_lon[i_band] - 1)
+    return offset[i_band] + i_lon
+
+
+def density_grid(longitude, latitude, magnitude=None, cell_size=2):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - longitude, latitude: Epicenters | degrees
+    # Optional
+    # - magnitude: Moment magnitude per event, for "max_mag" and "moment"
+    # - cell_size: See density_cells | degrees | Default 2
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - df_cells: Non-empty cells | pandas DataFrame with the columns
+    #   "lon_min", "lon_max", "lat_min", "lat_max" | degrees
+    #   "count": Number of events
+    #   "max_mag": Maximum moment magnitude
+    #   "moment": Summed scalar seismic moment | N m
+    #   "area": Area of the cell | km^2
+    #   "density": Events per 10^4 km^2
+    cells = density_cells(cell_size)
+    lat_edges, n_lon, offset = cells
+    n_cells = offset[-1]
+    index = density_index(longitude, latitude, cells)
+
+    count = np.bincount(index, minlength=n_cells)
+    max_mag = np.full(n_cells, np.nan)
+    moment = np.zeros(n_cells)
+    if magnitude is not None:
+        magnitude = np.asarray(magnitude, dtype=float)
+        # Maximum per cell via sorting, last value of each cell
+        i_sort = np.lexsort((magnitude, index))
+        index_sorted = index[i_sort]
+        i_last = np.flatnonzero(np.diff(index_sorted, append=n_cells))
+        max_mag[index_sorted[i_last]] = magnitude[i_sort][i_last]
+        # Hanks and Kanamori 1979
+        moment = np.bincount(index, weights=10 ** (1.5 * magnitude + 9.1), minlength=n_cells)
+
+    # Edges of all cells
+    i_band = np.repeat(np.arange(len(n_lon)), n_lon)
+    i_lon = np.arange(n_cells) - offset[i_band]
+    width = 360 / n_lon[i_band]
+    df_cells = pd.DataFrame(
+        {
+            "lon_min": -180 + i_lon * width,
+            "lon_max": -180 + (i_lon + 1) * width,
+            "lat_min": lat_edges[i_band],
+            "lat_max": lat_edges[i_band + 1],
+            "count": count,
+            "max_mag": max_mag,
+            "moment": moment,
+        }
+    )
+    df_cells["area"] = (
+        np.radians(width)
+        * (np.sin(np.radians(df_cells["lat_max"])) - np.sin(np.radians(df_cells["lat_min"])))
+        * DENSITY_RADIUS**2
+    )
+    df_cells["density"] = df_cells["count"] / df_cells["area"] * 1e4
+    return df_cells[df_cells["count"] > 0].reset_index(drop=True)
+
+
+def density_polygons(file_out, df_cells, column="count", log=False, step=1):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - file_out: Name of the multi-segment file
+    # - df_cells: Output of density_grid
+    # Optional
+    # - column: Quantity for the colormap, e.g. "count", "max_mag", "moment",
+    #   "density" | Default "count"
+    # - log: Use the logarithm to base 10 of the quantity | Default False
+    # - step: Spacing of the vertices along the parallels, i.e. the edges
+    #   follow the parallels in all projections | degrees | Default 1
+    # Each cell is one polygon with "-Zvalue" in the segment header
+    values = df_cells[column].to_numpy(dtype=float)
+    if log == True:
+        values = np.log10(values)
+
+    lines = []
+    for lon_min, lon_max, lat_min, lat_max, value in zip(
+        df_cells["lon_min"], df_cells["lon_max"], df_cells["lat_min"], df_cells["lat_max"], values
+    ):
+        lon = np.linspace(lon_min, lon_max, max(2, int(np.ceil((lon_max - lon_min) / step)) + 1))
+        lines.append(f"> -Z{value:g}")
+        lines.extend(f"{lon_temp:g} {lat_min:g}" for lon_temp in lon)
+        lines.extend(f"{lon_temp:g} {lat_max:g}" for lon_temp in lon[::-1])
+    with open(file_out, mode="w") as file_polygons:
+        file_polygons.write("\n".join(lines) + "\n")
+
+
+def density_plot(fig, df_cells, column="count", log=False, pen=None, transparency=None):
+    # Plot the cells with one GMT call, colored by the current colormap
+    # - fig: PyGMT figure instance
+    # - df_cells, column, log: See density_polygons
+    # - pen: Outline of the cells | Default no outline
+    # - transparency: Transparency of the cells | percent
+    from pygmt.helpers import GMTTempFile
+
+    if len(df_cells) == 0:
+        return
+    with GMTTempFile(suffix=".txt") as tmp_file:
+        density_polygons(tmp_file.name, df_cells, column=column, log=log)
+        fig.plot(
+            data=tmp_file.name,
+            cmap=True,
+            close=True,
+            pen=pen,
+            transparency=transparency,
+        )
@@ -0,0 +1,266 @@
+# #############################################################################
+# This functions
+# - Compute epicentral distance, azimuth (event -> station), and backazimuth
+#   (station -> event) for N events and M stations at once via NumPy
+#   broadcasting | shape (N, M)
+# - On a sphere (default) or on the WGS84 ellipsoid (Vincenty's inverse
+#   formula, like ObsPy's gps2dist_azimuth; distance converted to degrees via
+#   the mean Earth radius as done in the scripts)
+# - Cache the results on disk per set of events and stations
+# - Compute the center of a station array on the sphere
+# - Select events within an epicentral distance range, e.g. 90-150 deg for
+#   XKS phases, for each station or the center of an array
+# - Is used by 005_global_seismicity/cmt_catalog.py, meca_cull.py, and
+#   seismicity_02_usgsfdsn_epicenter.py and by
+#   004_earthquakes_eruptions/06_japan_earthquake_BFO.py,
+#   07_taiwan_earthquake_BFO.py, and event_pages.py
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Versions
+# - NumPy >= 1.25 -> https://numpy.org
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import hashlib
+import os
+
+import numpy as np
+
+
+# Default folder of the cache, can be changed via the environment variable
+GEO_DISTANCE_DIR = os.environ.get(
+    "GEO_DISTANCE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "gmt-pygmt-plotting", "geo_distance"),
+)
+
+# Mean Earth radius | km
+GEO_RADIUS = 6371
+# WGS84 ellipsoid, semi-major axis | m, flattening
+GEO_WGS84_A = 6378137.0
+GEO_WGS84_F = 1 / 298.257223563
+
+
+def _geo_grid(lon_eq, lat_eq, lon_sta, lat_sta):
+    # Coordinates in radians broadcast to shape (N, M)
+    lon_eq = np.radians(np.atleast_1d(np.asarray(lon_eq, dtype=float)))[:, None]
+    lat_eq = np.radians(np.atleast_1d(np.asarray(lat_eq, dtype=float)))[:, None]
+    lon_sta = np.radians(np.atleast_1d(np.asarray(lon_sta, dtype=float)))[None, :]
+    lat_sta = np.radians(np.atleast_1d(np.asarray(lat_sta, dtype=float)))[None, :]
+    return lon_eq, lat_eq, lon_sta, lat_sta
+
+
+def _geo_sphere(lon_eq, lat_eq, lon_sta, lat_sta):
+    # Distance, azimuth, backazimuth on a sphere | radians
+    dlon = lon_sta - lon_eq
+    dist = np.arccos(
+        np.clip(
+            np.sin(lat_eq) * np.sin(lat_sta)
+            + np.cos(lat_eq) * np.cos(lat_sta) * np.cos(dlon),
+            -1,
+            1,
+        )
+    )
+    azi = np.arctan2(
+        np.sin(dlon) * np.cos(lat_sta),
+        np.cos(lat_eq) * np.sin(lat_sta) - np.sin(lat_eq) * np.cos(lat_sta) * np.cos(dlon),
+    )
+    bazi = np.arctan2(
+        -np.sin(dlon) * np.cos(lat_eq),
+        np.cos(lat_sta) * np.sin(lat_eq) - np.sin(lat_sta) * np.cos(lat_eq) * np.cos(dlon),
+    )
+    return dist, azi, bazi
+
+
+def _geo_vincenty(lon_eq, lat_eq, lon_sta, lat_sta, n_iter=200, tolerance=1e-12):
+    # Distance | m, azimuth, backazimuth | radians on the WGS84 ellipsoid
+    # Not converging (nearly antipodal points) -> NaN
+    a = GEO_WGS84_A
+    f = GEO_WGS84_F
+    b = (1 - f) * a
+    shape = np.broadcast(lon_eq, lon_sta).shape
+
+    L = np.broadcast_to(lon_sta - lon_eq, shape).ravel()
+    U1 = np.broadcast_to(np.arctan((1 - f) * np.tan(lat_eq)), shape).ravel()
+    U2 = np.broadcast_to(np.arctan((1 - f) * np.tan(lat_sta)), shape).ravel()
+    sin_U1, cos_U1 = np.sin(U1), np.cos(U1)
+    sin_U2, cos_U2 = np.sin(U2), np.cos(U2)
+
+    def _terms(lam, index):
+        # Terms of the iteration for the elements in index
+        sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+        sin_sigma = np.hypot(
+            cos_U2[index] * sin_lam,
+            cos_U1[index] * sin_U2[index] - sin_U1[index] * cos_U2[index] * cos_lam,
+        )
+        cos_sigma = sin_U1[index] * sin_U2[index] + cos_U1[index] * cos_U2[index] * cos_lam
+        sigma = np.arctan2(sin_sigma, cos_sigma)
+        sin_alpha = np.where(
+            sin_sigma == 0, 0, cos_U1[index] * cos_U2[index] * sin_lam / sin_sigma
+        )
+        cos2_alpha = 1 - sin_alpha**2
+        # Equatorial lines
+        cos_2sigma_m = np.where(
+            cos2_alpha == 0,
+            0,
+            cos_sigma - 2 * sin_U1[index] * sin_U2[index] / cos2_alpha,
+        )
+        return sin_sigma, cos_sigma, sigma, sin_alpha, cos2_alpha, cos_2sigma_m
+
+    # Iterate only the elements not converged yet
+    lam = L.copy()
+    converged = np.zeros(L.shape, dtype=bool)
+    active = np.arange(L.size)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for _ in range(n_iter):
+            sin_sigma, cos_sigma, sigma, sin_alpha, cos2_alpha, cos_2sigma_m = _terms(
+                lam[active], active
+            )
+            C = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+            lam_new = L[active] + (1 - C) * f * sin_alpha * (
+                sigma
+                + C
+                * sin_sigma
+                * (cos_2sigma_m + C * cos_sigma * (-1 + 2 * cos_2sigma_m**2))
+            )
+            done = np.abs(lam_new - lam[active]) < tolerance
+            lam[active] = lam_new
+            converged[active[done]] = True
+            active = active[~done]
+            if active.size == 0:
+                break
+
+        index = np.arange(L.size)
+        sin_sigma, cos_sigma, sigma, sin_alpha, cos2_alpha, cos_2sigma_m = _terms(
+            lam, index
+        )
+        sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+        u2 = cos2_alpha * (a**2 - b**2) / b**2
+        A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+        B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+        delta_sigma = (
+            B
+            * sin_sigma
+            * (
+                cos_2sigma_m
+                + B
+                / 4
+                * (
+                    cos_sigma * (-1 + 2 * cos_2sigma_m**2)
+                    - B / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma**2)
+                    * (-3 + 4 * cos_2sigma_m**2)
+                )
+            )
+        )
+        dist = b * A * (sigma - delta_sigma)
+        azi = np.arctan2(cos_U2 * sin_lam, cos_U1 * sin_U2 - sin_U1 * cos_U2 * cos_lam)
+        # Forward azimuth at the station, reversed
+        bazi = np.arctan2(cos_U1 * sin_lam, -sin_U1 * cos_U2 + cos_U1 * sin_U2 * cos_lam) + np.pi
+
+    dist = np.where(converged, dist, np.nan)
+    return dist.reshape(shape), azi.reshape(shape), bazi.reshape(shape)
+
+
+def geo_distance(lon_eq, lat_eq, lon_sta, lat_sta, ellipsoid=False):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - lon_eq, lat_eq: Epicenters, N values or scalar | degrees
+    # - lon_sta, lat_sta: Stations, M values or scalar | degrees
+    # Optional
+    # - ellipsoid: Use the WGS84 ellipsoid instead of a sphere | Default False
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - dis: Epicentral distance | degrees | shape (N, M)
+    # - azi: Azimuth at the event towards the station | degrees, [0, 360[
+    # - bazi: Backazimuth at the station towards the event | degrees, [0, 360[
+    # For nearly antipodal points on the ellipsoid the values on the sphere are
+    # used
+    grid = _geo_grid(lon_eq, lat_eq, lon_sta, lat_sta)
+    dist, azi, bazi = _geo_sphere(*grid)
+    dis = np.degrees(dist)
+
+    if ellipsoid == True:
+        dist_m, azi_ell, bazi_ell = _geo_vincenty(*grid)
+        ok = np.isfinite(dist_m)
+        # Convert meters to degrees
+        dis = np.where(ok, dist_m / 1000 * (360 / 2 / np.pi / GEO_RADIUS), dis)
+        azi = np.where(ok, azi_ell, azi)
+        bazi = np.where(ok, bazi_ell, bazi)
+
+    return dis, np.degrees(azi) % 360, np.degrees(bazi) % 360
+
+
+def geo_distance_cached(
+    lon_eq, lat_eq, lon_sta, lat_sta, ellipsoid=False, cache_dir=None
+):
+    # geo_distance, stored on disk once per set of events and stations
+    # - cache_dir: Folder of the cache | Default GEO_DISTANCE_DIR
+    if cache_dir == None:
+        cache_dir = GEO_DISTANCE_DIR
+
+    arrays = [
+        np.ascontiguousarray(np.atleast_1d(values), dtype=float)
+        for values in [lon_eq, lat_eq, lon_sta, lat_sta]
+    ]
+    key = hashlib.sha1()
+    for values in arrays:
+        key.update(str(len(values)).encode())
+        key.update(values.tobytes())
+    key.update(b"ellipsoid" if ellipsoid == True else b"sphere")
+    file_cache = os.path.join(cache_dir, f"{key.hexdigest()}.npz")
+
+    if os.path.isfile(file_cache):
+        with np.load(file_cache) as cached:
+            return cached["dis"], cached["azi"], cached["bazi"]
+
+    dis, azi, bazi = geo_distance(*arrays, ellipsoid=ellipsoid)
+    os.makedirs(cache_dir, exist_ok=True)
+    file_temp = f"{file_cache[:-4]}.{os.getpid()}.tmp.npz"
+    np.savez(file_temp, dis=dis, azi=azi, bazi=bazi)
+    os.replace(file_temp, file_cache)
+    return dis, azi, bazi
+
+
+def geo_center(lon_sta, lat_sta):
+    # Center of a station array on the sphere (mean of the unit vectors)
+    # Returns longitude, latitude | degrees
+    lon = np.radians(np.asarray(lon_sta, dtype=float))
+    lat = np.radians(np.asarray(lat_sta, dtype=float))
+    x = np.mean(np.cos(lat) * np.cos(lon))
+    y = np.mean(np.cos(lat) * np.sin(lon))
+    z = np.mean(np.sin(lat))
+    return float(np.degrees(np.arctan2(y, x))), float(np.degrees(np.arctan2(z, np.hypot(x, y))))
+
+
+def geo_window(
+    lon_eq,
+    lat_eq,
+    lon_sta,
+    lat_sta,
+    dist_min=90,
+    dist_max=150,
+    ellipsoid=False,
+    cache=True,
+    cache_dir=None,
+):
+    # Events within the epicentral distance range per station, e.g. for XKS
+    # phases
+    # - dist_min, dist_max: Range, both included | degrees | Default 90 and 150
+    # - cache: Use geo_distance_cached | Default True
+    # Returns boolean array | shape (N, M)
+    if cache == True:
+        dis, _, _ = geo_distance_cached(
+            lon_eq, lat_eq, lon_sta, lat_sta, ellipsoid=ellipsoid, cache_dir=cache_dir
+        )
+    else:
+        dis, _, _ = geo_distance(lon_eq, lat_eq, lon_sta, lat_sta, ellipsoid=ellipsoid)
+    return (dis >= dist_min) & (dis <= dist_max)
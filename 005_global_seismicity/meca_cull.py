@@ -0,0 +1,157 @@
+# #############################################################################
+# This functions
+# - Remove beachballs which are not visible in the figure before plotting via
+#   Figure.meca, i.e. smaller PostScript files and faster rasterization
+# - Project the epicenters to page coordinates of the map (azimuthal
+#   equidistant projection "E", as used for the epicentral distance maps)
+# - Compute the size of the beachballs on the page as done by Figure.meca
+#   (size for magnitude 5 given by scale, linear in the magnitude)
+# - Bucket the beachballs in a grid on the page and drop beachballs fully
+#   covered by one beachball plotted later (on top), up to half a pixel of
+#   the output resolution
+# - Handle several tables plotted one after the other, e.g. the faulting
+#   styles, as one drawing order
+# - Only the drawing order decides: for a table sorted descending by magnitude
+#   (larger beachballs first, smaller on top) hardly any beachball is fully
+#   covered, mainly (nearly) co-located events of similar size; more are
+#   culled over several tables, e.g. the faulting styles
+# - Is used by 005_global_seismicity/seismicity_04_harvardcmt_beachball.py
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Versions
+# - NumPy >= 1.25 -> https://numpy.org
+# - pandas >= 2.0 -> https://pandas.pydata.org
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import os
+import sys
+
+import numpy as np
+
+from geo_distance import geo_distance
+
+# Use the shared gmt_length of 003_taup
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "003_taup")
+)
+from gmt_length import gmt_length
+
+
+def meca_page_xy(longitude, latitude, projection):
+    # Page coordinates of the epicenters relative to the map center | cm
+    # - longitude, latitude: Epicenters | degrees
+    # - projection: Azimuthal equidistant projection of GMT,
+    #   "Elon0/lat0[/horizon]/width", e.g. "E8.33/48.331/180/12c"
+    if not projection.startswith("E"):
+        raise ValueError(
+            f"Only the azimuthal equidistant projection 'E' is supported, not "
+            + f"'{projection}'"
+        )
+    params = projection[1:].split("/")
+    lon0, lat0 = float(params[0]), float(params[1])
+    horizon = float(params[2]) if len(params) == 4 else 180
+    width = gmt_length(params[-1])
+
+    # Epicentral distance and azimuth from the map center on a sphere, see
+    # geo_distance.py
+    dis, _, azi = geo_distance(longitude, latitude, lon0, lat0)
+    azi = np.radians(azi[:, 0])
+    radius = dis[:, 0] / horizon * width / 2
+    return radius * np.sin(azi), radius * np.cos(azi)
+
+
+def meca_visible(x, y, diameter, dpi=300):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - x, y: Page coordinates of the beachballs in drawing order | cm
+    # - diameter: Diameters of the beachballs | cm
+    # Optional
+    # - dpi: Resolution of the output figure | Default 300
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - visible: False for beachballs fully covered by one beachball plotted
+    #   later | boolean array
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    radius = np.asarray(diameter, dtype=float) / 2
+    visible = np.ones(len(x), dtype=bool)
+    if len(x) < 2:
+        return visible
+    tolerance = 2.54 / dpi / 2  # half a pixel
+
+    # A covering beachball lies at most its radius away, i.e. within the
+    # neighboring cells for cells of the size of the largest radius
+    cell_size = radius.max() + tolerance
+    cell_x = np.floor(x / cell_size).astype(int)
+    cell_y = np.floor(y / cell_size).astype(int)
+    cells = {}
+    for i_cell, cell in enumerate(zip(cell_x, cell_y)):
+        cells.setdefault(cell, []).append(i_cell)
+    cells = {cell: np.array(index) for cell, index in cells.items()}
+
+    for (cell_x0, cell_y0), index in cells.items():
+        index_near = np.concatenate(
+            [
+                cells.get((cell_x0 + dx, cell_y0 + dy), np.array([], dtype=int))
+                for dx in (-1, 0, 1)
+                for dy in (-1, 0, 1)
+            ]
+        )
+        dist = np.hypot(
+            x[index, None] - x[None, index_near], y[index, None] - y[None, index_near]
+        )
+        covered = (
+            (dist + radius[index, None] <= radius[None, index_near] + tolerance)
+            & (index_near[None, :] > index[:, None])
+        )
+        visible[index] = ~covered.any(axis=1)
+    return visible
+
+
+def meca_cull(df_layers, projection, scale="12c", dpi=300):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - df_layers: Tables passed to Figure.meca one after the other, with the
+    #   columns "longitude", "latitude", "magnitude" | list of DataFrames
+    # - projection: Projection of the map, see meca_page_xy
+    # Optional
+    # - scale: Size of the beachball for magnitude 5, as for Figure.meca |
+    #   Default "12c"
+    # - dpi: Resolution of the output figure | Default 300
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - df_layers_visible: Tables without the covered beachballs | list of
+    #   DataFrames
+    # - n_culled: Number of removed beachballs
+    n_rows = [len(df_layer) for df_layer in df_layers]
+    if sum(n_rows) == 0:
+        return list(df_layers), 0
+
+    longitude = np.concatenate([df_layer["longitude"].to_numpy() for df_layer in df_layers])
+    latitude = np.concatenate([df_layer["latitude"].to_numpy() for df_layer in df_layers])
+    magnitude = np.concatenate([df_layer["magnitude"].to_numpy() for df_layer in df_layers])
+
+    x, y = meca_page_xy(longitude, latitude, projection)
+    diameter = gmt_length(scale) * magnitude / 5
+    visible = meca_visible(x, y, diameter, dpi=dpi)
+
+    bounds = np.cumsum([0] + n_rows)
+    df_layers_visible = [
+        df_layer[visible[bounds[i_layer] : bounds[i_layer + 1]]]
+        for i_layer, df_layer in enumerate(df_layers)
+    ]
+    return df_layers_visible, int((~visible).sum())
@@ -2,11 +2,15 @@
 # Global seismicity based on the USGS FDSN catalog
 # - Data request using the webservice
 # - Download the data into a pandas DataFrame
+#   Only missing time windows are downloaded into the local copy of the
+#   catalog, see usgs_catalog.py
 # - Write the data to a CSV file
 # -----------------------------------------------------------------------------
 # History
 # - Created: 2025/07/23
 # - Updated: 2025/09/07 - Improve code style and comments
+# - Updated: 2026/10/17 - Use local copy of the USGS catalog
+# - Updated: 2026/10/17 - Download in chunks below the search limit
 # -----------------------------------------------------------------------------
 # Versions
 #   PyGMT v0.16.0 - v0.18.0 -> https://www.pygmt.org
@@ -19,15 +23,15 @@
 # #############################################################################
 
 
-import pandas as pd
+from usgs_catalog import usgs_catalog_get
 
 # %%
 # -----------------------------------------------------------------------------
 # Request earthquake data
 # -----------------------------------------------------------------------------
 # >>> Set for your needs <<<
-# Note the limitation to a search limit of 20000 events
-# Exceeding this limit leads to Error 400: Bad Request
+# The search limit of 20000 events per request is handled by downloading in
+# chunks (concurrently, resumable), see usgs_catalog.py
 
 start_date = "1991-01-01"
 end_date = "2019-12-31"
@@ -45,22 +49,17 @@ path_in = "01_in_data"
 # Set up request using the webservice
 # see https://earthquake.usgs.gov/fdsnws/event/1/
 # last access: 2025/01/26
-url_usgs = "https://earthquake.usgs.gov/fdsnws/event/1/query.csv"
-
-url_usgs_request = url_usgs + "?" + \
-    "&".join([
-        "starttime=" + start_date + "%2000:00:00",
-        "endtime=" + end_date + "%2000:00:00",
-        "minmagnitude=" + min_mag_w,
-        "maxmagnitude=" + max_mag_w,
-        "orderby=" + order_records,
-    ])
+# Webservice and folder of the local copy, see usgs_catalog.py
 
 eq_catalog_name = "usgsfdsn_" + "".join(str(start_date).split("-")) + "to" + \
     "".join(str(end_date).split("-")) + f"_mw{min_mag_w}to{max_mag_w}"
 
 # Download data into a pandas DataFrame
-data_eq_raw = pd.read_csv(url_usgs_request)
+data_eq_raw = usgs_catalog_get(
+    start_date, end_date, min_magnitude=min_mag_w, max_magnitude=max_mag_w
+)
+if order_records == "magnitude":
+    data_eq_raw = data_eq_raw.sort_values(by=["mag"], ascending=False)
 
 # Write data to a CSV file
 # data_eq_raw.to_csv(
@@ -3,6 +3,8 @@
 # - Create geographic map with
 #   - color-coding for the hypocentral depth
 #   - size-coding for the moment magnitude
+#   - or equal-area cells color-coded for the number of events, the maximum
+#     moment magnitude, or the summed seismic moment
 # For making a GIF: https://ezgif.com/maker
 # -----------------------------------------------------------------------------
 # History
@@ -10,6 +12,8 @@
 # - Updated: 2025/07/23
 # - Updated: 2025/09/07 - Improve code style and comments
 # - Updated: 2026/02/21 - Include elevation grid, improve Robinson projection
+# - Updated: 2026/10/17 - Count events in the XKS distance range via geo_distance
+# - Updated: 2026/10/17 - Add density mode with equal-area cells
 # -----------------------------------------------------------------------------
 # Versions
 #   PyGMT v0.16.0 - v0.18.0 -> https://www.pygmt.org
@@ -26,6 +30,9 @@ import numpy as np
 import pandas as pd
 import pygmt
 
+from density_grid import density_grid, density_plot
+from geo_distance import geo_window
+
 # %%
 # -----------------------------------------------------------------------------
 # Set up
@@ -36,7 +43,11 @@ import pygmt
 status_projection = "epi"  ## "robg" | "robd" | "epi" | "ortho"
 
 # Use color- and size-coding for hypocentral depth or moment magnitude, respectively
-status_color = "CMAP"  ## "MONO" | "CMAP"
+# or bin the epicenters into equal-area cells, e.g. for many events
+status_color = "CMAP"  ## "MONO" | "CMAP" | "DENSITY"
+
+# Quantity per cell for status_color "DENSITY"
+status_density = "count"  ## "count" | "max_mag" | "moment"
 
 # Color land and water or add elevation grid
 status_bg = "plain"  ## "plain" | "elevation"
@@ -56,6 +67,7 @@ path_in = "01_in_data"
 path_out = "02_out_figs"
 
 fig_size = 11  # in centimeters
+density_cell = 2  # width of the equal-area cells in degrees
 dpi_png = 360
 
 # -----------------------------------------------------------------------------
@@ -143,6 +155,20 @@ df_eq["mag_scaled"] = np.exp(df_eq["mag"] / 1.7) * 0.0035
 epi_columns = ["longitude", "latitude", "depth", "mag_scaled"]
 df_eq_used = df_eq[epi_columns]
 
+# Number of events within the epicentral distance range for XKS phases per
+# recording station and for the center, all at once, see geo_distance.py
+if status_phase == "YES":
+    xks_sta = geo_window(
+        df_eq_used["longitude"], df_eq_used["latitude"], sta_lon, sta_lat,
+        dist_min=dist_min, dist_max=dist_max,
+    )
+    xks_center = geo_window(
+        df_eq_used["longitude"], df_eq_used["latitude"], lon_center, lat_center,
+        dist_min=dist_min, dist_max=dist_max,
+    )
+    for sta, n_xks in zip(sta_name + [center_text], [*xks_sta.sum(axis=0), xks_center.sum()]):
+        print(f"{sta}: {n_xks}/{len(df_eq_used)} events in [{dist_min},{dist_max}]°")
+
 
 # %%
 # -----------------------------------------------------------------------------
@@ -237,6 +263,50 @@ pygmt.makecpt(cmap="lajolla", series=[0, 500, 1])
 
 # Plot epicenters
 match status_color:
+    case "DENSITY":
+        # Bin epicenters into equal-area cells and plot them as one layer of
+        # polygons, see density_grid.py
+        df_cells = density_grid(
+            df_eq["longitude"], df_eq["latitude"], df_eq["mag"], cell_size=density_cell
+        )
+        match status_density:
+            case "count":
+                density_log = True
+                series = [0, max(1, np.ceil(np.log10(df_cells["count"].max()))), 0.1]
+                cb_label = ["xaf+lnumber of events per cell", "y+llog@-10@-"]
+            case "max_mag":
+                density_log = False
+                series = [min_mag_w, np.ceil(df_cells["max_mag"].max()), 0.1]
+                cb_label = ["xaf+lmaximum moment magnitude per cell"]
+            case "moment":
+                density_log = True
+                series = [
+                    np.floor(np.log10(df_cells["moment"].min())),
+                    np.ceil(np.log10(df_cells["moment"].max())),
+                    0.1,
+                ]
+                cb_label = ["xaf+lseismic moment per cell", "y+llog@-10@-(N m)"]
+        pygmt.makecpt(cmap="lajolla", series=series)
+        density_plot(fig, df_cells, column=status_density, log=density_log)
+
+        # Add colorbar for the quantity per cell
+        with pygmt.config(FONT="14p"):
+            fig.colorbar(
+                frame=cb_label,
+                position="JBC+o0c/1.1c+w5c/0.3c+h+ml",
+                box=box_standard,
+            )
+
+        # Add label for time period
+        fig.text(
+            text=f"{start_date} to {end_date}",
+            font="black",
+            position="BR",
+            offset="-0.6c/-1c",
+            pen="0.8p,gray50",
+            clearance=clearance_standard,
+            no_clip=True,
+        )
     case "MONO":
         fig.plot(data=df_eq_used, style="a0.15c", fill="darkred")
     case "CMAP":
@@ -14,6 +14,9 @@
 # History
 # - Created: 2025/09/08
 # - Updated: 2026/02/04 - Use parameter names of PyGMT v0.18.0
+# - Updated: 2026/10/17 - Partition by depth bin and class in one pass
+# - Updated: 2026/10/17 - Remove beachballs covered by others before plotting
+# - Updated: 2026/10/17 - Read the catalog from the binary columnar store
 # -----------------------------------------------------------------------------
 # Versions
 # - PyGMT v0.18.0 -> https://www.pygmt.org
@@ -27,9 +30,17 @@
 
 
 import numpy as np
-import pandas as pd
 import pygmt as gmt
 
+from cmt_catalog import cmt_catalog_query
+from cmt_partition import (
+    cmt_depth_bin,
+    cmt_distance_class,
+    cmt_fault_class,
+    cmt_partition,
+)
+from meca_cull import meca_cull
+
 # %%
 # -----------------------------------------------------------------------------
 # Adjust for your needs
@@ -55,6 +66,9 @@ if status_color == "xks":
     min_plot_mag = 6  # Needed to observe a clear waveform
     max_plot_mag = 10
 
+# Edges of the depth bins [depth_min, depth_max[
+depth_edges = [0, 10, 20, 30, 50, 100, 600]  # km
+
 # Interval considered for the rake to classify the fault types; -/+ around the rake value
 rake_intval = 10  # degrees
 
@@ -88,6 +102,7 @@ color_dsn = "orange"  # dip-slip normal
 color_dsr = "brown"  # dip-slip reverse
 
 clearance_standard = "0.1c+tO"
+meca_scale = "12c"  # size of beachball for magnitude 5
 x_shift = 0.5
 y_shift = 1.3
 
@@ -146,40 +161,65 @@ match status_color:
 # -----------------------------------------------------------------------------
 # Load data
 # -----------------------------------------------------------------------------
-df_eq_raw = pd.read_csv(f"{path_in}/catalog_harvardcmt_1976to2025_mw4to10.csv", sep=",")
-
-# Keep only relevant columns without depth
-columns = [
-    "year", "month", "day", "hour", "minute", "second", "jday", "dstr",
-    "latitude", "longitude", "azi", "bazi", "dis",
-    "magnitude", "M0", "strike", "dip", "rake", "region",
-]
-df_eq_mod = df_eq_raw[columns]
-
 # Quantity used for color-coding by Figure.meca has to be in the "depth" column
 quantity_for_color = status_color
 if status_color in ["fault", "xks"]:
     quantity_for_color = "depth"
-df_eq_mod["depth"] = df_eq_raw[quantity_for_color]
-df_eq_mod["depth_km"] = df_eq_raw["depth"]  # hypocentral depth
 
-df_eq = df_eq_mod
+# Read only the relevant columns from the binary store of the catalog (converted
+# once from the CSV file) and subset based on year and moment magnitude via the
+# indexes, epicentral distance to the center of the map (WGS84 ellipsoid, as the
+# column "dis" of the CSV file), see cmt_catalog.py
+columns = [
+    "year", "latitude", "longitude", "dis",
+    "depth", "magnitude", "strike", "dip", "rake",
+]
+df_eq_raw = cmt_catalog_query(
+    columns=columns,
+    year_min=year_min,
+    year_max=year_max,
+    min_magnitude=min_plot_mag,
+    max_magnitude=max_plot_mag,
+    station=(lon_center, lat_center),
+    file_csv=f"{path_in}/catalog_harvardcmt_1976to2025_mw4to10.csv",
+)
+
+df_eq_sel = df_eq_raw.copy()
+df_eq_sel["depth_km"] = df_eq_raw["depth"]  # hypocentral depth
+df_eq_sel["depth"] = df_eq_raw[quantity_for_color]
 # Sort descending by magnitude to avoid overplotting
-df_eq = df_eq.sort_values(by=["magnitude"], ascending=False)
-
-# Subset based on year
-df_eq_temp00 = df_eq[df_eq["year"] >= year_min]
-df_eq_temp01 = df_eq_temp00[df_eq_temp00["year"] <= year_max]
-
-# Subset based on moment magnitude
-df_eq_temp02 = df_eq_temp01[df_eq_temp01["magnitude"] >= min_plot_mag]
-df_eq_temp03 = df_eq_temp02[df_eq_temp02["magnitude"] <= max_plot_mag]
+df_eq_sel = df_eq_sel.sort_values(by=["magnitude"], ascending=False)
 # Scale moment magnitude for plotting
-df_eq_temp03["magnitude"] = np.exp(df_eq_temp03["magnitude"] / 1.7) * 0.0035
+df_eq_sel["magnitude"] = np.exp(df_eq_sel["magnitude"] / 1.7) * 0.0035
 
 fig_name_basic = f"map_harvardcmt_{year_min}to{year_max}_" + \
                     f"mw{min_plot_mag}to{max_plot_mag}_beachball_"
 
+# Depth bin and class of all events in one pass, the subsets are computed only
+# once and used for the single and the merge figures, see cmt_partition.py
+depth_bin = cmt_depth_bin(df_eq_sel["depth_km"].to_numpy(), depth_edges)
+match status_color:
+    # rake
+    case "fault":
+        event_class = cmt_fault_class(df_eq_sel["rake"], rake_intval)
+        # other, strike-slip left, strike-slip right, dip-slip normal and reverse
+        colors_class = [color_meca, color_ssl, color_ssr, color_dsn, color_dsr]
+    # epicentral distance
+    case "xks":
+        event_class = cmt_distance_class(df_eq_sel["dis"], dist_min, dist_max)
+        # closer, farther, and within the range for XKS phases
+        colors_class = [color_meca, color_meca, color_hl]
+    case _:
+        event_class = None
+        colors_class = [None]
+df_bins, df_groups = cmt_partition(
+    df_eq_sel,
+    depth_bin,
+    event_class,
+    n_bins=len(depth_edges) - 1,
+    n_classes=len(colors_class),
+)
+
 
 # %%
 # -----------------------------------------------------------------------------
@@ -188,40 +228,22 @@ fig_name_basic = f"map_harvardcmt_{year_min}to{year_max}_" + \
 
 fig_merge = gmt.Figure()
 
-for depth_min, depth_max in zip([0, 10, 20, 30, 50, 100], [10, 20, 30, 50, 100, 600]):
+for i_bin, (depth_min, depth_max) in enumerate(zip(depth_edges[:-1], depth_edges[1:])):
 
     # Subset based on hypocentral depth
-    df_eq_used = []
-    df_eq_temp04 = df_eq_temp03[df_eq_temp03["depth_km"] >= depth_min]
-    df_eq_used = df_eq_temp04[df_eq_temp04["depth_km"] < depth_max]
-
-    # Subsets based on
-    if len(df_eq_used) > 0:
-        match status_color:
-            # rake
-            case "fault":
-                # strike-slip left
-                df_eq_ssl_temp = df_eq_used[df_eq_used["rake"] >= 0 - rake_intval]
-                if len(df_eq_ssl_temp) > 0:
-                    df_eq_ssl = df_eq_ssl_temp[df_eq_ssl_temp["rake"] <= 0 + rake_intval]
-                # strike-slip right
-                df_eq_ssr_01 = df_eq_used[df_eq_used["rake"] >= 180 - rake_intval]
-                df_eq_ssr_02 = df_eq_used[df_eq_used["rake"] <= -180 + rake_intval]
-                # dip-slip normal
-                df_eq_dsn_temp = df_eq_used[df_eq_used["rake"] <= -90 + rake_intval]
-                if len(df_eq_dsn_temp) > 0:
-                    df_eq_dsn = df_eq_dsn_temp[df_eq_dsn_temp["rake"] >= -90 - rake_intval]
-                # dip-slip reverse
-                df_eq_dsr_temp = df_eq_used[df_eq_used["rake"] >= 90 - rake_intval]
-                if len(df_eq_dsr_temp) > 0:
-                    df_eq_dsr = df_eq_dsr_temp[df_eq_dsr_temp["rake"] <= 90 + rake_intval]
-            # epicentral distance
-            case "xks":
-                df_eq_close = df_eq_used[df_eq_used["dis"] < dist_min]
-                df_eq_far = df_eq_used[df_eq_used["dis"] > dist_max]
-                df_eq_xks_temp = df_eq_used[df_eq_used["dis"] >= dist_min]
-                if len(df_eq_xks_temp) > 0:
-                    df_eq_xks = df_eq_xks_temp[df_eq_xks_temp["dis"] <= dist_max]
+    df_eq_used = df_bins[i_bin]
+
+    # Remove beachballs fully covered by beachballs plotted later (on top) at
+    # the output resolution, used for both figures, see meca_cull.py
+    # As sorted descending by magnitude, few beachballs are culled within one
+    # table, more over the tables of the classes (drawn one after the other)
+    df_eq_layers, n_culled = meca_cull(
+        [df_groups[(i_bin, i_class)] for i_class in range(len(colors_class))],
+        projection,
+        scale=meca_scale,
+        dpi=dpi_png,
+    )
+    print(f"hd=[{depth_min},{depth_max}[ km: {n_culled}/{len(df_eq_used)} beachballs culled")
 
 # -----------------------------------------------------------------------------
     fig_single = gmt.Figure()
@@ -235,7 +257,7 @@ for depth_min, depth_max in zip([0, 10, 20, 30, 50, 100], [10, 20, 30, 50, 100,
                 frame=f"+t{year_min}-{year_max}   "
                 f"Mw=[{min_plot_mag},{max_plot_mag}]   "
                 f"hd=[{depth_min},{depth_max}[ km   "
-                f"{len(df_eq_used)}/{len(df_eq_temp02)} events"
+                f"{len(df_eq_used)}/{len(df_eq_sel)} events"
             )
 
         # Color land and water masses
@@ -287,34 +309,20 @@ for depth_min, depth_max in zip([0, 10, 20, 30, 50, 100], [10, 20, 30, 50, 100,
 
         # Plot epicenters as beachballs
         match status_color:
-            case "fault":
-                for df_eq_fault, color_fault in zip(
-                    [df_eq_used, df_eq_ssl, df_eq_ssr_01, df_eq_ssr_02, df_eq_dsn, df_eq_dsr],
-                    [color_meca, color_ssl, color_ssr, color_ssr, color_dsn, color_dsr],
-                ):
-                    if len(df_eq_fault) > 0:
-                        fig.meca(
-                            spec=df_eq_fault,
-                            scale="12c",
-                            compression_fill=color_fault,  # PyGMT v0.18.0
-                            outline="0.3p,gray10",
-                        )
-            case "xks":
-                for df_eq_dist, color_dist in zip(
-                    [df_eq_close, df_eq_far, df_eq_xks], [color_meca, color_meca, color_hl]
-                ):
-                    if len(df_eq_dist) > 0:
+            case "fault" | "xks":
+                for df_eq_class, color_class in zip(df_eq_layers, colors_class):
+                    if len(df_eq_class) > 0:
                         fig.meca(
-                            spec=df_eq_dist,
-                            scale="12c",
-                            compression_fill=color_dist,  # PyGMT v0.18.0
+                            spec=df_eq_class,
+                            scale=meca_scale,
+                            compression_fill=color_class,  # PyGMT v0.18.0
                             outline="0.3p,gray10",
                         )
             case _:
                 gmt.makecpt(cmap=cmap, series=[cmap_min, cmap_max])
-                if len(df_eq_used) > 0:
+                if len(df_eq_layers[0]) > 0:
                     fig.meca(
-                        spec=df_eq_used, scale="12c", cmap=True, outline="0.3p,gray10"
+                        spec=df_eq_layers[0], scale=meca_scale, cmap=True, outline="0.3p,gray10"
                     )
                 with gmt.config(FONT="15p"):
                     if fig == fig_single:
@@ -9,6 +9,7 @@
 # -----------------------------------------------------------------------------
 # History
 # - Created: 2025/09/10
+# - Updated: 2026/10/17 - Read the catalog from the binary columnar store
 # -----------------------------------------------------------------------------
 # Versions
 # - PyGMT v0.16.0 - v0.18.0 -> https://www.pygmt.org
@@ -21,9 +22,10 @@
 # #############################################################################
 
 
-import pandas as pd
 import pygmt as gmt
 
+from cmt_catalog import cmt_catalog_query
+
 # %%
 # -----------------------------------------------------------------------------
 # Adjust for your needs
@@ -43,17 +45,14 @@ path_out = "02_out_figs"
 # -----------------------------------------------------------------------------
 # Load data
 # -----------------------------------------------------------------------------
-df_eq_raw = pd.read_csv(f"{path_in}/catalog_harvardcmt_1976to2025_mw4to10.csv", sep=",")
-
-# Keep only relevant columns
-columns = [
-    "year", "month", "day", "hour", "minute", "second", "jday", "dstr",
-    "latitude", "longitude", "azi", "bazi", "dis", "depth",
-    "magnitude", "M0", "strike", "dip", "rake", "region",
-]
-df_eq_mod = df_eq_raw[columns]
-
-df_eq_mag = df_eq_mod[df_eq_mod["magnitude"] >= min_mag]
+# Read only the relevant columns from the binary store of the catalog (converted
+# once from the CSV file) and subset based on moment magnitude via the index,
+# see cmt_catalog.py
+df_eq_mag = cmt_catalog_query(
+    columns=["magnitude", "strike", "dip", "rake"],
+    min_magnitude=min_mag,
+    file_csv=f"{path_in}/catalog_harvardcmt_1976to2025_mw4to10.csv",
+)
 
 
 # %%
@@ -10,6 +10,7 @@
 # History
 # - Created: 2025/09/12
 # - Updated: 2025/09/15 - Create legend
+# - Updated: 2026/10/17 - Read the catalog from the binary columnar store
 # -----------------------------------------------------------------------------
 # Versions
 # - PyGMT v0.16.0 - v0.18.0 -> https://www.pygmt.org
@@ -23,9 +24,10 @@
 
 
 import numpy as np
-import pandas as pd
 import pygmt as gmt
 
+from cmt_catalog import cmt_catalog_count, cmt_catalog_query
+
 # %%
 # -----------------------------------------------------------------------------
 # Adjust for your needs
@@ -60,17 +62,17 @@ match symbol_shape:
 # -----------------------------------------------------------------------------
 # Load data
 # -----------------------------------------------------------------------------
-df_eq_raw = pd.read_csv(f"{path_in}/catalog_harvardcmt_1976to2025_mw4to10.csv", sep=",")
-
-# Keep only relevant columns
-columns = [
-    "year", "month", "day", "hour", "minute", "second", "jday", "dstr",
-    "latitude", "longitude", "azi", "bazi", "dis", "depth",
-    "magnitude", "M0", "strike", "dip", "rake", "region",
-]
-df_eq_mod = df_eq_raw[columns]
+# Binary store of the catalog, converted once from the CSV file, see
+# cmt_catalog.py
+file_csv = f"{path_in}/catalog_harvardcmt_1976to2025_mw4to10.csv"
+n_events = cmt_catalog_count(file_csv=file_csv)
 
-df_eq_depth = df_eq_mod[df_eq_mod["depth"] >= min_depth]
+# Read only the relevant columns
+df_eq_depth = cmt_catalog_query(
+    columns=["year", "day", "depth", "magnitude"],
+    min_depth=min_depth,
+    file_csv=file_csv,
+)
 
 
 # %%
@@ -100,7 +102,7 @@ for min_mag in np.arange(4, 10 + step_mag, step_mag):
     with gmt.config(FONT="14p", MAP_TITLE_OFFSET="8p"):
         fig.basemap(
             frame= f"+thd >= {min_depth} km   Mw >= {min_mag}   " + \
-                f"{len(df_eq_mag)}/{len(df_eq_depth)}/{len(df_eq_mod)} events+gblack"
+                f"{len(df_eq_mag)}/{len(df_eq_depth)}/{n_events} events+gblack"
         )
 
 # -----------------------------------------------------------------------------
@@ -0,0 +1,501 @@
+# #############################################################################
+# This functions
+# - Store the USGS FDSN earthquake catalog locally as Parquet files, one file
+#   per year, in one store per lower magnitude limit of the requests
+#   STORE/YEAR.parquet
+# - Remember which time windows are already fetched, also time windows
+#   without events, and fetch only the missing time windows (incremental
+#   refresh, e.g. to append the latest events)
+# - Serve queries by time window, magnitude range, and region from the local
+#   copy, reading only the files of the queried years
+# - Download missing time windows in chunks below the event limit of the
+#   webservice (20000 events per request): the time window is split by year
+#   and halved further depending on the number of events (count endpoint)
+# - Fetch the chunks concurrently with a bounded thread pool, retry failed
+#   chunks, and add each chunk to the store as soon as it is downloaded (only
+#   one chunk in memory); completed chunks are marked, i.e. a run with failed
+#   chunks is resumed by running it again
+# - Allow a local stand-in for the webservice, e.g. for tests, via the
+#   environment variable USGS_CATALOG_URL or the opener argument
+# - Is used by 005_global_seismicity/seismicity_01_usgsfdsn_webservice.py and
+#   004_earthquakes_eruptions/06_japan_earthquake_BFO.py and
+#   07_taiwan_earthquake_BFO.py
+# -----------------------------------------------------------------------------
+# History
+# - Created: 2026/10/17
+# -----------------------------------------------------------------------------
+# Versions
+# - pandas >= 2.0 with pyarrow -> https://pandas.pydata.org
+# -----------------------------------------------------------------------------
+# Contact
+# - Author: Yvonne Fröhlich
+# - ORCID: https://orcid.org/0000-0002-8566-0619
+# - GitHub: https://github.com/yvonnefroehlich/gmt-pygmt-plotting
+# #############################################################################
+
+
+import io
+import os
+import shutil
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+
+
+# Default folder of the local catalog, can be changed via the environment
+# variable
+USGS_CATALOG_DIR = os.environ.get(
+    "USGS_CATALOG_DIR",
+    os.path.join(
+        os.path.expanduser("~"), ".cache", "gmt-pygmt-plotting", "usgs_catalog"
+    ),
+)
+# Webservice, can be replaced by a local stand-in via the environment variable
+# see https://earthquake.usgs.gov/fdsnws/event/1/
+USGS_CATALOG_URL = os.environ.get(
+    "USGS_CATALOG_URL", "https://earthquake.usgs.gov/fdsnws/event/1/query.csv"
+)
+# Never use the network if the environment variable is set to 1
+USGS_CATALOG_OFFLINE = os.environ.get("USGS_CATALOG_OFFLINE", "0") == "1"
+
+# Maximum number of events per request, limit of the webservice is 20000
+USGS_CATALOG_MAX_EVENTS = 15000
+
+
+def _usgs_time(time):
+    # Time as pandas Timestamp (UTC), e.g. from "2000-01-01"
+    time = pd.Timestamp(time)
+    if time.tzinfo == None:
+        return time.tz_localize("UTC")
+    return time.tz_convert("UTC")
+
+
+def usgs_catalog_url(starttime, endtime, min_magnitude, max_magnitude=10, url=None):
+    # URL of a request to the webservice, ordered by time
+    if url == None:
+        url = USGS_CATALOG_URL
+    params = {
+        "starttime": _usgs_time(starttime).strftime("%Y-%m-%dT%H:%M:%S"),
+        "endtime": _usgs_time(endtime).strftime("%Y-%m-%dT%H:%M:%S"),
+        "minmagnitude": min_magnitude,
+        "maxmagnitude": max_magnitude,
+        "orderby": "time-asc",
+    }
+    return f"{url}?{urllib.parse.urlencode(params)}"
+
+
+def _usgs_read(url, opener=None):
+    # Text of the response to an URL
+    # - opener: Function returning the text (str or bytes) of an URL, e.g. a
+    #   stand-in for tests | Default urllib
+    if opener == None:
+        with urllib.request.urlopen(url) as response:
+            text = response.read()
+    else:
+        text = opener(url)
+    if isinstance(text, bytes):
+        text = text.decode("utf-8")
+    return text
+
+
+def _usgs_retry(function, n_retries=3):
+    # Call function, retry with increasing waiting time if the connection fails
+    for i_try in range(n_retries + 1):
+        try:
+            return function()
+        except OSError:
+            if i_try == n_retries:
+                raise
+            time.sleep(2**i_try)
+
+
+def usgs_catalog_request(url, opener=None):
+    # Events of one request as pandas DataFrame
+    # - opener: See _usgs_read | Default urllib
+    text = _usgs_read(url, opener=opener)
+    if text.strip() == "":
+        return pd.DataFrame()
+    return pd.read_csv(io.StringIO(text))
+
+
+def _usgs_store(cache_dir, min_magnitude):
+    return os.path.join(cache_dir, f"mw{float(min_magnitude):g}")
+
+
+def _usgs_fetched(path_store):
+    # Fetched time windows of a store, sorted and merged
+    file_marker = os.path.join(path_store, "fetched.txt")
+    if not os.path.isfile(file_marker):
+        return []
+    with open(file_marker) as file_in:
+        windows = sorted(
+            tuple(_usgs_time(value) for value in line.split())
+            for line in file_in
+            if line.strip() != ""
+        )
+    windows_merged = []
+    for start, end in windows:
+        if len(windows_merged) > 0 and start <= windows_merged[-1][1]:
+            windows_merged[-1][1] = max(windows_merged[-1][1], end)
+        else:
+            windows_merged.append([start, end])
+    return windows_merged
+
+
+def _usgs_missing(windows_fetched, starttime, endtime):
+    # Parts of the time window not covered by the fetched time windows
+    windows_missing = []
+    start = starttime
+    for fetched_start, fetched_end in windows_fetched:
+        if fetched_end <= start:
+            continue
+        if fetched_start >= endtime:
+            break
+        if fetched_start > start:
+            windows_missing.append((start, fetched_start))
+        start = max(start, fetched_end)
+    if start < endtime:
+        windows_missing.append((start, endtime))
+    return windows_missing
+
+
+def usgs_catalog_store(path_store, df_eq, starttime=None, endtime=None):
+    # Add events to a store and mark the time window as fetched
+    # - df_eq: Events as returned by the webservice
+    # - starttime, endtime: Fetched time window, also marked if without events
+    os.makedirs(path_store, exist_ok=True)
+    if len(df_eq) > 0:
+        years = pd.to_datetime(df_eq["time"], utc=True).dt.year
+        for year, df_year in df_eq.groupby(years):
+            file_year = os.path.join(path_store, f"{year}.parquet")
+            if os.path.isfile(file_year):
+                df_year = pd.concat([pd.read_parquet(file_year), df_year])
+            # Events of overlapping requests only once, latest version
+            df_year = df_year.drop_duplicates(subset="id", keep="last")
+            df_year = df_year.sort_values(by="time", ignore_index=True)
+            file_temp = f"{file_year}.{os.getpid()}.tmp"
+            df_year.to_parquet(file_temp, index=False)
+            os.replace(file_temp, file_year)
+
+    if starttime != None and endtime != None:
+        with open(os.path.join(path_store, "fetched.txt"), mode="a") as file_out:
+            file_out.write(
+                f"{_usgs_time(starttime).isoformat()} "
+                + f"{_usgs_time(endtime).isoformat()}\n"
+            )
+
+
+def usgs_catalog_count(
+    starttime, endtime, min_magnitude, url=None, opener=None, n_retries=3
+):
+    # Number of events in the time window via the count endpoint
+    # - n_retries: Retries with increasing waiting time, as for the downloads
+    #   | Default 3
+    if url == None:
+        url = USGS_CATALOG_URL
+    url_count = usgs_catalog_url(
+        starttime, endtime, min_magnitude, url=f"{url.rsplit('/', 1)[0]}/count"
+    )
+    text = _usgs_retry(lambda: _usgs_read(url_count, opener=opener), n_retries)
+    return int(text.strip())
+
+
+def usgs_catalog_chunks(
+    starttime,
+    endtime,
+    min_magnitude,
+    max_events=USGS_CATALOG_MAX_EVENTS,
+    url=None,
+    opener=None,
+    executor=None,
+    n_retries=3,
+):
+    # Split the time window into chunks with at most max_events events
+    # - First by year (as the files of the store), then halved as long as the
+    #   number of events exceeds max_events, at least one hour
+    # - n_retries: Retries per failed count request | Default 3
+    # Returns list of (starttime, endtime, number of events)
+    starttime = _usgs_time(starttime)
+    endtime = _usgs_time(endtime)
+    years = [
+        _usgs_time(f"{year}-01-01")
+        for year in range(starttime.year + 1, endtime.year + 1)
+    ]
+    bounds = [starttime] + [year for year in years if year < endtime] + [endtime]
+    chunks = list(zip(bounds[:-1], bounds[1:]))
+
+    def count(chunk):
+        return usgs_catalog_count(
+            *chunk, min_magnitude, url=url, opener=opener, n_retries=n_retries
+        )
+
+    chunks_sized = []
+    while len(chunks) > 0:
+        if executor == None:
+            counts = list(map(count, chunks))
+        else:
+            counts = list(executor.map(count, chunks))
+        chunks_split = []
+        for (chunk_start, chunk_end), n_events in zip(chunks, counts):
+            if n_events > max_events and chunk_end - chunk_start > pd.Timedelta(
+                hours=1
+            ):
+                chunk_middle = chunk_start + (chunk_end - chunk_start) / 2
+                chunks_split += [(chunk_start, chunk_middle), (chunk_middle, chunk_end)]
+            else:
+                chunks_sized.append((chunk_start, chunk_end, n_events))
+        chunks = chunks_split
+    return sorted(chunks_sized)
+
+
+def _usgs_download(url, file_chunk, opener=None, n_retries=3):
+    # Stream the response of one request to a file, retry with increasing
+    # waiting time
+    if os.path.isfile(file_chunk):  # Downloaded in a previous run
+        return file_chunk
+    file_temp = f"{file_chunk}.tmp"
+
+    def download():
+        if opener == None:
+            with urllib.request.urlopen(url) as response:
+                with open(file_temp, mode="wb") as file_out:
+                    shutil.copyfileobj(response, file_out)
+        else:
+            with open(file_temp, mode="w", encoding="utf-8", newline="") as file_out:
+                file_out.write(_usgs_read(url, opener=opener))
+        os.replace(file_temp, file_chunk)
+        return file_chunk
+
+    return _usgs_retry(download, n_retries)
+
+
+def usgs_catalog_fetch(
+    starttime,
+    endtime,
+    min_magnitude,
+    path_store,
+    url=None,
+    opener=None,
+    max_events=USGS_CATALOG_MAX_EVENTS,
+    n_threads=4,
+    n_retries=3,
+):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - starttime, endtime: Time window, endtime excluded
+    # - min_magnitude: Lower magnitude limit of the store
+    # - path_store: Folder of the store
+    # Optional
+    # - url: Webservice | Default USGS_CATALOG_URL
+    # - opener: Function returning the CSV text of an URL, see
+    #   usgs_catalog_request
+    # - max_events: Maximum number of events per request | Default
+    #   USGS_CATALOG_MAX_EVENTS
+    # - n_threads: Number of concurrent requests | Default 4
+    # - n_retries: Retries per failed request | Default 3
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - n_events: Number of fetched events
+    # Raises RuntimeError if chunks failed, the other chunks are stored and
+    # marked, run again to resume
+    path_chunks = os.path.join(path_store, "chunks")
+    os.makedirs(path_chunks, exist_ok=True)
+
+    n_events = 0
+    chunks_failed = []
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        chunks = usgs_catalog_chunks(
+            starttime,
+            endtime,
+            min_magnitude,
+            max_events=max_events,
+            url=url,
+            opener=opener,
+            executor=executor,
+            n_retries=n_retries,
+        )
+
+        futures = {}
+        for chunk_start, chunk_end, n_events_chunk in chunks:
+            if n_events_chunk == 0:
+                usgs_catalog_store(path_store, pd.DataFrame(), chunk_start, chunk_end)
+                continue
+            file_chunk = os.path.join(
+                path_chunks,
+                f"{chunk_start.strftime('%Y%m%dT%H%M%S')}_"
+                + f"{chunk_end.strftime('%Y%m%dT%H%M%S')}.csv",
+            )
+            future = executor.submit(
+                _usgs_download,
+                usgs_catalog_url(chunk_start, chunk_end, min_magnitude, url=url),
+                file_chunk,
+                opener=opener,
+                n_retries=n_retries,
+            )
+            futures[future] = (chunk_start, chunk_end)
+
+        # Add the chunks to the store in order of completion, one at a time
+        for future in as_completed(futures):
+            chunk_start, chunk_end = futures[future]
+            try:
+                file_chunk = future.result()
+            except OSError as error:
+                chunks_failed.append((chunk_start, chunk_end, error))
+                continue
+            if os.path.getsize(file_chunk) > 0:
+                df_chunk = pd.read_csv(file_chunk)
+            else:
+                df_chunk = pd.DataFrame()
+            usgs_catalog_store(path_store, df_chunk, chunk_start, chunk_end)
+            n_events += len(df_chunk)
+            os.remove(file_chunk)
+
+    if len(chunks_failed) > 0:
+        raise RuntimeError(
+            f"{len(chunks_failed)} of {len(futures)} chunks failed, run again to "
+            + "resume: "
+            + "; ".join(f"{start} - {end}: {error}" for start, end, error in chunks_failed)
+        )
+    return n_events
+
+
+def usgs_catalog_query(
+    path_store,
+    starttime,
+    endtime,
+    min_magnitude=None,
+    max_magnitude=None,
+    region=None,
+):
+    # Events of a store within the time window, magnitude range, and region
+    # - region: [lon_min, lon_max, lat_min, lat_max] | degrees
+    starttime = _usgs_time(starttime)
+    endtime = _usgs_time(endtime)
+    files_year = [
+        os.path.join(path_store, f"{year}.parquet")
+        for year in range(starttime.year, endtime.year + 1)
+    ]
+    files_year = [file_year for file_year in files_year if os.path.isfile(file_year)]
+    if len(files_year) == 0:
+        return pd.DataFrame()
+
+    filters = []
+    if min_magnitude != None:
+        filters.append(("mag", ">=", float(min_magnitude)))
+    if max_magnitude != None:
+        filters.append(("mag", "<=", float(max_magnitude)))
+    if region != None:
+        filters += [
+            ("longitude", ">=", region[0]),
+            ("longitude", "<=", region[1]),
+            ("latitude", ">=", region[2]),
+            ("latitude", "<=", region[3]),
+        ]
+    df_eq = pd.concat(
+        [
+            pd.read_parquet(file_year, filters=filters if filters else None)
+            for file_year in files_year
+        ],
+        ignore_index=True,
+    )
+    time_eq = pd.to_datetime(df_eq["time"], utc=True)
+    return df_eq[(time_eq >= starttime) & (time_eq < endtime)].reset_index(drop=True)
+
+
+def usgs_catalog_get(
+    starttime,
+    endtime,
+    min_magnitude=6,
+    max_magnitude=10,
+    region=None,
+    cache_dir=None,
+    offline=None,
+    url=None,
+    opener=None,
+    fetch=None,
+):
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    # Required
+    # - starttime, endtime: Time window, endtime excluded | e.g. "2000-01-01"
+    # Optional
+    # - min_magnitude, max_magnitude: Magnitude range | Default 6 and 10
+    #   The local store holds all events above min_magnitude, max_magnitude
+    #   and region are applied to the local copy
+    # - region: [lon_min, lon_max, lat_min, lat_max] | degrees | Default global
+    # - cache_dir: Folder of the local catalog | Default USGS_CATALOG_DIR
+    # - offline: Use only the local catalog, raise FileNotFoundError for missing
+    #   time windows | Default USGS_CATALOG_OFFLINE
+    # - url: Webservice | Default USGS_CATALOG_URL
+    # - opener: Function returning the CSV text of an URL, see
+    #   usgs_catalog_request
+    # - fetch: Function fetching the events of a missing time window, called
+    #   as fetch(starttime, endtime, min_magnitude, path_store) and adding the
+    #   events to the store via usgs_catalog_store | Default usgs_catalog_fetch
+    #   (chunked, concurrent)
+    # -------------------------------------------------------------------------
+    # Returns
+    # -------------------------------------------------------------------------
+    # - df_eq: Events as pandas DataFrame with the columns of the webservice
+    if cache_dir == None:
+        cache_dir = USGS_CATALOG_DIR
+    if offline == None:
+        offline = USGS_CATALOG_OFFLINE
+    starttime = _usgs_time(starttime)
+    endtime = _usgs_time(endtime)
+
+    # Reuse a store with a lower magnitude limit already covering the time window
+    path_store = _usgs_store(cache_dir, min_magnitude)
+    if os.path.isdir(cache_dir):
+        for store in sorted(os.listdir(cache_dir)):
+            try:
+                store_magnitude = float(store[2:])
+            except ValueError:
+                continue
+            if store_magnitude <= float(min_magnitude) and (
+                _usgs_missing(
+                    _usgs_fetched(os.path.join(cache_dir, store)), starttime, endtime
+                )
+                == []
+            ):
+                path_store = os.path.join(cache_dir, store)
+                break
+
+    # -------------------------------------------------------------------------
+    # Fetch the missing time windows
+    for window_start, window_end in _usgs_missing(
+        _usgs_fetched(path_store), starttime, endtime
+    ):
+        if offline == True:
+            raise FileNotFoundError(
+                f"Not cached: Mw >= {min_magnitude} {window_start} - {window_end}"
+            )
+        if fetch == None:
+            usgs_catalog_fetch(
+                window_start,
+                window_end,
+                min_magnitude,
+                path_store,
+                url=url,
+                opener=opener,
+            )
+        else:
+            fetch(window_start, window_end, min_magnitude, path_store)
+
+    # -------------------------------------------------------------------------
+    # Query the local copy
+    return usgs_catalog_query(
+        path_store,
+        starttime,
+        endtime,
+        min_magnitude=min_magnitude,
+        max_magnitude=max_magnitude,
+        region=region,
+    )
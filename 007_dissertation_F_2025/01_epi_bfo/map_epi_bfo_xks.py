@@ -18,6 +18,7 @@
 # History
 # - Created: 2025/05
 # - Updated: 2025/08/06 - Adjust code for GitHub
+# - Updated: 2026/10/17 - Enhancement: Plot all rays as one great circle dataset
 # -----------------------------------------------------------------------------
 # Versions
 # - PyGMT v0.16.0 - v0.18.0 -> https://www.pygmt.org
@@ -30,8 +31,17 @@
 # #############################################################################
 
 
-import pygmt
+import os
+import sys
+
 import pandas as pd
+import pygmt
+
+# Use the functions of 003_taup
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "003_taup")
+)
+from taup_great_circle import taup_great_circle_plot
 
 
 # %%
@@ -44,6 +54,11 @@ import pandas as pd
 proj = "epi"  ## epi" | "rob" | "ortho"
 fig_size = 11  # in centimeters
 
+# Color-coding of the rays
+ray_color = "none"  ## "none" | "baz" | "quality"
+# Transparency of the rays depending on the number of rays per backazimuth
+ray_density = False  ## True | False
+
 # Recording station
 sta_name = "BFO"
 sta_lat = 48.331
@@ -127,18 +142,32 @@ if proj == "epi":
 # -----------------------------------------------------------------------------
 # Plot rays
 pen_ray = "0.15p,black@80"
-for i_eq in range(len(df_split)):
-    fig.plot(
-        x=[df_split["lon_in_degE"][i_eq], lon_center],
-        y=[df_split["lat_in_degN"][i_eq], lat_center],
-        pen=pen_ray,
-    )
-for i_eq in range(len(df_null)):
-    fig.plot(
-        x=[df_null["lon_in_degE"][i_eq], lon_center],
-        y=[df_null["lat_in_degN"][i_eq], lat_center],
-        pen=pen_ray,
-    )
+df_ray = pd.concat([df_split, df_null], ignore_index=True)
+args_ray = {}
+match ray_color:
+    case "baz":  # backazimuth
+        pygmt.makecpt(cmap="romaO", series=[0, 360], cyclic=True)
+        args_ray["zvalues"] = df_ray["baz_in_deg"]
+        args_ray["transparency"] = 80
+    case "quality":
+        color_quality = {"good": "black", "fair": "gray50"}
+        args_ray["colors"] = [
+            f"{color_quality[quality]}@80" for quality in df_ray["quality"]
+        ]
+if ray_density == True:
+    pen_ray = "0.15p,black"
+    args_ray["density"] = True
+    if "colors" in args_ray:
+        args_ray["colors"] = [color.split("@")[0] for color in args_ray["colors"]]
+taup_great_circle_plot(
+    fig,
+    lon_1=df_ray["lon_in_degE"],
+    lat_1=df_ray["lat_in_degN"],
+    lon_2=lon_center,
+    lat_2=lat_center,
+    pen=pen_ray,
+    **args_ray,
+)
 
 # -----------------------------------------------------------------------------
 # Plot epicenters
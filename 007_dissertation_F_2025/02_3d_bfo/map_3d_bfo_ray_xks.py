@@ -24,6 +24,9 @@
 # History
 # - Created: 2025/02/09
 # - Updated: 2025/08/06 - Adjust code for GitHub
+# - Updated: 2026/10/17 - Enhancement: Load rays once, clip all rays at once, and plot
+#                         one multi-segment line per ray group
+# - Updated: 2026/10/17 - Enhancement: Reuse pre-rendered images of the static planes
 # -----------------------------------------------------------------------------
 # Versions
 # - PyGMT v0.16.0 - v0.18.0 -> https://www.pygmt.org
@@ -36,9 +39,21 @@
 # #############################################################################
 
 
-import pandas as pd
+import glob
+import hashlib
+import os
+import sys
+
 import numpy as np
 import pygmt as gmt
+from pygmt.helpers import GMTTempFile
+
+# Use the functions of 003_taup
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "003_taup")
+)
+from taup_cache import TAUP_CACHE_DIR
+from taup_rays import taup_rays_from_text, taup_rays_load, taup_rays_save
 
 
 # %%
@@ -54,6 +69,11 @@ pierce_groups = ray_groups
 
 status_cb = True
 status_lgd = True
+# Show the figure after each layer, slow
+status_show_layers = False
+# Reuse pre-rendered images of the static planes (grids, shorelines, LLSVPs)
+# Check the alignment against status_cache = False before using it
+status_cache = False
 
 # "gufm1", "gypsum", "410 km", "elevation"
 planes = ["gypsum", "410 km", "elevation"]
@@ -64,6 +84,9 @@ cord_range = 40  # degrees
 # Path
 path_in = "01_in_data"
 path_out = "02_out_figs"
+path_cache = "03_layer_cache"
+dpi_cache = 600
+margin_cache = 0.5  # centimeters
 
 # Data
 file_gypsum = "tomo_gypsum_1d_grid_dvs_22_2650-2900km.grd"
@@ -132,6 +155,101 @@ lon_BFO = 8.330
 lat_BFO = 48.331
 
 
+# %%
+# -----------------------------------------------------------------------------
+# Load ray paths
+# -----------------------------------------------------------------------------
+# All rays of a group are read once and stored as one set of ragged arrays
+# (see taup_rays.py in 003_taup) in the cache folder of TauP (see
+# taup_cache.py in 003_taup); the number of rays is given by the files
+rays_all = {}
+for ray_group in ray_groups:
+    ray_path = f"{path_in}/01_paths/{ray_group}"
+    ray_files = glob.glob(f"{ray_path}/tt_PATH_{ray_group}_goodfair_path_*.txt")
+    # Sort by the number of the ray, i.e. path_2 before path_10
+    ray_files = sorted(
+        ray_files, key=lambda ray_file: int(ray_file.split("_")[-1].split(".")[0])
+    )
+    ray_store = os.path.join(TAUP_CACHE_DIR, "rays_3d_bfo", ray_group)
+    ray_file_store = f"{ray_store}/offset.npy"
+    if not os.path.isfile(ray_file_store) or os.path.getmtime(
+        ray_file_store
+    ) < max(os.path.getmtime(ray_file) for ray_file in ray_files):
+        taup_rays_save(ray_store, taup_rays_from_text(ray_files))
+    rays_all[ray_group] = taup_rays_load(ray_store)
+
+
+# %%
+# -----------------------------------------------------------------------------
+# Cache of the static planes
+# -----------------------------------------------------------------------------
+def layer_size(region, projection):
+    # Width and height of the bounding box of the map | centimeters
+    with GMTTempFile(suffix=".txt") as tmp_file:
+        with gmt.clib.Session() as lib:
+            lib.call_module(
+                "mapproject",
+                f"-R{'/'.join(str(value) for value in region)} -J{projection} -W "
+                + f"--PROJ_LENGTH_UNIT=cm ->{tmp_file.name}",
+            )
+        width, height = np.loadtxt(tmp_file.name)
+    return float(width), float(height)
+
+
+def plot_layer(fig, layer, plot_static, region, projection, inputs, args_key,
+               transparency=None):
+    # Plot a static plane as image with the perspective of fig
+    # - The plane is rendered once without perspective into a PNG file which is
+    #   reused as long as region, projection, input files, and args_key (e.g.
+    #   colormap, pens) are unchanged; the viewpoint can be changed freely
+    # - plot_static: Function plotting the plane into a given figure
+    # - The PNG file is cropped to a nearly transparent frame with a fixed
+    #   margin around the bounding box of the map (size via mapproject), i.e.
+    #   the image is placed independent of the plotted content
+    # - transparency: Transparency of the image | Only used when caching
+    if status_cache == False:
+        plot_static(fig, perspective=True)
+        return
+
+    width, height = layer_size(region, projection)
+    key_items = [layer, region, projection, dpi_cache, margin_cache, args_key]
+    for input_file in inputs:
+        # Remote files like @earth_relief are identified by their name
+        if os.path.isfile(input_file):
+            key_items.append([input_file, os.path.getmtime(input_file)])
+        else:
+            key_items.append(input_file)
+    key_hash = hashlib.sha1(repr(key_items).encode("utf-8")).hexdigest()[:16]
+    file_layer = f"{path_cache}/{layer.replace(' ', '')}_{key_hash}.png"
+
+    if not os.path.isfile(file_layer):
+        print(f"{layer}: render static plane")
+        os.makedirs(path_cache, exist_ok=True)
+        fig_layer = gmt.Figure()
+        fig_layer.basemap(region=region, projection=projection, frame="+n")
+        plot_static(fig_layer, perspective=False)
+        # Frame defining the crop, plotted last as it changes the projection
+        width_frame = width + 2 * margin_cache
+        height_frame = height + 2 * margin_cache
+        fig_layer.shift_origin(xshift=f"{-margin_cache}c", yshift=f"{-margin_cache}c")
+        fig_layer.plot(
+            x=[0, width_frame, width_frame, 0, 0],
+            y=[0, 0, height_frame, height_frame, 0],
+            region=[0, width_frame, 0, height_frame],
+            projection=f"X{width_frame}c/{height_frame}c",
+            pen="0.1p,white@99",
+            no_clip=True,
+        )
+        fig_layer.savefig(fname=file_layer, dpi=dpi_cache, transparent=True)
+
+    # The map origin is the lower left corner of the bounding box of the map
+    fig.image(
+        imagefile=file_layer,
+        position=f"x{-margin_cache}c/{-margin_cache}c+w{width + 2 * margin_cache}c",
+        transparency=transparency,
+        perspective=True,
+    )
+
 
 # %%
 # -----------------------------------------------------------------------------
@@ -175,33 +293,55 @@ for plane in planes:
     match plane:
         case "gufm1":  # CMB
             grd_gufm1_name = f"{path_in}/{file_gufm1}"
-            gmt.makecpt(cmap="vik", series=[-850000, 850000], reverse=True)
-            fig.grdimage(grid=grd_gufm1_name, cmap=True, perspective=True)
-            # When plotting the colorbar here the shorelines are plotted wrongly
-            # probably because due to the effect of the position parameter on the
-            # anchor point in combination with the perspective not applied to the
-            # colorbar
-            fig.coast(shorelines=f"1/0.01p,{color_sl}", perspective=True)
-            fig.show()
+            args_cpt = {"cmap": "vik", "series": [-850000, 850000], "reverse": True}
+            gmt.makecpt(**args_cpt)
+
+            def plot_static(fig_plane, perspective):
+                gmt.makecpt(**args_cpt)
+                fig_plane.grdimage(grid=grd_gufm1_name, cmap=True, perspective=perspective)
+                # When plotting the colorbar here the shorelines are plotted wrongly
+                # probably because due to the effect of the position parameter on the
+                # anchor point in combination with the perspective not applied to the
+                # colorbar
+                fig_plane.coast(shorelines=f"1/0.01p,{color_sl}", perspective=perspective)
+
+            plot_layer(
+                fig, plane, plot_static, region, projection,
+                inputs=[grd_gufm1_name], args_key=[args_cpt, color_sl],
+            )
+            if status_show_layers == True: fig.show()
         case "gypsum":  # lower most mantle
             grd_gypsum_name = f"{path_in}/{file_gypsum}"
-            gmt.makecpt(cmap="roma", series=[-2, 2])
-            fig.grdimage(grid=grd_gypsum_name, cmap=True, perspective=True)
-            # When plotting the colorbar here to code crashes
-            # probably because due the effect of the position parameter on the
-            # anchor point in combination changing to 3-D
-            fig.coast(shorelines=f"1/0.01p,{color_sl}", perspective=True)
+            files_llvp = [
+                f"{path_in}/04_llvp/3model_2016_{i_model}.txt" for i_model in range(2, 9, 1)
+            ]
+            args_cpt = {"cmap": "roma", "series": [-2, 2]}
+            gmt.makecpt(**args_cpt)
+
+            def plot_static(fig_plane, perspective):
+                gmt.makecpt(**args_cpt)
+                fig_plane.grdimage(grid=grd_gypsum_name, cmap=True, perspective=perspective)
+                # When plotting the colorbar here to code crashes
+                # probably because due the effect of the position parameter on the
+                # anchor point in combination changing to 3-D
+                fig_plane.coast(shorelines=f"1/0.01p,{color_sl}", perspective=perspective)
 # .............................................................................
-            # Plot LLSVPs by Wolf et al. 2023
-            for i_model in range(2, 9, 1):
-                fig.plot(
-                    data=f"{path_in}/04_llvp/3model_2016_{i_model}.txt",
-                    pen=f"0.2p,{color_llpv}",
-                    fill=f"{pattern_llpv}{color_llpv}",
-                    close=True,
-                    perspective=True,
-                )
-            fig.show()
+                # Plot LLSVPs by Wolf et al. 2023
+                for file_llvp in files_llvp:
+                    fig_plane.plot(
+                        data=file_llvp,
+                        pen=f"0.2p,{color_llpv}",
+                        fill=f"{pattern_llpv}{color_llpv}",
+                        close=True,
+                        perspective=perspective,
+                    )
+
+            plot_layer(
+                fig, plane, plot_static, region, projection,
+                inputs=[grd_gypsum_name] + files_llvp,
+                args_key=[args_cpt, color_sl, color_llpv, pattern_llpv],
+            )
+            if status_show_layers == True: fig.show()
 # .............................................................................
             # Plot piercing points in the lowermost mantle for BFO
             path_swsm = f"{path_in}/02_pp2700km/BFO_pp2700km_"
@@ -249,7 +389,7 @@ for plane in planes:
                     pen=f"0.5p,{color_SKKS}",
                     perspective=True,
                 )
-            fig.show()
+            if status_show_layers == True: fig.show()
         case "410 km":
             fig.coast(
                 shorelines=f"1/0.01p,{color_sl}",
@@ -261,7 +401,7 @@ for plane in planes:
             fig.plot(
                 data=f"{path_in}/{file_pb}", pen=f"0.01p,{color_pb}", perspective=True
             )
-            fig.show()
+            if status_show_layers == True: fig.show()
 # .............................................................................
             # Plot piercing points at 410 km for BFO
             for pierce_group in pierce_groups:
@@ -276,14 +416,24 @@ for plane in planes:
                     fill=color_pp410,
                     perspective=True,
                 )
-            fig.show()
+            if status_show_layers == True: fig.show()
         case "elevation":
             gmt.makecpt(cmap="oleron", series=[-7100, 4500], transparency=alpha_ele)
-            fig.grdimage(
-                grid="@earth_relief",
-                cmap=True,
+
+            def plot_static(fig_plane, perspective):
+                # Transparency is applied to the image of the plane
+                gmt.makecpt(cmap="oleron", series=[-7100, 4500])
+                fig_plane.grdimage(
+                    grid="@earth_relief",
+                    cmap=True,
+                    transparency=None if status_cache == True else alpha_ele,
+                    perspective=perspective,
+                )
+
+            plot_layer(
+                fig, plane, plot_static, region, projection,
+                inputs=["@earth_relief"], args_key=["oleron", [-7100, 4500]],
                 transparency=alpha_ele,
-                perspective=True,
             )
             fig.coast(
                 shorelines=f"1/0.01p,{color_sl}",
@@ -309,7 +459,7 @@ for plane in planes:
                 offset="0c/-3.6c",
                 **text_target,
             )
-            fig.show()
+            if status_show_layers == True: fig.show()
 # -----------------------------------------------------------------------------
     # 3-D plot
     # Cut the rays into two parts:
@@ -363,32 +513,49 @@ for plane in planes:
                 print(f"{plane} ray {ray_group}")
                 match ray_group:
                     case "KN":
-                        N_ray = 172
                         color_ray = color_ray_KN
                     case "KNN":
-                        N_ray = 39
                         color_ray = color_ray_KNN
                     case "KKN":
-                        N_ray = 54
                         color_ray = color_ray_KKN
                     case "KKNN":
-                        N_ray = 12
                         color_ray = color_ray_KKNN
-                for i_ray in range(step, N_ray + step, step):
-                    ray_path = f"{path_in}/01_paths/{ray_group}"
-                    ray_file = f"tt_PATH_{ray_group}_goodfair_path_{i_ray}.txt"
-                    df_ray_temp = pd.read_csv(
-                        f"{ray_path}/{ray_file}", sep=",", names=["lon", "lat", "depth"],
-                    )
-                    df_ray_temp0 = df_ray_temp.loc[df_ray_temp["depth"] < max_depth]
-                    df_ray_temp1 = df_ray_temp0.loc[df_ray_temp0["depth"] > min_depth]
-                    df_ray_temp2 = df_ray_temp1.loc[df_ray_temp1["lon"] > lon_BFO - cord_range]
-                    df_ray_temp3 = df_ray_temp2.loc[df_ray_temp2["lon"] < lon_BFO + cord_range]
-                    df_ray_temp4 = df_ray_temp3.loc[df_ray_temp3["lat"] > lat_BFO - cord_range]
-                    df_ray_temp5 = df_ray_temp4.loc[df_ray_temp4["lat"] < lat_BFO + cord_range]
+                rays = rays_all[ray_group]
+                n_ray = len(rays["offset"]) - 1
+                n_sample = np.diff(rays["offset"])
+                # Depth window and box around BFO for all samples of all rays
+                ray_mask = (
+                    (rays["depth"] < max_depth)
+                    & (rays["depth"] > min_depth)
+                    & (rays["lon"] > lon_BFO - cord_range)
+                    & (rays["lon"] < lon_BFO + cord_range)
+                    & (rays["lat"] > lat_BFO - cord_range)
+                    & (rays["lat"] < lat_BFO + cord_range)
+                )
+                # Use every step-th ray
+                ray_mask &= np.repeat((np.arange(n_ray) + 1) % step == 0, n_sample)
+                # Start a new segment at the first sample of a ray and after
+                # removed samples
+                ray_start = np.zeros(len(ray_mask), dtype=bool)
+                ray_start[rays["offset"][:-1][n_sample > 0]] = True
+                seg_start = ray_mask & (
+                    ray_start | ~np.concatenate([[False], ray_mask[:-1]])
+                )
+                ray_xyz = np.column_stack(
+                    [rays["lon"], rays["lat"], rays["depth"]]
+                )[ray_mask]
+                seg_split = np.flatnonzero(seg_start[ray_mask])[1:]
+                # One multi-segment line for all rays of a group
+                with GMTTempFile(suffix=".txt") as tmp_file:
+                    with open(tmp_file.name, mode="w") as file_segments:
+                        for seg_xyz in np.split(ray_xyz, seg_split):
+                            if len(seg_xyz) == 0:
+                                continue
+                            file_segments.write(">\n")
+                            np.savetxt(file_segments, seg_xyz, fmt="%.6f")
                     fig.plot3d(
                         region=region3d,
-                        data=df_ray_temp5,
+                        data=tmp_file.name,
                         pen=f"0.3p,{color_ray}",
                         no_clip=True,
                         perspective=True,
@@ -396,7 +563,7 @@ for plane in planes:
         match plane:
             case "410 km": fig.shift_origin(yshift=f"{y_gypsum}c")
             case "elevation": fig.shift_origin(yshift=f"{y_gypsum + y_uppmantle}c")
-        fig.show()
+        if status_show_layers == True: fig.show()
 
 # -----------------------------------------------------------------------------
     # Add colorbars for grids
@@ -24,6 +24,7 @@
 # History
 # - Created: 2025/09/21
 # - Updated: 2026/01/22 - Use PyGMT v0.18.0 with GMT 6.6.0
+# - Updated: 2026/10/17 - Cache cropped elevation grid, choose resolution by DPI
 # -----------------------------------------------------------------------------
 # Versions
 # - PyGMT v0.18.0 -> https://www.pygmt.org
@@ -37,6 +38,8 @@
 
 
 import datetime
+import os
+import sys
 
 import numpy as np
 import pandas as pd
@@ -44,6 +47,14 @@ import pygmt as gmt
 from pygmt.params import Position
 from dateutil.rrule import DAILY, rrule
 
+# Use the shared elevation grid cache of 004_earthquakes_eruptions
+sys.path.append(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "004_earthquakes_eruptions"
+    )
+)
+from relief_cache import relief_grid
+
 # %%
 # -----------------------------------------------------------------------------
 # General stuff
@@ -110,9 +121,10 @@ df_eq = df_eq_raw[df_eq_raw["date_time"] >= start_date_data]
 # -----------------------------------------------------------------------------
 # Create plots for elevation
 # -----------------------------------------------------------------------------
-# Download elevation grid
-grd_ele = gmt.datasets.load_earth_relief(region=region_ele, resolution="30s") # 15s
-grd_surf = gmt.datasets.load_earth_relief(region=region_surf, resolution="30s") # 03s
+# Download elevation grid, cropped only once and cached, see relief_cache.py
+# Finest resolution, the coarsest sufficient one for the map width and DPI is used
+grd_ele = relief_grid(region_ele, "30s", width="12c", dpi=300) # 15s
+grd_surf = relief_grid(region_surf, "30s", width="12c", dpi=300) # 03s
 
 # -----------------------------------------------------------------------------
 # 2-D map